@@ -1008,6 +1008,7 @@ When using multiple reasoning models (any number, any language), their outputs n
 - **Flexible input**: Accepts `list[str]` of any length
 - **Simple output**: Returns one consolidated `str`
 - **Configurable prompts**: Customizable consolidation prompts
+- **Result caching**: Optional cache skips the agent for output sets it has already consolidated
 - **100% async-friendly**: Fully asynchronous implementation
 
 ## Usage
@@ -1073,6 +1074,8 @@ config = load_compactor_config()
 compactor = ThinkingCompactor(agent=agent, config=config)
 ```
 
+The loaded config is cached, so later calls return the same frozen `CompactorConfig` without re-reading the file. Call `load_compactor_config.cache_clear()` after editing, creating, or moving `config.toml` at runtime.
+
 ## Example Input/Output
 
 **Input** (list of model outputs):
@@ -1106,11 +1109,12 @@ The main class for consolidating multiple model outputs.
 #### Constructor
 
 ```python
-ThinkingCompactor(agent: MidoriAiAgentProtocol, config: Optional[CompactorConfig] = None)
+ThinkingCompactor(agent: MidoriAiAgentProtocol, config: Optional[CompactorConfig] = None, cache: Optional[CompactorCache] = None)
 ```
 
 - `agent`: An instance of `MidoriAiAgentProtocol` to use for consolidation
 - `config`: Optional configuration object for customizing consolidation behavior
+- `cache`: Optional async cache for reusing consolidations of identical output sets
 
 #### Methods
 
@@ -1121,17 +1125,35 @@ Consolidate multiple model outputs into a single message.
 - `outputs`: List of strings from reasoning models
 - Returns: A single consolidated string
 
+Outputs that only differ in case or whitespace are treated as duplicates and sent to the agent once. When every output is a duplicate of the first, that output is returned without calling the agent.
+
+When a cache is configured, the consolidated result is stored under a key built from the distinct outputs (in any order) and the custom prompt. Compacting the same set of outputs again returns the cached result without calling the agent.
+
 ### CompactorConfig
 
 Configuration dataclass for the compactor.
 
 ```python
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompactorConfig:
     custom_prompt: Optional[str] = None
+    cache_ttl_seconds: Optional[int] = None
+```
+
+- `custom_prompt`: Optional custom prompt template. Use `{outputs}` placeholder for the formatted outputs. Templates without `{outputs}`, or with any other placeholder, raise `ValueError` when the prompt is built; escape literal braces as `{{` and `}}`.
+- `cache_ttl_seconds`: Optional lifetime of cached consolidations. `None` keeps them until the cache evicts them.
+
+### CompactorCache
+
+Abstract async cache used to store consolidated results.
+
+```python
+class CompactorCache(ABC):
+    async def get(self, key: str) -> Optional[str]: ...
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None: ...
 ```
 
-- `custom_prompt`: Optional custom prompt template. Use `{outputs}` placeholder for the formatted outputs.
+Subclass it to back the compactor with any store. `midori-ai-agents-demo` wraps its pipeline cache in a `CompactorCacheAdapter` subclass.
 
 ### load_compactor_config()
 
@@ -1168,7 +1190,7 @@ The Context Bridge package solves the problem of reasoning models "rehashing" th
 Context Bridge now depends on `midori-ai-vector-manager` for all vector storage operations:
 - **Storage**: Delegates to `ChromaVectorStore` from vector-manager
 - **Decay/Corruption**: Retained in context-bridge as domain-specific logic
-- **ReasoningEntry**: Wraps `VectorEntry` objects with reasoning-specific fields
+- **ReasoningEntry**: Slotted dataclass wrapping `VectorEntry` objects with reasoning-specific fields
 
 ## Installation
 
@@ -1353,7 +1375,7 @@ ContextBridge(
 - `store_reasoning(session_id, text, model_type, metadata=None)` - Store reasoning text
 - `get_prior_reasoning(session_id, model_type, include_corrupted=True)` - Get prior reasoning with decay
 - `cleanup_expired()` - Remove all expired entries
-- `get_session_stats(session_id)` - Get session statistics
+- `get_session_stats(session_id)` - Get session statistics (counts cover at most 100 entries per model type)
 - `clear_session(session_id)` - Clear all entries for a session
 - `count()` - Get total entry count
 
@@ -1365,7 +1387,7 @@ Enum for model types:
 
 ### BridgeConfig
 
-Configuration dataclass:
+Configuration dataclass (slotted, no per-instance `__dict__`):
 - `max_tokens_per_summary: int` - Max tokens for compressed output
 - `chroma_collection_name: str` - ChromaDB collection name
 - `preprocessing_decay: DecayConfig` - Decay config for preprocessing
@@ -1373,17 +1395,20 @@ Configuration dataclass:
 
 ### DecayConfig
 
-Decay configuration dataclass:
+Decay configuration dataclass (frozen and slotted, no per-instance `__dict__`; use `dataclasses.replace` to change a field):
 - `decay_minutes: int` - Minutes before corruption begins
 - `removal_multiplier: float` - Multiplier for removal threshold (default 3.0)
 - `corruption_intensity: float` - Max corruption rate (0.0 to 1.0)
+- `removal_minutes: float` - Removal threshold, computed once at construction (`decay_minutes * removal_multiplier`)
+- `removal_seconds: float` - Removal threshold in seconds, computed once at construction
 
 ### MemoryCorruptor
 
 Low-level corruption logic:
 - `calculate_severity(age_minutes)` - Get corruption severity (0.0 to 1.0)
-- `corrupt_text(text, age_minutes)` - Apply corruption to text
+- `corrupt_text(text, age_minutes)` - Apply corruption to text (empty string once expired)
 - `should_remove(age_minutes)` - Check if data should be removed
+- `should_remove_seconds(age_seconds)` - Same check against an age in seconds
 - `process_text(text, age_minutes)` - Process with corruption and removal
 
 ### ChromaStorage
@@ -1391,14 +1416,14 @@ Low-level corruption logic:
 Direct access to ChromaDB storage:
 - `store(session_id, text, model_type, metadata=None)` - Store entry
 - `get_entries_for_session(session_id, model_type=None, limit=100)` - Get entries
-- `delete_entries(entry_ids)` - Delete by IDs
+- `delete_entries(entry_ids)` - Delete by IDs (lists over 1000 IDs are deleted in concurrent chunks)
 - `get_all_entries(limit=1000)` - Get all entries
 - `count()` - Get total count
 - `clear()` - Clear all entries
 
 ### ContextCompressor
 
-Context compression utilities:
+Context compression utilities (synchronous, no I/O):
 - `compress(texts, separator)` - Compress multiple texts
 - `compress_with_labels(labeled_texts, separator)` - Compress with labels
 - `estimate_tokens(text)` - Estimate token count
@@ -1413,6 +1438,8 @@ The corruption algorithm:
    - 50% chance: replace with random lowercase letter or space
 3. Severity increases linearly from 0% at decay threshold to 100% at removal threshold
 
+The per-character draws are vectorized with a NumPy `Generator`, so corrupting long texts does not loop over characters in Python. Passing `seed` to `MemoryCorruptor` makes the corruption reproducible.
+
 Example corruption progression:
 - Fresh (0-30 min): "The user asked about weather in Seattle"
 - Aging (45 min): "The user asked abut weather in eatle"
@@ -1423,7 +1450,7 @@ Example corruption progression:
 
 - `midori_ai_vector_manager` - Vector storage abstraction (backed by ChromaDB)
 - `midori_ai_logger` - Logging (via git+)
-- `pydantic>=2.0.0` - Data validation and models
+- `numpy>=1.24.0` - Vectorized memory corruption
 """
 
 # midori-ai-media-lifecycle docs
@@ -1521,6 +1548,20 @@ config = DecayConfig(full_probability_minutes=15.0, zero_probability_minutes=45.
 config = DecayConfig(full_probability_minutes=60.0, zero_probability_minutes=180.0)
 ```
 
+### Exponential Decay
+
+`ExponentialDecayConfig` is a drop-in `DecayConfig` with memoryless decay. Probability halves every `half_life_minutes`, with no flat 100% period. Media ages out once probability falls to `aged_out_probability`, and that age becomes its `zero_probability_minutes`. Two exponential decays compose into one by adding their rates:
+
+```python
+from midori_ai_media_lifecycle import ExponentialDecayConfig
+
+config = ExponentialDecayConfig(half_life_minutes=20.0, aged_out_probability=0.001)
+config.zero_probability_minutes  # ~199.3 minutes
+
+# Equivalent to applying both decays (half-life 10 minutes)
+combined = config.compose(ExponentialDecayConfig(half_life_minutes=20.0))
+```
+
 ## Decay Functions
 
 ### get_parsing_probability
@@ -1542,6 +1583,18 @@ config = DecayConfig(full_probability_minutes=30.0, zero_probability_minutes=60.
 probability = get_parsing_probability(time_saved, config)
 ```
 
+### get_parsing_probabilities
+
+Score many save times at once with NumPy. All ages are measured against a single clock reading:
+
+```python
+from midori_ai_media_lifecycle import get_parsing_probabilities
+from midori_ai_media_lifecycle import to_datetime64
+
+times = to_datetime64([media.metadata.time_saved for media in media_list])
+probabilities = get_parsing_probabilities(times)  # float64 array, one entry per media
+```
+
 ### should_parse
 
 Make a probabilistic decision about whether to parse:
@@ -1577,6 +1630,8 @@ age = get_age_minutes(time_saved)
 print(f"Media is {age:.1f} minutes old")
 ```
 
+`get_age_minutes_from_epoch(epoch_seconds)` does the same from a Unix timestamp with plain float math. `LifecycleManager` scores media this way, using each object's `MediaMetadata.time_saved_epoch` value.
+
 ## Lifecycle Manager
 
 The `LifecycleManager` class provides high-level operations for media lifecycle:
@@ -1620,6 +1675,38 @@ if manager.should_parse(media):
     pass
 ```
 
+#### should_parse_metadata(metadata)
+
+The same probabilistic decision from `MediaMetadata` alone, for callers that have not loaded the payload. `should_parse` delegates to it, so subclasses override this method to change both:
+
+```python
+metadata = await manager.storage.load_metadata(media_id)
+if manager.should_parse_metadata(metadata):
+    # Load and process media
+    pass
+```
+
+**Breaking change for subclasses:** `MediaRequestHandler.request_media` decides from metadata alone. It calls `score_metadata` and `should_parse_metadata`, not `get_parsing_probability(media)`, `is_aged_out(media)` or `should_parse(media)`. Subclasses that customised the `MediaObject` methods should override `score_metadata` (probability and aged-out status) and `should_parse_metadata` (parse decision) instead.
+
+#### should_parse_accumulated(media)
+
+Deterministic parse decision without a random number generator. Each call adds the media's probability to an accumulator on the manager. The call returns `True` each time the accumulator reaches 1.0, so the long-run parse rate matches `should_parse`, but decisions are evenly spaced rather than independent:
+
+```python
+if manager.should_parse_accumulated(media):
+    # Process media
+    pass
+```
+
+#### get_parsing_probabilities(media_list) / should_parse_many(media_list)
+
+Vectorized scoring and parse decisions for many MediaObjects:
+
+```python
+probabilities = manager.get_parsing_probabilities(media_list)  # numpy array
+decisions = manager.should_parse_many(media_list)  # list[bool], aligned with media_list
+```
+
 #### is_aged_out(media)
 
 Check if media is aged out:
@@ -1649,16 +1736,24 @@ print(f"Parsed at: {media.metadata.time_parsed}")
 
 #### cleanup_aged_media()
 
-Remove all aged-out media from storage:
+Remove all aged-out media from storage. The aged-out IDs are streamed from a metadata-only scan (`MediaStorage.iter_aged_out`). Deletes start while the scan is still running, with at most `max_concurrency` in flight (a `LifecycleManager` constructor argument, default 32). The scan waits for a free slot, so memory stays bounded on large vaults. Failures are raised as an `ExceptionGroup`:
 
 ```python
 deleted_ids = await manager.cleanup_aged_media()
 print(f"Cleaned up {len(deleted_ids)} media objects")
 ```
 
+If your media IDs embed their save time (e.g. ULIDs), pass an `id_to_time_saved` decoder. Cleanup then reads ages from the IDs and only lists storage. IDs the decoder rejects with `ValueError` fall back to a metadata read. `is_aged_out_id(media_id)` makes the same check without touching storage:
+
+```python
+manager = LifecycleManager(storage=storage, id_to_time_saved=decode_ulid_time)
+if manager.is_aged_out_id("01HV..."):
+    pass
+```
+
 #### get_media_status(media_id)
 
-Get comprehensive status for a media object:
+Get comprehensive status for a media object. Only the metadata sidecar is read, so frequent status polls stay cheap. To score metadata you already hold, `score_metadata(metadata)` returns `(probability, aged_out)` from a single age read:
 
 ```python
 status = await manager.get_media_status("photo-001")
@@ -1693,6 +1788,10 @@ print(f"Running: {scheduler.is_running}")
 await scheduler.stop()
 ```
 
+Runs are scheduled from each run's start time, so a slow cleanup does not push later runs back. If one run takes longer than a whole interval, the next run is scheduled one interval after it finishes, with no back-to-back catch-up runs.
+
+`stop()` wakes the scheduler immediately instead of waiting out the interval. A cleanup that is already running is allowed to finish; it is not cancelled partway through its deletes.
+
 ### Cleanup Callback
 
 Register a callback to be notified of cleanups:
@@ -1870,11 +1969,15 @@ async def example():
 The media request flow follows these steps:
 
 1. **Agent creates MediaRequest** with `media_id`, `requested_type`, `requester_id`
-2. **Handler loads media** from storage
-3. **Type validation**: If `requested_type != media.media_type`, return DENIED
-4. **Decay check**: If `is_aged_out()`, return EXPIRED
-5. **Probability check**: If `should_parse()` returns False, return DENIED with probability
-6. **Success**: Decrypt content, update parsed timestamp, return COMPLETED with content
+2. **Handler looks up the media type and metadata**. This uses `load_metadata_with_type()`, which searches the type folders once and reads only the small metadata sidecar.
+3. **Type validation**: If `requested_type` differs from the stored type, return DENIED
+4. **Decay check**: If the media has aged out, return EXPIRED
+5. **Probability check**: If `LifecycleManager.should_parse_metadata()` declines, return DENIED with probability
+6. **Success**: Load and decrypt content, update parsed timestamp, return COMPLETED with content
+
+Rejected requests never load or decrypt the media payload.
+
+**Breaking change for `LifecycleManager` subclasses:** because the checks run before the payload is loaded, `request_media` calls `score_metadata(metadata)` and `should_parse_metadata(metadata)`. It no longer calls the `MediaObject` methods `get_parsing_probability(media)`, `is_aged_out(media)` or `should_parse(media)`, so overrides of those methods are not used by the handler. Override `score_metadata` to change the reported probability and the aged-out check, and `should_parse_metadata` to change the parse decision.
 
 ## Data Models
 
@@ -2067,7 +2170,7 @@ for photo_id in photo_ids:
         process_photo(response.decrypted_content)
 ```
 
-**Performance Note**: This method loads and decrypts each media file to check its type. For large collections, this may be slow. Consider caching results if used frequently.
+**Performance Note**: The storage keeps each media type in its own folder, so this method only lists one folder. No media file is read or decrypted, and no separate type index is needed.
 
 ## Custom Protocol Implementation
 
@@ -2332,6 +2435,9 @@ metadata = MediaMetadata(
 # - time_saved: datetime (default: now)
 # - time_loaded: Optional[datetime]
 # - time_parsed: Optional[datetime]
+
+# Derived, computed once and not serialized:
+# - time_saved_epoch: float (Unix seconds; naive time_saved read as UTC)
 ```
 
 **Note:** Lifecycle management (ageout, decay) is handled by the `midori-ai-media-lifecycle` package, not the vault.
@@ -2400,6 +2506,15 @@ await storage.save(media)
 # Load media by ID
 loaded = await storage.load("media-id")
 
+# Load only the metadata (reads the small sidecar, not the media payload)
+metadata = await storage.load_metadata("media-id")
+
+# Get the media type from its folder (no file is read)
+media_type = await storage.get_media_type("media-id")
+
+# Get both with a single folder search
+media_type, metadata = await storage.load_metadata_with_type("media-id")
+
 # Delete media
 deleted = await storage.delete("media-id")  # Returns True if deleted
 
@@ -2412,8 +2527,19 @@ ids = await storage.list_all()
 # List media IDs filtered by type
 photo_ids = await storage.list_by_type(MediaType.PHOTO)
 audio_ids = await storage.list_by_type(MediaType.AUDIO)
+
+# List media IDs saved at or before a cutoff (metadata-only scan)
+aged_ids = await storage.list_aged_out(cutoff)
+
+# Stream IDs instead of building a list (constant memory on large vaults)
+async for media_id in storage.iter_all():
+    print(media_id)
+async for media_id in storage.iter_aged_out(cutoff):
+    print(media_id)
 ```
 
+`iter_all()` and `iter_aged_out()` scan each type folder in small batches in a worker thread. They yield IDs as each batch completes, so callers can start work before the scan finishes.
+
 #### list_by_type Performance Note
 
 The `list_by_type()` method is optimized to simply list files in the type-specific folder (e.g., `photo/`, `video/`), without needing to load or decrypt any files. This makes it very fast even for large collections.
@@ -2434,7 +2560,9 @@ Media objects are organized into type-specific subfolders for optimized filterin
 base_path/
 ├── photo/
 │   ├── photo-1.media
-│   └── photo-2.media
+│   ├── photo-1.meta
+│   ├── photo-2.media
+│   └── photo-2.meta
 ├── video/
 │   └── video-1.media
 ├── audio/
@@ -2445,6 +2573,8 @@ base_path/
 
 Each `.media` file contains the serialized MediaObject JSON encrypted using a system-stats-derived key.
 
+Each `.meta` sidecar holds only the object's `MediaMetadata` JSON, encrypted with the same system key. `load_metadata()` and `list_aged_out()` read these small files so timestamp checks never decrypt the media payload. Files saved without a sidecar fall back to reading the full `.media` file. `delete()` removes both files.
+
 ### Onion/Layered Encryption
 
 The storage uses two layers of encryption (like Tor/onion routing):
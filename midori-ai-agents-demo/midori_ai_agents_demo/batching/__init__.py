@@ -0,0 +1,6 @@
+"""Cross-request agent batching for the reasoning pipeline."""
+
+from .coordinator import AgentBatchCoordinator
+
+
+__all__ = ["AgentBatchCoordinator"]
@@ -0,0 +1,164 @@
+"""Shared helpers for batched and retried agent calls.
+
+Agents may implement an optional `execute_batch(payloads)` method that
+serves several payloads in one call. These helpers are the single place
+that detects that method, checks its responses, packs work into batches,
+retries transient failures, and runs whole batched reasoning passes, so
+the working awareness stage and the batch coordinator behave the same way.
+"""
+
+import asyncio
+
+from typing import Any
+from typing import List
+from typing import Callable
+from typing import Awaitable
+from typing import AsyncIterator
+
+from midori_ai_agent_base import AgentPayload
+from midori_ai_logger import MidoriAiLogger
+
+
+TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
+
+RETRY_BASE_DELAY_SECONDS = 1.0
+
+
+def supports_batch(agent: Any) -> bool:
+    """Check whether an agent implements the optional `execute_batch` fast path.
+
+    The method is looked up on the agent's class so that dynamic attribute
+    objects (such as mocks) are not mistaken for batch-capable backends.
+
+    Args:
+        agent: The agent to check
+
+    Returns:
+        True if the agent's class exposes a callable `execute_batch` method
+    """
+    batch_method = getattr(type(agent), "execute_batch", None)
+
+    return callable(batch_method)
+
+
+async def execute_batch(agent: Any, payloads: List[AgentPayload]) -> List[Any]:
+    """Send payloads to the agent's `execute_batch` method in one call.
+
+    Args:
+        agent: A batch-capable agent
+        payloads: The payloads to execute
+
+    Returns:
+        One response per payload, in payload order
+
+    Raises:
+        RuntimeError: If the agent returned a different number of responses
+    """
+    responses = await agent.execute_batch(payloads)
+
+    if len(responses) != len(payloads):
+        raise RuntimeError(f"Batch returned {len(responses)} responses for {len(payloads)} payloads")
+
+    return responses
+
+
+async def iter_batch_results(items: List[Any], batch_size: int, run_batch: Callable[[List[Any], int], Awaitable[List[Any]]]) -> AsyncIterator[Any]:
+    """Pack items into batches and yield their results as batches complete.
+
+    Every batch is started at once, so callers bound concurrency inside
+    `run_batch`. A failed batch is reported per item rather than raised,
+    so results can be consumed in completion order without losing track of
+    how many items the failure covered.
+
+    Args:
+        items: The prompts or payloads to execute
+        batch_size: Maximum items per batch
+        run_batch: Coroutine function taking a batch and its index
+
+    Yields:
+        One entry per item: its result, or the exception raised by its batch
+    """
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+    async def run_reported(batch: List[Any], batch_index: int) -> List[Any]:
+        try:
+            return await run_batch(batch, batch_index)
+        except Exception as e:
+            return [e] * len(batch)
+
+    for next_batch in asyncio.as_completed([run_reported(batch, i) for i, batch in enumerate(batches)]):
+        for result in await next_batch:
+            yield result
+
+
+async def call_with_retries(make_call: Callable[[], Awaitable[Any]], semaphore: asyncio.Semaphore, max_retries: int, label: str, logger: MidoriAiLogger) -> Any:
+    """Run an agent call under a concurrency limit, retrying transient errors.
+
+    The semaphore is only held while the call is in flight, so backoff
+    sleeps never block other calls from using the free slot.
+
+    Args:
+        make_call: Factory returning a fresh agent call coroutine per attempt
+        semaphore: Semaphore bounding the calls in flight
+        max_retries: Retries with exponential backoff on transient errors
+        label: Human-readable name of the call (for logging)
+        logger: Logger used to report retries
+
+    Returns:
+        The agent call's result
+
+    Raises:
+        Exception: The last error once retries are exhausted, or any non-transient error
+    """
+    attempt = 0
+
+    while True:
+        try:
+            async with semaphore:
+                return await make_call()
+        except TRANSIENT_ERRORS as e:
+            if attempt >= max_retries:
+                raise
+
+            delay = RETRY_BASE_DELAY_SECONDS * 2**attempt
+
+            logger.warning("%s failed with transient error, retrying in %.1fs: %s", label, delay, e)
+
+            await asyncio.sleep(delay)
+
+            attempt += 1
+
+
+async def iter_batched_texts(agent: Any, prompts: List[str], batch_size: int, build_payload: Callable[[str], AgentPayload], semaphore: asyncio.Semaphore, max_retries: int, logger: MidoriAiLogger) -> AsyncIterator[str | Exception]:
+    """Reason about prompts with batched agent calls, yielding texts as batches complete.
+
+    Prompts are packed into groups of `batch_size` and each group is sent
+    as a single `execute_batch` call, cutting network round-trips and letting
+    the backend co-batch the prompts. The semaphore bounds how many batches
+    are in flight at once.
+
+    Args:
+        agent: A batch-capable agent
+        prompts: The prompts to reason about
+        batch_size: Maximum prompts per batch
+        build_payload: Builds the payload for one prompt
+        semaphore: Semaphore bounding the calls in flight
+        max_retries: Retries with exponential backoff on transient errors
+        logger: Logger used to report progress and retries
+
+    Yields:
+        One entry per prompt: the reasoning text, or the exception raised by its batch
+    """
+    logger.debug("Packing %d prompts into batches of up to %d", len(prompts), batch_size)
+
+    async def reason_batch(batch: List[str], batch_index: int) -> List[str]:
+        payloads = [build_payload(prompt) for prompt in batch]
+
+        logger.debug("Starting batch %d with %d prompts", batch_index, len(payloads))
+
+        responses = await call_with_retries(lambda: execute_batch(agent, payloads), semaphore, max_retries, f"Batch {batch_index}", logger)
+
+        return [response.text for response in responses]
+
+    async for result in iter_batch_results(prompts, batch_size, reason_batch):
+        yield result
@@ -0,0 +1,135 @@
+"""Agent batch coordinator for the reasoning pipeline.
+
+This demonstrates continuous-batching-style scheduling at the agent layer:
+agent calls issued by different stages and different in-flight requests are
+collected for a short window and sent to the backend as one batched call,
+so the backend can co-batch prompts instead of serving them one by one.
+"""
+
+import asyncio
+
+from typing import Any
+from typing import Set
+from typing import List
+from typing import Tuple
+from typing import Optional
+
+from midori_ai_agent_base import AgentPayload
+from midori_ai_agent_base import MidoriAiAgentProtocol
+from midori_ai_logger import MidoriAiLogger
+
+from .calls import execute_batch
+from .calls import supports_batch
+
+
+class AgentBatchCoordinator:
+    """Collects agent calls across in-flight requests into batched calls.
+    
+    Callers `await coordinator.submit(payload)` instead of calling the agent
+    directly. The first submission opens a collection window; every payload
+    submitted before the window closes (or before `max_batch_size` payloads
+    are pending) is dispatched together, and each caller receives its own
+    response.
+    
+    Agents that implement the optional `execute_batch` method receive the
+    whole group in one call. Other agents still get their calls dispatched
+    concurrently, so the coordinator is safe to use with any backend.
+    
+    A coordinator belongs to one event loop. Share a single instance between
+    stages and pipeline runs to get cross-request batching.
+    """
+
+    def __init__(self, agent: MidoriAiAgentProtocol, window_seconds: float = 0.01, max_batch_size: int = 32, logger: Optional[MidoriAiLogger] = None):
+        """Initialize the batch coordinator.
+        
+        Args:
+            agent: The agent that serves the batched calls
+            window_seconds: How long to collect payloads after the first submission
+            max_batch_size: Pending payload count that dispatches a batch immediately
+            logger: Optional logger instance
+        """
+        self._agent = agent
+        self._window_seconds = max(0.0, window_seconds)
+        self._max_batch_size = max(1, max_batch_size)
+        self._logger = logger or MidoriAiLogger()
+        self._pending: List[Tuple[AgentPayload, asyncio.Future]] = []
+        self._window_task: Optional[asyncio.Task] = None
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, payload: AgentPayload) -> Any:
+        """Queue a payload for the next batch and wait for its response.
+        
+        Args:
+            payload: The agent payload to execute
+            
+        Returns:
+            The agent's response for this payload
+            
+        Raises:
+            Exception: Whatever the agent raised for this payload or its batch
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        self._pending.append((payload, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._window_task is None:
+            self._window_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Dispatch whatever is pending once the collection window closes."""
+        await asyncio.sleep(self._window_seconds)
+
+        self._window_task = None
+
+        self._flush()
+
+    def _flush(self) -> None:
+        """Dispatch all pending payloads as one batch and reset the window."""
+        if self._window_task is not None:
+            self._window_task.cancel()
+
+            self._window_task = None
+
+        batch = self._pending
+
+        self._pending = []
+
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._dispatch(batch))
+
+        self._dispatch_tasks.add(task)
+
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self, batch: List[Tuple[AgentPayload, asyncio.Future]]) -> None:
+        """Execute one batch and resolve each caller's future.
+        
+        Args:
+            batch: Pending payloads paired with the futures awaiting them
+        """
+        payloads = [payload for payload, _ in batch]
+
+        self._logger.debug("Dispatching batch of %d agent calls", len(payloads))
+
+        if supports_batch(self._agent):
+            try:
+                responses = await execute_batch(self._agent, payloads)
+            except Exception as e:
+                responses = [e] * len(payloads)
+        else:
+            responses = await asyncio.gather(*(self._agent.execute_with_reasoning(payload) for payload in payloads), return_exceptions=True)
+
+        for (_, future), response in zip(batch, responses):
+            if future.done():
+                continue
+
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
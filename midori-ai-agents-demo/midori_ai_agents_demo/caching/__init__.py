@@ -2,7 +2,9 @@
 
 from .base import CacheProtocol
 
+from .compactor_cache import CompactorCacheAdapter
+
 from .memory_cache import MemoryCache
 
 
-__all__ = ["CacheProtocol", "MemoryCache"]
+__all__ = ["CacheProtocol", "CompactorCacheAdapter", "MemoryCache"]
@@ -0,0 +1,51 @@
+"""Adapter that lets ThinkingCompactor use a pipeline cache.
+
+ThinkingCompactor expects a CompactorCache from midori-ai-compactor.
+The pipeline's caches implement the demo's own CacheProtocol instead,
+so this adapter forwards the compactor's get and set calls to one.
+"""
+
+from typing import Optional
+
+from midori_ai_compactor import CompactorCache
+
+from .base import CacheProtocol
+
+
+class CompactorCacheAdapter(CompactorCache):
+    """CompactorCache backed by any CacheProtocol implementation.
+    
+    Entries are stored in the wrapped cache, so compactor results share
+    its storage, TTL handling and clear() with the other pipeline stages.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, cache: CacheProtocol):
+        """Initialize the adapter.
+        
+        Args:
+            cache: The pipeline cache that stores the compactor's entries
+        """
+        self._cache = cache
+
+    async def get(self, key: str) -> Optional[str]:
+        """Retrieve a consolidation from the wrapped cache.
+        
+        Args:
+            key: The cache key to look up
+            
+        Returns:
+            The cached value if found and not expired, None otherwise
+        """
+        return await self._cache.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        """Store a consolidation in the wrapped cache.
+        
+        Args:
+            key: The cache key to store under
+            value: The value to cache
+            ttl_seconds: Optional time-to-live in seconds (None = no expiration)
+        """
+        await self._cache.set(key, value, ttl_seconds=ttl_seconds)
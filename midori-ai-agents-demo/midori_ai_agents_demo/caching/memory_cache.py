@@ -5,22 +5,27 @@ For production use, consider Redis, Memcached, or context-bridge.
 """
 
 import time
+import hashlib
 
 from dataclasses import dataclass
 
 from typing import Dict
+from typing import Callable
 from typing import Optional
 
 from .base import CacheProtocol
 
 
+_MAX_RAW_KEY_LENGTH = 64
+
+
 @dataclass
 class CacheEntry:
     """A cached entry with value and expiration.
     
     Attributes:
         value: The cached value
-        expires_at: Unix timestamp when this entry expires (None = never)
+        expires_at: Clock reading when this entry expires (None = never)
     """
 
     value: str
@@ -34,6 +39,7 @@ class MemoryCache(CacheProtocol):
     - Key-value storage
     - TTL-based expiration
     - Automatic cleanup on access
+    - Bounded key size (long keys such as full prompts are hashed)
     
     Note: This is a demo implementation. For production use:
     - Use Redis or Memcached for distributed caching
@@ -48,9 +54,37 @@ class MemoryCache(CacheProtocol):
     - Doesn't handle memory limits
     """
 
-    def __init__(self):
-        """Initialize the memory cache."""
+    def __init__(self, time_fn: Callable[[], float] = time.monotonic):
+        """Initialize the memory cache.
+        
+        Args:
+            time_fn: Clock used for TTL expiration, in seconds. Defaults to
+                time.monotonic so wall-clock adjustments never expire entries
+                early; tests can pass a fake clock to advance time instantly.
+        """
         self._cache: Dict[str, CacheEntry] = {}
+        self._time_fn = time_fn
+
+    def _storage_key(self, key: str) -> str:
+        """Map a caller's key to the key used in the underlying dictionary.
+        
+        Keys longer than 64 characters (for example, whole prompts) are
+        replaced by a 16-byte blake2b digest. This bounds the memory each
+        entry pins and keeps dictionary hashing and comparisons cheap.
+        Short keys are stored as-is.
+        
+        Args:
+            key: The caller's cache key
+            
+        Returns:
+            The key to store the entry under
+        """
+        if len(key) <= _MAX_RAW_KEY_LENGTH:
+            return key
+
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+        return f"blake2b:{digest}"
 
     async def get(self, key: str) -> Optional[str]:
         """Retrieve a value from the cache.
@@ -61,12 +95,12 @@ class MemoryCache(CacheProtocol):
         Returns:
             The cached value if found and not expired, None otherwise
         """
-        entry = self._cache.get(key)
+        entry = self._cache.get(self._storage_key(key))
 
         if entry is None:
             return None
 
-        if entry.expires_at is not None and time.time() > entry.expires_at:
+        if entry.expires_at is not None and self._time_fn() > entry.expires_at:
             await self.delete(key)
 
             return None
@@ -84,9 +118,9 @@ class MemoryCache(CacheProtocol):
         expires_at = None
 
         if ttl_seconds is not None:
-            expires_at = time.time() + ttl_seconds
+            expires_at = self._time_fn() + ttl_seconds
 
-        self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+        self._cache[self._storage_key(key)] = CacheEntry(value=value, expires_at=expires_at)
 
     async def delete(self, key: str) -> None:
         """Delete a value from the cache.
@@ -94,7 +128,7 @@ class MemoryCache(CacheProtocol):
         Args:
             key: The cache key to delete
         """
-        self._cache.pop(key, None)
+        self._cache.pop(self._storage_key(key), None)
 
     async def clear(self) -> None:
         """Clear all values from the cache."""
@@ -32,7 +32,7 @@ class PipelineConfig:
         
         enable_working_awareness: Enable working awareness stage (parallel reasoning)
             - Use when: Complex problems benefit from multiple perspectives
-            - Demo: Shows parallel execution with asyncio.gather
+            - Demo: Shows parallel execution with asyncio.as_completed
         
         enable_compaction: Enable compaction stage (deduplicate/consolidate outputs)
             - Use when: Multiple reasoning outputs need consolidation
@@ -54,6 +54,18 @@ class PipelineConfig:
         timeout_seconds: Maximum time to wait for a stage
             - Use when: You need to bound execution time
             - Demo: Shows timeout handling patterns
+        
+        max_concurrent_pipelines: Requests processed at once by batch_process()
+            - Use when: Running eval suites or bulk generation
+            - Trade-off: Higher values finish sooner but hit rate limits harder
+        
+        enable_agent_batching: Co-batch agent calls across stages and requests
+            - Use when: Many requests run concurrently against a batching backend
+            - Trade-off: Adds up to agent_batch_window_seconds latency per call
+        
+        agent_batch_window_seconds: How long to collect calls before dispatching
+        
+        agent_batch_max_size: Pending calls that dispatch a batch immediately
     
     Caching Configuration:
         cache_strategy: Which caching approach to use
@@ -97,6 +109,10 @@ class PipelineConfig:
     parallel_execution: bool = True
     max_retries: int = 3
     timeout_seconds: float = 60.0
+    max_concurrent_pipelines: int = 4
+    enable_agent_batching: bool = False
+    agent_batch_window_seconds: float = 0.01
+    agent_batch_max_size: int = 32
     cache_strategy: CacheStrategy = CacheStrategy.MEMORY
     cache_ttl_seconds: int = 3600
     vector_collection: str = "reasoning_context"
@@ -178,6 +194,10 @@ def load_pipeline_config() -> PipelineConfig:
         parallel_execution=section.get("parallel_execution", True),
         max_retries=section.get("max_retries", 3),
         timeout_seconds=section.get("timeout_seconds", 60.0),
+        max_concurrent_pipelines=section.get("max_concurrent_pipelines", 4),
+        enable_agent_batching=section.get("enable_agent_batching", False),
+        agent_batch_window_seconds=section.get("agent_batch_window_seconds", 0.01),
+        agent_batch_max_size=section.get("agent_batch_max_size", 32),
         cache_strategy=cache_strategy,
         cache_ttl_seconds=section.get("cache_ttl_seconds", 3600),
         vector_collection=section.get("vector_collection", "reasoning_context"),
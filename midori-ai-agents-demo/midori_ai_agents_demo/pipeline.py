@@ -6,6 +6,7 @@ and providing comprehensive observability.
 """
 
 import time
+import asyncio
 
 from typing import List
 from typing import Optional
@@ -15,11 +16,16 @@ from midori_ai_compactor import ThinkingCompactor
 from midori_ai_logger import MidoriAiLogger
 from midori_ai_reranker import RerankerPipeline
 
+from .batching import AgentBatchCoordinator
+
 from .caching import CacheProtocol
+from .caching import CompactorCacheAdapter
 from .caching import MemoryCache
 
 from .config import PipelineConfig
 
+from .enums import CacheStrategy
+
 from .models import PipelineRequest
 from .models import PipelineResponse
 from .models import StageContext
@@ -66,7 +72,7 @@ class ReasoningPipeline:
         Args:
             agent: The primary agent for reasoning tasks
             config: Optional pipeline configuration (uses defaults if not provided)
-            compactor: Optional ThinkingCompactor instance (creates one if not provided)
+            compactor: Optional ThinkingCompactor instance (creates one backed by the pipeline cache if not provided)
             reranker: Optional RerankerPipeline instance (creates one if not provided)
             cache: Optional cache implementation (uses MemoryCache if not provided)
             logger: Optional logger instance (creates one if not provided)
@@ -76,8 +82,9 @@ class ReasoningPipeline:
         self._logger = logger or MidoriAiLogger()
         self._cache = cache or MemoryCache()
         self._metrics = MetricsCollector() if self._config.enable_metrics else None
-        self._compactor = compactor or ThinkingCompactor(agent=agent)
+        self._compactor = compactor or ThinkingCompactor(agent=agent, cache=CompactorCacheAdapter(self._cache) if self._config.cache_strategy != CacheStrategy.NONE else None)
         self._reranker = reranker or RerankerPipeline()
+        self._coordinator = AgentBatchCoordinator(agent=agent, window_seconds=self._config.agent_batch_window_seconds, max_batch_size=self._config.agent_batch_max_size, logger=self._logger) if self._config.enable_agent_batching else None
         self._logger.info("Initialized ReasoningPipeline with configuration")
 
         self._stages = self._create_stages()
@@ -94,16 +101,16 @@ class ReasoningPipeline:
         stages = []
 
         if self._config.enable_preprocessing:
-            stages.append(PreprocessingStage(agent=self._agent, enabled=True, logger=self._logger))
+            stages.append(PreprocessingStage(agent=self._agent, cache=self._cache, cache_ttl_seconds=self._config.cache_ttl_seconds, coordinator=self._coordinator, enabled=True, logger=self._logger))
 
         if self._config.enable_working_awareness:
-            stages.append(WorkingAwarenessStage(agent=self._agent, num_perspectives=3, enabled=True, logger=self._logger))
+            stages.append(WorkingAwarenessStage(agent=self._agent, num_perspectives=3, max_retries=self._config.max_retries, coordinator=self._coordinator, enabled=True, logger=self._logger))
 
         if self._config.enable_compaction:
             stages.append(CompactionStage(compactor=self._compactor, enabled=True, logger=self._logger))
 
         if self._config.enable_reranking:
-            stages.append(RerankingStage(reranker=self._reranker, enabled=True, logger=self._logger))
+            stages.append(RerankingStage(reranker=self._reranker, cache=self._cache, cache_ttl_seconds=self._config.cache_ttl_seconds, enabled=True, logger=self._logger))
 
         stages.append(FinalResponseStage(agent=self._agent, enabled=True, logger=self._logger))
 
@@ -128,7 +135,7 @@ class ReasoningPipeline:
         if isinstance(request, str):
             request = PipelineRequest(prompt=request)
 
-        self._logger.info(f"Processing request: {request.prompt[:100]}...")
+        self._logger.info("Processing request: %.100s...", request.prompt)
 
         tracer = Tracer() if self._config.enable_tracing else None
 
@@ -163,7 +170,7 @@ class ReasoningPipeline:
 
         final_response = final_result.output or "No response generated"
 
-        self._logger.info(f"Pipeline complete in {total_duration_ms:.2f}ms, final response: {len(final_response)} chars")
+        self._logger.info("Pipeline complete in %.2fms, final response: %d chars", total_duration_ms, len(final_response))
 
         response = PipelineResponse(final_response=final_response, stages=context.previous_results, total_duration_ms=total_duration_ms, request=request, cache_hits=cache_hits)
 
@@ -174,3 +181,29 @@ class ReasoningPipeline:
             response.metadata["trace_id"] = tracer.trace_id
 
         return response
+
+    async def batch_process(self, requests: List[PipelineRequest | str]) -> List[PipelineResponse]:
+        """Process many requests concurrently through the pipeline.
+        
+        This demonstrates in-process fan-out for batch workloads such as
+        evaluation suites: requests run concurrently on the event loop, with
+        at most `config.max_concurrent_pipelines` in flight at once so the
+        agent backend is not flooded. Responses are returned in request order.
+        
+        Args:
+            requests: PipelineRequest objects or string prompts
+            
+        Returns:
+            One PipelineResponse per request, in the same order
+        """
+        semaphore = asyncio.Semaphore(max(1, self._config.max_concurrent_pipelines))
+
+        self._logger.info("Batch processing %d requests, %d at a time", len(requests), self._config.max_concurrent_pipelines)
+
+        async def process_one(request: PipelineRequest | str) -> PipelineResponse:
+            async with semaphore:
+                return await self.process(request)
+
+        responses = await asyncio.gather(*(process_one(request) for request in requests))
+
+        return list(responses)
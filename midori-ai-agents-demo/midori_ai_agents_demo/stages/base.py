@@ -40,6 +40,8 @@ class BaseStage(ABC):
     - Skip logic when stage is disabled
     """
 
+    __slots__ = ("_enabled", "_logger")
+
     def __init__(self, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
         """Initialize the base stage.
         
@@ -94,11 +96,11 @@ class BaseStage(ABC):
             StageResult with output, status, timing, and any errors
         """
         if not self._enabled:
-            self._logger.info(f"Stage {self.stage_type.value} is disabled, skipping")
+            self._logger.info("Stage %s is disabled, skipping", self.stage_type.value)
 
             return StageResult(stage_type=self.stage_type, status=StageStatus.SKIPPED)
 
-        self._logger.info(f"Starting stage: {self.stage_type.value}")
+        self._logger.info("Starting stage: %s", self.stage_type.value)
 
         start_time = time.perf_counter()
 
@@ -107,7 +109,7 @@ class BaseStage(ABC):
 
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            self._logger.info(f"Stage {self.stage_type.value} completed in {duration_ms:.2f}ms")
+            self._logger.info("Stage %s completed in %.2fms", self.stage_type.value, duration_ms)
 
             return StageResult(stage_type=self.stage_type, status=StageStatus.COMPLETED, output=output, duration_ms=duration_ms)
         except Exception as e:
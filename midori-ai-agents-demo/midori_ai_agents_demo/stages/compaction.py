@@ -35,6 +35,8 @@ class CompactionStage(BaseStage):
     - Compress verbose outputs
     """
 
+    __slots__ = ("_compactor",)
+
     def __init__(self, compactor: ThinkingCompactor, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
         """Initialize the compaction stage.
         
@@ -70,7 +72,7 @@ class CompactionStage(BaseStage):
 
         outputs = self._extract_reasoning_outputs(context)
 
-        self._logger.debug(f"Extracted {len(outputs)} outputs to compact")
+        self._logger.debug("Extracted %d outputs to compact", len(outputs))
 
         if not outputs:
             self._logger.warning("No outputs to compact, returning empty result")
@@ -82,11 +84,11 @@ class CompactionStage(BaseStage):
 
             return outputs[0]
 
-        self._logger.info(f"Compacting {len(outputs)} outputs using ThinkingCompactor")
+        self._logger.info("Compacting %d outputs using ThinkingCompactor", len(outputs))
 
         compacted = await self._compactor.compact(outputs)
 
-        self._logger.info(f"Compaction complete, reduced {len(outputs)} outputs to consolidated result")
+        self._logger.info("Compaction complete, reduced %d outputs to consolidated result", len(outputs))
 
         return compacted
 
@@ -35,6 +35,8 @@ class FinalResponseStage(BaseStage):
     - Provide reasoning transparency
     """
 
+    __slots__ = ("_agent",)
+
     def __init__(self, agent: MidoriAiAgentProtocol, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
         """Initialize the final response stage.
         
@@ -70,13 +72,13 @@ class FinalResponseStage(BaseStage):
 
         synthesis_prompt = self._build_synthesis_prompt(context)
 
-        self._logger.debug(f"Created synthesis prompt: {len(synthesis_prompt)} chars")
+        self._logger.debug("Created synthesis prompt: %d chars", len(synthesis_prompt))
 
         payload = AgentPayload(prompt=synthesis_prompt, max_tokens=1500, temperature=0.5)
 
         response = await self._agent.execute_with_reasoning(payload)
 
-        self._logger.info(f"Final response generated: {len(response.text)} chars")
+        self._logger.info("Final response generated: %d chars", len(response.text))
 
         return response.text
 
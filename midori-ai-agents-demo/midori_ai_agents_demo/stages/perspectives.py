@@ -0,0 +1,52 @@
+"""Reasoning perspective prompts and formatting.
+
+The working awareness stage builds its prompts from these templates and
+labels each perspective in its combined output. The reranking stage reads
+the shared perspective list back by PERSPECTIVES_KEY.
+"""
+
+from typing import List
+
+
+PERSPECTIVES_KEY = "perspectives"
+
+COMBINED_HEADER = "Multiple reasoning perspectives:"
+
+PERSPECTIVE_TEMPLATES = (
+    "Analyze this problem from a logical, step-by-step perspective:\n{0}",
+    "Consider this problem from a creative, intuitive perspective:\n{0}",
+    "Examine this problem critically, identifying potential issues:\n{0}",
+)
+
+
+def combine_perspectives(perspectives: List[str]) -> str:
+    """Combine multiple reasoning perspectives into a unified output.
+
+    This is a simple demonstration - a production system might use
+    more sophisticated synthesis techniques.
+
+    Args:
+        perspectives: List of reasoning outputs from different perspectives
+
+    Returns:
+        Combined reasoning output
+    """
+    combined_parts = [COMBINED_HEADER]
+
+    for i, perspective in enumerate(perspectives, 1):
+        combined_parts.append(format_perspective(i, perspective))
+
+    return "\n".join(combined_parts)
+
+
+def format_perspective(index: int, perspective: str) -> str:
+    """Format a single perspective for the combined output.
+
+    Args:
+        index: 1-based position of the perspective in the output
+        perspective: The perspective's reasoning text
+
+    Returns:
+        The labelled perspective block
+    """
+    return f"\nPerspective {index}:\n{perspective}"
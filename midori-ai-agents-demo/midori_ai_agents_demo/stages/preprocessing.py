@@ -4,21 +4,31 @@ This stage demonstrates:
 - Using the midori-ai-agent-base protocol
 - Input validation and normalization
 - Context preparation
+- Content-addressed caching of agent results
 - Error handling patterns
 """
 
+import hashlib
+
 from typing import Optional
 
 from midori_ai_agent_base import AgentPayload
 from midori_ai_agent_base import MidoriAiAgentProtocol
 from midori_ai_logger import MidoriAiLogger
 
+from ..batching import AgentBatchCoordinator
+from ..caching import CacheProtocol
 from ..enums import StageType
 from ..models import StageContext
 
 from .base import BaseStage
 
 
+_PROMPT_HEADER = "You are a preprocessing agent for a reasoning pipeline.\nYour task is to validate, normalize, and prepare the following input for reasoning:\n\nInput: "
+
+_PROMPT_FOOTER = "\n\nProvide a clear, well-structured version of this task that will be easier for downstream reasoning stages to process."
+
+
 class PreprocessingStage(BaseStage):
     """Preprocessing stage that validates and prepares input.
     
@@ -27,6 +37,7 @@ class PreprocessingStage(BaseStage):
     - Build structured prompts for LRM tasks
     - Validate and normalize input
     - Add context and constraints
+    - Skip the agent call when the same request was already preprocessed
     
     In a real pipeline, this stage might:
     - Extract entities and keywords
@@ -35,16 +46,24 @@ class PreprocessingStage(BaseStage):
     - Validate constraints
     """
 
-    def __init__(self, agent: MidoriAiAgentProtocol, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
+    __slots__ = ("_agent", "_cache", "_cache_ttl_seconds", "_coordinator")
+
+    def __init__(self, agent: MidoriAiAgentProtocol, cache: Optional[CacheProtocol] = None, cache_ttl_seconds: Optional[int] = None, coordinator: Optional[AgentBatchCoordinator] = None, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
         """Initialize the preprocessing stage.
         
         Args:
             agent: The agent to use for preprocessing (demonstrates protocol usage)
+            cache: Optional cache for preprocessing results
+            cache_ttl_seconds: Optional time-to-live for cached results
+            coordinator: Optional coordinator that co-batches agent calls across requests
             enabled: Whether this stage should execute
             logger: Optional logger instance
         """
         super().__init__(enabled=enabled, logger=logger)
         self._agent = agent
+        self._cache = cache
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._coordinator = coordinator
 
     @property
     def stage_type(self) -> StageType:
@@ -55,10 +74,12 @@ class PreprocessingStage(BaseStage):
         """Preprocess the input using the agent.
         
         This demonstrates:
-        1. Building a structured prompt for preprocessing
-        2. Using AgentPayload to structure the request
-        3. Calling the agent protocol's execute_with_reasoning method
-        4. Extracting and returning the result
+        1. Returning a cached result when this request was seen before
+        2. Building a structured prompt for preprocessing
+        3. Using AgentPayload to structure the request
+        4. Calling the agent protocol's execute_with_reasoning method (or
+           submitting to the batch coordinator when one is configured)
+        5. Caching and returning the result
         
         Args:
             context: Stage context with the original request
@@ -66,25 +87,68 @@ class PreprocessingStage(BaseStage):
         Returns:
             Preprocessed and validated input text
         """
+        use_cache = self._cache is not None and context.cache_enabled
+
+        cache_key = self._cache_key(context) if use_cache else None
+
+        if cache_key is not None:
+            cached = await self._cache.get(cache_key)
+
+            if cached is not None:
+                self._logger.info("Preprocessing result served from cache")
+
+                return cached
+
         self._logger.info("Preprocessing input with agent protocol")
 
         prompt = self._build_preprocessing_prompt(context)
 
         payload = AgentPayload(prompt=prompt, max_tokens=500, temperature=0.3)
 
-        self._logger.debug(f"Sending preprocessing request: {prompt[:100]}...")
+        self._logger.debug("Sending preprocessing request: %.100s...", prompt)
+
+        if self._coordinator is not None:
+            response = await self._coordinator.submit(payload)
+        else:
+            response = await self._agent.execute_with_reasoning(payload)
 
-        response = await self._agent.execute_with_reasoning(payload)
+        self._logger.info("Preprocessing complete, result length: %d", len(response.text))
 
-        self._logger.info(f"Preprocessing complete, result length: {len(response.text)}")
+        if cache_key is not None:
+            await self._cache.set(cache_key, response.text, ttl_seconds=self._cache_ttl_seconds)
 
         return response.text
 
+    def _cache_key(self, context: StageContext) -> str:
+        """Build a content-addressed cache key for the request.
+        
+        The prompt, context, and constraints fully determine the
+        preprocessing prompt, so they are hashed together with NUL
+        separators to keep field boundaries unambiguous.
+        
+        Args:
+            context: Stage context with the original request
+            
+        Returns:
+            A fixed-size cache key for this request
+        """
+        request = context.request
+
+        constraints = "\0".join(request.constraints or [])
+
+        key_material = f"{request.prompt}\0{request.context or ''}\0{constraints}"
+
+        digest = hashlib.blake2b(key_material.encode("utf-8"), digest_size=16).hexdigest()
+
+        return f"preproc:{digest}"
+
     def _build_preprocessing_prompt(self, context: StageContext) -> str:
         """Build the preprocessing prompt.
         
         This demonstrates how to structure prompts for preprocessing tasks,
         including context and constraints from the original request.
+        The static header and footer are built once at import time, so each
+        call only formats the request-specific sections.
         
         Args:
             context: Stage context with the original request
@@ -94,16 +158,8 @@ class PreprocessingStage(BaseStage):
         """
         request = context.request
 
-        prompt_parts = ["You are a preprocessing agent for a reasoning pipeline.", "Your task is to validate, normalize, and prepare the following input for reasoning:", f"\nInput: {request.prompt}"]
-
-        if request.context:
-            prompt_parts.append(f"\nContext: {request.context}")
-
-        if request.constraints:
-            constraints_text = "\n".join(f"- {c}" for c in request.constraints)
-
-            prompt_parts.append(f"\nConstraints:\n{constraints_text}")
+        context_section = f"\n\nContext: {request.context}" if request.context else ""
 
-        prompt_parts.append("\nProvide a clear, well-structured version of this task that will be " "easier for downstream reasoning stages to process.")
+        constraints_section = "\n\nConstraints:\n- " + "\n- ".join(request.constraints) if request.constraints else ""
 
-        return "\n".join(prompt_parts)
+        return f"{_PROMPT_HEADER}{request.prompt}{context_section}{constraints_section}{_PROMPT_FOOTER}"
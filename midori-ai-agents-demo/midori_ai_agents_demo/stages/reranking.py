@@ -3,21 +3,36 @@
 This stage demonstrates:
 - Integration with midori-ai-reranker package
 - Prioritizing and ranking results
+- Caching per-(query, candidate) scores
+- Deduplicating candidates before scoring
 - Quality assessment
 - Result filtering
 """
 
+import re
+import hashlib
+
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 
 from midori_ai_logger import MidoriAiLogger
 from midori_ai_reranker import RerankerPipeline
 
+from ..caching import CacheProtocol
 from ..enums import StageType
 from ..models import StageContext
 
 from .base import BaseStage
 
+from .perspectives import PERSPECTIVES_KEY
+
+
+_CANDIDATE_STAGES = (StageType.COMPACTION, StageType.WORKING_AWARENESS)
+
+_PERSPECTIVE_LABEL = re.compile(r"^Perspective \d+:", re.MULTILINE)
+
 
 class RerankingStage(BaseStage):
     """Reranking stage that prioritizes reasoning results by quality.
@@ -25,7 +40,9 @@ class RerankingStage(BaseStage):
     This stage demonstrates how to:
     - Use the RerankerPipeline from midori-ai-reranker
     - Extract and parse multiple result candidates
+    - Drop duplicate candidates so each one is only scored once
     - Rank results by quality or relevance
+    - Reuse cached scores so only unseen candidates hit the reranker
     - Filter or prioritize outputs
     
     In a real pipeline, this stage might:
@@ -35,16 +52,22 @@ class RerankingStage(BaseStage):
     - Select the best reasoning path
     """
 
-    def __init__(self, reranker: RerankerPipeline, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
+    __slots__ = ("_reranker", "_cache", "_cache_ttl_seconds")
+
+    def __init__(self, reranker: RerankerPipeline, cache: Optional[CacheProtocol] = None, cache_ttl_seconds: Optional[int] = None, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
         """Initialize the reranking stage.
         
         Args:
             reranker: RerankerPipeline instance to use
+            cache: Optional cache for per-(query, candidate) scores
+            cache_ttl_seconds: Optional time-to-live for cached scores
             enabled: Whether this stage should execute
             logger: Optional logger instance
         """
         super().__init__(enabled=enabled, logger=logger)
         self._reranker = reranker
+        self._cache = cache
+        self._cache_ttl_seconds = cache_ttl_seconds
 
     @property
     def stage_type(self) -> StageType:
@@ -55,10 +78,12 @@ class RerankingStage(BaseStage):
         """Rerank reasoning results by quality or relevance.
         
         This demonstrates:
-        1. Extracting candidate results from previous stages
-        2. Using RerankerPipeline to score and rank them
-        3. Selecting or combining the best results
-        4. Returning the prioritized output
+        1. Extracting and deduplicating candidate results from previous stages
+        2. Looking up cached scores when caching is enabled
+        3. Using RerankerPipeline to score and rank only the cache misses
+        4. Selecting the best result across cached and fresh scores, or
+           reranking every candidate when the fresh results carry no scores
+        5. Returning the prioritized output
         
         Args:
             context: Stage context with previous stage results
@@ -68,9 +93,11 @@ class RerankingStage(BaseStage):
         """
         self._logger.info("Starting reranking of reasoning results")
 
-        candidates = self._extract_candidates(context)
+        extracted = self._extract_candidates(context)
+
+        candidates = self._deduplicate_candidates(extracted)
 
-        self._logger.debug(f"Extracted {len(candidates)} candidates for reranking")
+        self._logger.debug("Extracted %d candidates for reranking, %d unique", len(extracted), len(candidates))
 
         if not candidates:
             self._logger.warning("No candidates to rerank, returning empty result")
@@ -82,18 +109,141 @@ class RerankingStage(BaseStage):
 
             return candidates[0]
 
-        self._logger.info(f"Reranking {len(candidates)} candidates using RerankerPipeline")
-
         query = context.request.prompt
 
-        ranked_results = await self._reranker.rerank(query=query, documents=candidates)
+        use_cache = self._cache is not None and context.cache_enabled
+
+        scores = await self._load_cached_scores(query, candidates) if use_cache else {}
+
+        misses = [candidate for candidate in candidates if candidate not in scores]
+
+        if not misses:
+            self._logger.info("All %d candidate scores served from cache", len(candidates))
+
+            return max(candidates, key=lambda candidate: scores[candidate])
+
+        self._logger.info("Reranking %d candidates using RerankerPipeline (%d cached)", len(misses), len(scores))
+
+        ranked_results = await self._reranker.rerank(query=query, documents=misses)
+
+        fresh_scores = self._extract_scores(ranked_results)
+
+        if use_cache and fresh_scores:
+            await self._store_scores(query, fresh_scores)
+
+        self._logger.info("Reranking complete, selected top result from %d candidates", len(ranked_results))
 
-        self._logger.info(f"Reranking complete, selected top result from {len(ranked_results)} candidates")
+        if scores:
+            if ranked_results and len(fresh_scores) == len(ranked_results):
+                scores.update(fresh_scores)
+
+                return max(scores, key=scores.get)
+
+            self._logger.info("Fresh results carry no scores to merge with the cache, reranking all %d candidates", len(candidates))
+
+            ranked_results = await self._reranker.rerank(query=query, documents=candidates)
 
         top_result = ranked_results[0].document if ranked_results else candidates[0]
 
         return top_result
 
+    def _deduplicate_candidates(self, candidates: List[str]) -> List[str]:
+        """Drop duplicate and near-duplicate candidates, keeping the first occurrence.
+        
+        Reranker cost grows linearly with the number of candidates, and
+        perspectives that agree often produce the same text. Candidates are
+        compared on a digest of their case-folded, whitespace-collapsed text,
+        so differences in spacing or capitalisation alone do not cost an
+        extra score.
+        
+        Args:
+            candidates: Candidate texts in extraction order
+            
+        Returns:
+            Unique candidates in their original order
+        """
+        unique: Dict[bytes, str] = {}
+
+        for candidate in candidates:
+            normalized = " ".join(candidate.casefold().split())
+
+            digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+            if digest not in unique:
+                unique[digest] = candidate
+
+        return list(unique.values())
+
+    def _score_cache_key(self, query: str, candidate: str) -> str:
+        """Build the cache key for a (query, candidate) score.
+        
+        Args:
+            query: The reranking query
+            candidate: The candidate text
+            
+        Returns:
+            A fixed-size, content-addressed cache key
+        """
+        digest = hashlib.blake2b(digest_size=16)
+
+        digest.update(query.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(candidate.encode("utf-8"))
+
+        return f"rerank:{digest.hexdigest()}"
+
+    async def _load_cached_scores(self, query: str, candidates: List[str]) -> Dict[str, float]:
+        """Look up cached scores for each candidate.
+        
+        Args:
+            query: The reranking query
+            candidates: Candidate texts to look up
+            
+        Returns:
+            Mapping of candidate text to cached score (misses are omitted)
+        """
+        scores = {}
+
+        for candidate in candidates:
+            cached = await self._cache.get(self._score_cache_key(query, candidate))
+
+            if cached is not None:
+                scores[candidate] = float(cached)
+
+        return scores
+
+    def _extract_scores(self, ranked_results: List[Any]) -> Dict[str, float]:
+        """Extract numeric scores from reranker results.
+        
+        Only results that report a numeric `score` can be cached or merged
+        with cached scores; rerankers without scores simply bypass the cache.
+        
+        Args:
+            ranked_results: Results returned by the reranker
+            
+        Returns:
+            Mapping of document text to score
+        """
+        scores = {}
+
+        for result in ranked_results:
+            score = getattr(result, "score", None)
+
+            if isinstance(score, (int, float)) and not isinstance(score, bool):
+                scores[result.document] = float(score)
+
+        return scores
+
+    async def _store_scores(self, query: str, scores: Dict[str, float]) -> None:
+        """Persist freshly computed scores to the cache.
+        
+        Args:
+            query: The reranking query
+            scores: Mapping of candidate text to score
+        """
+        for candidate, score in scores.items():
+            await self._cache.set(self._score_cache_key(query, candidate), repr(score), ttl_seconds=self._cache_ttl_seconds)
+
     def _extract_candidates(self, context: StageContext) -> List[str]:
         """Extract candidate results from previous stages.
         
@@ -102,6 +252,12 @@ class RerankingStage(BaseStage):
         - Individual reasoning perspectives
         - Alternative solutions
         
+        Working awareness perspectives are taken from the list the stage
+        shares in `context.shared_data`, falling back to parsing the
+        combined text when the list is not available. When no candidate
+        stage produced output, every non-empty stage output is used instead;
+        both lists are built in the same pass over the previous results.
+        
         Args:
             context: Stage context with previous results
             
@@ -110,23 +266,24 @@ class RerankingStage(BaseStage):
         """
         candidates = []
 
-        candidate_stages = {StageType.COMPACTION, StageType.WORKING_AWARENESS}
+        fallback = []
 
         for result in context.previous_results:
-            if result.stage_type in candidate_stages and result.output:
-                if result.stage_type == StageType.WORKING_AWARENESS:
-                    parsed = self._parse_perspectives(result.output)
+            if not result.output:
+                continue
 
-                    candidates.extend(parsed)
-                else:
-                    candidates.append(result.output)
+            if result.stage_type not in _CANDIDATE_STAGES:
+                fallback.append(result.output)
+            elif result.stage_type == StageType.WORKING_AWARENESS:
+                shared_perspectives = context.shared_data.get(PERSPECTIVES_KEY)
 
-        if not candidates:
-            for result in context.previous_results:
-                if result.output:
-                    candidates.append(result.output)
+                parsed = shared_perspectives if shared_perspectives else self._parse_perspectives(result.output)
 
-        return candidates
+                candidates.extend(parsed)
+            else:
+                candidates.append(result.output)
+
+        return candidates if candidates else fallback
 
     def _parse_perspectives(self, combined_output: str) -> List[str]:
         """Parse combined perspectives into individual candidates.
@@ -135,23 +292,23 @@ class RerankingStage(BaseStage):
         into a single output. This method splits them back out for
         individual ranking.
         
+        A single compiled-regex pass finds every "Perspective N:" label at the
+        start of a line. A mention in the middle of a line is ignored, but a
+        perspective whose text has a line starting with "Perspective N:" is
+        still split there. Only the labels are matched; each perspective is then
+        sliced out between consecutive label offsets, which keeps parsing
+        linear even for very large combined outputs.
+        
         Args:
             combined_output: Combined output with multiple perspectives
             
         Returns:
             List of individual perspective strings
         """
-        if "Perspective 1:" not in combined_output:
-            return [combined_output]
-
-        perspectives = []
-
-        parts = combined_output.split("Perspective ")
+        labels = list(_PERSPECTIVE_LABEL.finditer(combined_output))
 
-        for part in parts[1:]:
-            if ":" in part:
-                _, content = part.split(":", 1)
+        ends = [label.start() for label in labels[1:]] + [len(combined_output)]
 
-                perspectives.append(content.strip())
+        perspectives = [combined_output[label.end() : end].strip() for label, end in zip(labels, ends)]
 
         return perspectives if perspectives else [combined_output]
@@ -1,33 +1,50 @@
 """Working awareness stage for the reasoning pipeline.
 
 This stage demonstrates:
-- Parallel execution with asyncio.gather
+- Parallel execution with asyncio.as_completed
 - Multiple reasoning perspectives
 - Concurrent agent calls
+- Batched agent calls for backends that support them
 - Aggregating parallel results
 """
 
 import asyncio
 
+from dataclasses import replace
+
+from typing import Any
 from typing import List
 from typing import Optional
+from typing import Awaitable
+from typing import AsyncIterator
 
 from midori_ai_agent_base import AgentPayload
 from midori_ai_agent_base import MidoriAiAgentProtocol
 from midori_ai_logger import MidoriAiLogger
 
+from ..batching import AgentBatchCoordinator
+from ..batching.calls import supports_batch
+from ..batching.calls import call_with_retries
+from ..batching.calls import iter_batched_texts
 from ..enums import StageType
 from ..models import StageContext
 
 from .base import BaseStage
 
+from .perspectives import COMBINED_HEADER
+from .perspectives import PERSPECTIVES_KEY
+from .perspectives import PERSPECTIVE_TEMPLATES
+from .perspectives import format_perspective
+from .perspectives import combine_perspectives
+
 
 class WorkingAwarenessStage(BaseStage):
     """Working awareness stage that generates multiple reasoning perspectives.
     
     This stage demonstrates how to:
     - Execute multiple reasoning tasks in parallel
-    - Use asyncio.gather for concurrent operations
+    - Use asyncio.as_completed to handle results as soon as they arrive
+    - Bound fan-out with an asyncio.Semaphore and retry transient failures
     - Combine multiple perspectives into a coherent result
     - Handle errors in parallel execution
     
@@ -38,18 +55,29 @@ class WorkingAwarenessStage(BaseStage):
     - Detect contradictions or gaps
     """
 
-    def __init__(self, agent: MidoriAiAgentProtocol, num_perspectives: int = 3, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
+    __slots__ = ("_agent", "_num_perspectives", "_batch_size", "_semaphore", "_max_retries", "_coordinator", "_payload_template")
+
+    def __init__(self, agent: MidoriAiAgentProtocol, num_perspectives: int = 3, batch_size: int = 8, max_concurrency: int = 8, max_retries: int = 2, coordinator: Optional[AgentBatchCoordinator] = None, enabled: bool = True, logger: Optional[MidoriAiLogger] = None):
         """Initialize the working awareness stage.
         
         Args:
             agent: The agent to use for reasoning
             num_perspectives: Number of parallel reasoning perspectives to generate
+            batch_size: Maximum prompts packed into one `execute_batch` call
+            max_concurrency: Maximum agent calls (single or batched) in flight at once
+            max_retries: Retries with exponential backoff on transient errors
+            coordinator: Optional coordinator that co-batches agent calls across requests
             enabled: Whether this stage should execute
             logger: Optional logger instance
         """
         super().__init__(enabled=enabled, logger=logger)
         self._agent = agent
         self._num_perspectives = num_perspectives
+        self._batch_size = max(1, batch_size)
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._max_retries = max(0, max_retries)
+        self._coordinator = coordinator
+        self._payload_template: Optional[AgentPayload] = None
 
     @property
     def stage_type(self) -> StageType:
@@ -61,9 +89,15 @@ class WorkingAwarenessStage(BaseStage):
         
         This demonstrates:
         1. Creating multiple reasoning prompts with different angles
-        2. Using asyncio.gather to execute them in parallel
-        3. Handling errors in parallel execution
-        4. Combining results into a unified output
+        2. Running them concurrently and collecting each as it completes
+        3. Packing prompts into batched calls when the agent supports it
+        4. Handling errors in parallel execution
+        5. Combining results into a unified output
+        
+        Perspectives are numbered in completion order, so the fastest
+        perspective is always "Perspective 1". The raw perspective list is
+        also shared under `context.shared_data[PERSPECTIVES_KEY]` so later
+        stages can use it without parsing the combined text back apart.
         
         Args:
             context: Stage context with request and previous results
@@ -71,33 +105,105 @@ class WorkingAwarenessStage(BaseStage):
         Returns:
             Combined output from all reasoning perspectives
         """
-        self._logger.info(f"Generating {self._num_perspectives} reasoning perspectives in parallel")
+        self._logger.info("Generating %d reasoning perspectives in parallel", self._num_perspectives)
 
-        preprocessed_input = self._get_preprocessed_input(context)
+        valid_results = []
 
-        perspective_prompts = self._generate_perspective_prompts(preprocessed_input)
+        errors = []
 
-        self._logger.debug(f"Created {len(perspective_prompts)} perspective prompts")
+        async for result in self._iter_perspective_results(context):
+            if isinstance(result, Exception):
+                errors.append(result)
+            else:
+                valid_results.append(result)
 
-        perspective_tasks = [self._reason_from_perspective(prompt, i) for i, prompt in enumerate(perspective_prompts)]
+        if errors:
+            self._logger.warning("Some perspectives failed: %d errors", len(errors))
 
-        results = await asyncio.gather(*perspective_tasks, return_exceptions=True)
+        if not valid_results:
+            raise RuntimeError("All reasoning perspectives failed")
 
-        valid_results = [r for r in results if isinstance(r, str)]
+        self._logger.info("Successfully generated %d perspectives", len(valid_results))
 
-        errors = [r for r in results if isinstance(r, Exception)]
+        context.shared_data[PERSPECTIVES_KEY] = valid_results
 
-        if errors:
-            self._logger.warning(f"Some perspectives failed: {len(errors)} errors")
+        combined_output = combine_perspectives(valid_results)
 
-        if not valid_results:
+        return combined_output
+
+    async def stream(self, context: StageContext) -> AsyncIterator[str]:
+        """Stream the combined output chunk by chunk as perspectives complete.
+        
+        This lets a downstream consumer start on the first perspective while
+        slower ones are still in flight. Joining every chunk with "" yields
+        the same text `execute()` would return. Unlike `execute()`, this
+        bypasses the stage's timing and status reporting.
+        
+        Args:
+            context: Stage context with request and previous results
+            
+        Yields:
+            The header, then one formatted "Perspective N" chunk per success
+            
+        Raises:
+            RuntimeError: If every perspective failed
+        """
+        if not self._enabled:
+            return
+
+        streamed = []
+
+        async for result in self._iter_perspective_results(context):
+            if isinstance(result, Exception):
+                self._logger.warning("Perspective failed while streaming: %s", result)
+
+                continue
+
+            if not streamed:
+                yield COMBINED_HEADER
+
+            streamed.append(result)
+
+            yield "\n" + format_perspective(len(streamed), result)
+
+        if not streamed:
             raise RuntimeError("All reasoning perspectives failed")
 
-        self._logger.info(f"Successfully generated {len(valid_results)} perspectives")
+        context.shared_data[PERSPECTIVES_KEY] = streamed
 
-        combined_output = self._combine_perspectives(valid_results)
+    async def _iter_perspective_results(self, context: StageContext) -> AsyncIterator[str | Exception]:
+        """Run every perspective concurrently and yield results as they complete.
+        
+        Uses asyncio.as_completed so callers never wait on the slowest
+        perspective before handling the fastest one. With a coordinator,
+        perspectives are submitted individually and the coordinator does
+        the batching, together with calls from other in-flight requests.
+        
+        Args:
+            context: Stage context with request and previous results
+            
+        Yields:
+            The reasoning text for each perspective, or the exception it raised
+        """
+        preprocessed_input = self._get_preprocessed_input(context)
 
-        return combined_output
+        perspective_prompts = self._generate_perspective_prompts(preprocessed_input)
+
+        self._logger.debug("Created %d perspective prompts", len(perspective_prompts))
+
+        if self._coordinator is None and supports_batch(self._agent):
+            async for result in iter_batched_texts(self._agent, perspective_prompts, self._batch_size, self._build_payload, self._semaphore, self._max_retries, self._logger):
+                yield result
+
+            return
+
+        perspective_tasks = [self._reason_from_perspective(prompt, i) for i, prompt in enumerate(perspective_prompts)]
+
+        for next_result in asyncio.as_completed(perspective_tasks):
+            try:
+                yield await next_result
+            except Exception as e:
+                yield e
 
     def _get_preprocessed_input(self, context: StageContext) -> str:
         """Extract the preprocessed input from previous stages.
@@ -118,7 +224,8 @@ class WorkingAwarenessStage(BaseStage):
         """Generate prompts for different reasoning perspectives.
         
         This demonstrates how to create diverse reasoning approaches
-        by framing the same problem from different angles.
+        by framing the same problem from different angles. Templates are
+        sliced before formatting, so only the requested perspectives are built.
         
         Args:
             input_text: The preprocessed input to reason about
@@ -126,13 +233,9 @@ class WorkingAwarenessStage(BaseStage):
         Returns:
             List of prompts for different reasoning perspectives
         """
-        perspectives = [
-            f"Analyze this problem from a logical, step-by-step perspective:\n{input_text}",
-            f"Consider this problem from a creative, intuitive perspective:\n{input_text}",
-            f"Examine this problem critically, identifying potential issues:\n{input_text}",
-        ]
+        templates = PERSPECTIVE_TEMPLATES[: self._num_perspectives]
 
-        return perspectives[: self._num_perspectives]
+        return [template.format(input_text) for template in templates]
 
     async def _reason_from_perspective(self, prompt: str, perspective_index: int) -> str:
         """Reason from a single perspective.
@@ -147,31 +250,47 @@ class WorkingAwarenessStage(BaseStage):
         Raises:
             Exception: If reasoning fails
         """
-        self._logger.debug(f"Starting perspective {perspective_index}")
+        self._logger.debug("Starting perspective %d", perspective_index)
 
-        payload = AgentPayload(prompt=prompt, max_tokens=1000, temperature=0.7)
+        payload = self._build_payload(prompt)
 
-        response = await self._agent.execute_with_reasoning(payload)
+        response = await call_with_retries(lambda: self._submit(payload), self._semaphore, self._max_retries, f"Perspective {perspective_index}", self._logger)
 
-        self._logger.debug(f"Perspective {perspective_index} complete: {len(response.text)} chars")
+        self._logger.debug("Perspective %d complete: %d chars", perspective_index, len(response.text))
 
         return response.text
 
-    def _combine_perspectives(self, perspectives: List[str]) -> str:
-        """Combine multiple reasoning perspectives into a unified output.
+    def _submit(self, payload: AgentPayload) -> Awaitable[Any]:
+        """Start one agent call, through the batch coordinator when one is set.
         
-        This is a simple demonstration - a production system might use
-        more sophisticated synthesis techniques.
+        Args:
+            payload: The payload to execute
+            
+        Returns:
+            An awaitable resolving to the agent's response
+        """
+        if self._coordinator is not None:
+            return self._coordinator.submit(payload)
+
+        return self._agent.execute_with_reasoning(payload)
+
+    def _build_payload(self, prompt: str) -> AgentPayload:
+        """Build the payload for one perspective from the stage's template.
+        
+        The generation settings live on a single template built on first
+        use, and each perspective only swaps in its prompt. Building the
+        template lazily keeps payload errors at call time, where they are
+        reported per perspective, instead of failing stage construction.
         
         Args:
-            perspectives: List of reasoning outputs from different perspectives
+            prompt: The perspective prompt
             
         Returns:
-            Combined reasoning output
+            A payload carrying the prompt and the shared generation settings
         """
-        combined_parts = ["Multiple reasoning perspectives:"]
+        template = self._payload_template
 
-        for i, perspective in enumerate(perspectives, 1):
-            combined_parts.append(f"\nPerspective {i}:\n{perspective}")
+        if template is None:
+            template = self._payload_template = AgentPayload(prompt="", max_tokens=1000, temperature=0.7)
 
-        return "\n".join(combined_parts)
+        return replace(template, prompt=prompt)
@@ -0,0 +1,18 @@
+"""Shared test helpers for the demo test suite."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class MockResponse:
+    """Plain stand-in for an agent response."""
+
+    text: str = "Mock response from agent"
+
+
+@dataclass(frozen=True, slots=True)
+class MockRankedResult:
+    """Plain stand-in for a reranker result."""
+
+    document: str
+    score: float | None = None
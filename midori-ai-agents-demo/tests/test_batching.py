@@ -0,0 +1,86 @@
+"""Tests for cross-request agent batching."""
+
+import pytest
+import asyncio
+
+from unittest.mock import AsyncMock
+
+from midori_ai_agent_base import AgentPayload
+
+from midori_ai_agents_demo.batching import AgentBatchCoordinator
+
+from .helpers import MockResponse
+
+
+class BatchAgent:
+    """Agent stand-in that records every batched call."""
+
+    def __init__(self, fail: bool = False):
+        self.batch_sizes = []
+        self.fail = fail
+        self.execute_with_reasoning = AsyncMock()
+
+    async def execute_batch(self, payloads):
+        self.batch_sizes.append(len(payloads))
+
+        if self.fail:
+            raise ConnectionError("backend unavailable")
+
+        return [MockResponse(text=f"Batched: {payload.prompt}") for payload in payloads]
+
+
+def make_payload(prompt):
+    """Build a payload with fixed generation settings."""
+    return AgentPayload(prompt=prompt, max_tokens=100, temperature=0.5)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_batches_concurrent_submissions():
+    """Test that submissions within one window share a single batched call."""
+    agent = BatchAgent()
+
+    coordinator = AgentBatchCoordinator(agent=agent, window_seconds=0.01)
+
+    responses = await asyncio.gather(*(coordinator.submit(make_payload(f"p{i}")) for i in range(5)))
+
+    assert [response.text for response in responses] == [f"Batched: p{i}" for i in range(5)]
+    assert agent.batch_sizes == [5]
+    assert not agent.execute_with_reasoning.called
+
+
+@pytest.mark.asyncio
+async def test_coordinator_dispatches_full_batches_immediately():
+    """Test that reaching max_batch_size dispatches without waiting for the window."""
+    agent = BatchAgent()
+
+    coordinator = AgentBatchCoordinator(agent=agent, window_seconds=60.0, max_batch_size=2)
+
+    responses = await asyncio.wait_for(asyncio.gather(*(coordinator.submit(make_payload(f"p{i}")) for i in range(4))), timeout=1.0)
+
+    assert len(responses) == 4
+    assert agent.batch_sizes == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_propagates_batch_errors():
+    """Test that a failed batch raises in every caller."""
+    coordinator = AgentBatchCoordinator(agent=BatchAgent(fail=True), window_seconds=0.0)
+
+    results = await asyncio.gather(coordinator.submit(make_payload("a")), coordinator.submit(make_payload("b")), return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_falls_back_to_single_calls():
+    """Test that agents without execute_batch are called once per payload."""
+    agent = AsyncMock()
+
+    agent.execute_with_reasoning = AsyncMock(return_value=MockResponse())
+
+    coordinator = AgentBatchCoordinator(agent=agent, window_seconds=0.0)
+
+    responses = await asyncio.gather(coordinator.submit(make_payload("a")), coordinator.submit(make_payload("b")))
+
+    assert [response.text for response in responses] == ["Mock response from agent"] * 2
+    assert agent.execute_with_reasoning.call_count == 2
@@ -2,8 +2,11 @@
 
 import pytest
 
+from midori_ai_agents_demo.caching import CompactorCacheAdapter
 from midori_ai_agents_demo.caching import MemoryCache
 
+from midori_ai_compactor import CompactorCache
+
 
 @pytest.mark.asyncio
 async def test_memory_cache_get_set():
@@ -28,23 +31,21 @@ async def test_memory_cache_get_nonexistent():
 
 
 @pytest.mark.asyncio
-async def test_memory_cache_ttl():
-    """Test TTL expiration."""
-    import asyncio
-
+async def test_memory_cache_long_keys_are_hashed():
+    """Test that long keys round-trip while being stored as fixed-size digests."""
     cache = MemoryCache()
 
-    await cache.set("key1", "value1", ttl_seconds=1)
+    long_key = "prompt:" + "x" * 500
 
-    result1 = await cache.get("key1")
+    await cache.set(long_key, "value1")
 
-    assert result1 == "value1"
+    assert await cache.get(long_key) == "value1"
+    assert await cache.get(long_key + "y") is None
+    assert all(len(key) <= 64 for key in cache._cache)
 
-    await asyncio.sleep(1.1)
+    await cache.delete(long_key)
 
-    result2 = await cache.get("key1")
-
-    assert result2 is None
+    assert await cache.exists(long_key) is False
 
 
 @pytest.mark.asyncio
@@ -92,3 +93,18 @@ async def test_memory_cache_clear():
 
     assert result1 is None
     assert result2 is None
+
+
+@pytest.mark.asyncio
+async def test_compactor_cache_adapter_wraps_pipeline_cache():
+    """Test that the adapter is a CompactorCache storing into the wrapped cache."""
+    cache = MemoryCache()
+
+    adapter = CompactorCacheAdapter(cache)
+
+    assert isinstance(adapter, CompactorCache)
+
+    await adapter.set("key1", "value1")
+
+    assert await cache.get("key1") == "value1"
+    assert await adapter.get("key1") == "value1"
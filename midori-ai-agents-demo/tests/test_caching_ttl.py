@@ -0,0 +1,39 @@
+"""Tests for time-based expiration in the memory cache."""
+
+import pytest
+
+from midori_ai_agents_demo.caching import MemoryCache
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_ttl():
+    """Test TTL expiration."""
+    clock = [0.0]
+
+    cache = MemoryCache(time_fn=lambda: clock[0])
+
+    await cache.set("key1", "value1", ttl_seconds=1)
+
+    result1 = await cache.get("key1")
+
+    assert result1 == "value1"
+
+    clock[0] += 1.1
+
+    result2 = await cache.get("key1")
+
+    assert result2 is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_no_ttl_never_expires():
+    """Test that entries without a TTL survive any clock advance."""
+    clock = [0.0]
+
+    cache = MemoryCache(time_fn=lambda: clock[0])
+
+    await cache.set("key1", "value1")
+
+    clock[0] += 1_000_000.0
+
+    assert await cache.get("key1") == "value1"
@@ -8,6 +8,9 @@ from midori_ai_agents_demo import PipelineConfig
 from midori_ai_agents_demo import PipelineRequest
 from midori_ai_agents_demo import ReasoningPipeline
 
+from .helpers import MockRankedResult
+from .helpers import MockResponse
+
 
 @pytest.fixture
 def mock_agent():
@@ -16,11 +19,7 @@ def mock_agent():
 
     agent.execute_with_reasoning = AsyncMock()
 
-    mock_response = AsyncMock()
-
-    mock_response.text = "Mock response from agent"
-
-    agent.execute_with_reasoning.return_value = mock_response
+    agent.execute_with_reasoning.return_value = MockResponse()
 
     return agent
 
@@ -40,11 +39,7 @@ def mock_reranker():
     """Create a mock reranker for testing."""
     reranker = AsyncMock()
 
-    mock_result = AsyncMock()
-
-    mock_result.document = "Top ranked result"
-
-    reranker.rerank = AsyncMock(return_value=[mock_result])
+    reranker.rerank = AsyncMock(return_value=[MockRankedResult(document="Top ranked result")])
 
     return reranker
 
@@ -116,3 +111,18 @@ async def test_pipeline_tracing(mock_agent, mock_compactor, mock_reranker):
     result = await pipeline.process("Test prompt")
 
     assert "trace_id" in result.metadata
+
+
+@pytest.mark.asyncio
+async def test_pipeline_batch_process(mock_agent, mock_compactor, mock_reranker):
+    """Test that batch processing returns one response per request, in order."""
+    config = PipelineConfig(enable_preprocessing=True, enable_working_awareness=False, enable_compaction=False, enable_reranking=False, enable_metrics=False, max_concurrent_pipelines=2)
+
+    pipeline = ReasoningPipeline(agent=mock_agent, config=config, compactor=mock_compactor, reranker=mock_reranker)
+
+    prompts = ["First prompt", "Second prompt", "Third prompt"]
+
+    results = await pipeline.batch_process(prompts)
+
+    assert [result.request.prompt for result in results] == prompts
+    assert all(result.final_response for result in results)
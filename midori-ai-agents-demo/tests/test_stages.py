@@ -1,13 +1,21 @@
 """Tests for pipeline stages."""
 
 import pytest
+import asyncio
 
 from unittest.mock import AsyncMock
 
 from midori_ai_agents_demo import PipelineRequest
+from midori_ai_agents_demo import StageStatus
 from midori_ai_agents_demo import StageType
 
+from midori_ai_agents_demo.batching import AgentBatchCoordinator
+from midori_ai_agents_demo.batching import calls
+
+from midori_ai_agents_demo.caching import MemoryCache
+
 from midori_ai_agents_demo.models import StageContext
+from midori_ai_agents_demo.models import StageResult
 
 from midori_ai_agents_demo.stages import CompactionStage
 from midori_ai_agents_demo.stages import FinalResponseStage
@@ -15,6 +23,11 @@ from midori_ai_agents_demo.stages import PreprocessingStage
 from midori_ai_agents_demo.stages import RerankingStage
 from midori_ai_agents_demo.stages import WorkingAwarenessStage
 
+from midori_ai_agents_demo.stages import working_awareness
+
+from .helpers import MockRankedResult
+from .helpers import MockResponse
+
 
 @pytest.fixture
 def mock_agent():
@@ -23,11 +36,7 @@ def mock_agent():
 
     agent.execute_with_reasoning = AsyncMock()
 
-    mock_response = AsyncMock()
-
-    mock_response.text = "Mock response from agent"
-
-    agent.execute_with_reasoning.return_value = mock_response
+    agent.execute_with_reasoning.return_value = MockResponse()
 
     return agent
 
@@ -47,11 +56,7 @@ def mock_reranker():
     """Create a mock reranker for testing."""
     reranker = AsyncMock()
 
-    mock_result = AsyncMock()
-
-    mock_result.document = "Top ranked result"
-
-    reranker.rerank = AsyncMock(return_value=[mock_result])
+    reranker.rerank = AsyncMock(return_value=[MockRankedResult(document="Top ranked result")])
 
     return reranker
 
@@ -78,6 +83,36 @@ async def test_preprocessing_stage(mock_agent, sample_context):
     assert mock_agent.execute_with_reasoning.called
 
 
+def test_preprocessing_prompt_sections(mock_agent, sample_context):
+    """Test that the preprocessing prompt includes the request sections."""
+    stage = PreprocessingStage(agent=mock_agent, enabled=True)
+
+    prompt = stage._build_preprocessing_prompt(sample_context)
+
+    assert prompt.startswith("You are a preprocessing agent for a reasoning pipeline.")
+    assert "\n\nInput: Test prompt\n\nContext: Test context\n\nConstraints:\n- Constraint 1\n- Constraint 2\n\n" in prompt
+    assert prompt.endswith("easier for downstream reasoning stages to process.")
+
+
+@pytest.mark.asyncio
+async def test_preprocessing_stage_uses_cache(mock_agent, sample_context):
+    """Test that repeated requests are served from the cache."""
+    stage = PreprocessingStage(agent=mock_agent, cache=MemoryCache(), enabled=True)
+
+    first = await stage.execute(sample_context)
+
+    second = await stage.execute(sample_context)
+
+    assert first.output == second.output
+    assert mock_agent.execute_with_reasoning.call_count == 1
+
+    sample_context.cache_enabled = False
+
+    await stage.execute(sample_context)
+
+    assert mock_agent.execute_with_reasoning.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_preprocessing_stage_disabled(mock_agent, sample_context):
     """Test that disabled preprocessing stage is skipped."""
@@ -103,6 +138,105 @@ async def test_working_awareness_stage(mock_agent, sample_context):
     assert mock_agent.execute_with_reasoning.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_working_awareness_stage_builds_payload_lazily(mock_agent, sample_context, monkeypatch):
+    """Test that payload errors surface per perspective instead of at construction."""
+
+    def failing_payload(**kwargs):
+        raise TypeError("unexpected payload field")
+
+    monkeypatch.setattr(working_awareness, "AgentPayload", failing_payload)
+
+    stage = WorkingAwarenessStage(agent=mock_agent, num_perspectives=2, enabled=True)
+
+    result = await stage.execute(sample_context)
+
+    assert result.status.value == "failed"
+    assert not mock_agent.execute_with_reasoning.called
+
+
+@pytest.mark.asyncio
+async def test_working_awareness_stage_batches_calls(sample_context):
+    """Test that batch-capable agents receive perspectives in batched calls."""
+
+    class BatchAgent:
+        def __init__(self):
+            self.batch_sizes = []
+            self.execute_with_reasoning = AsyncMock()
+
+        async def execute_batch(self, payloads):
+            self.batch_sizes.append(len(payloads))
+
+            return [MockResponse(text=f"Batched: {payload.prompt[:10]}") for payload in payloads]
+
+    agent = BatchAgent()
+
+    stage = WorkingAwarenessStage(agent=agent, num_perspectives=3, batch_size=2, enabled=True)
+
+    result = await stage.execute(sample_context)
+
+    assert result.status.value == "completed"
+    assert sorted(agent.batch_sizes) == [1, 2]
+    assert result.output.count("Batched:") == 3
+    assert not agent.execute_with_reasoning.called
+
+
+@pytest.mark.asyncio
+async def test_working_awareness_stages_share_coordinator_batches(sample_context):
+    """Test that concurrent stages sharing a coordinator are co-batched."""
+
+    class BatchAgent:
+        def __init__(self):
+            self.batch_sizes = []
+
+        async def execute_batch(self, payloads):
+            self.batch_sizes.append(len(payloads))
+
+            return [MockResponse(text="Batched") for _ in payloads]
+
+    agent = BatchAgent()
+
+    coordinator = AgentBatchCoordinator(agent=agent, window_seconds=0.01)
+
+    stages = [WorkingAwarenessStage(agent=agent, num_perspectives=3, coordinator=coordinator, enabled=True) for _ in range(2)]
+
+    results = await asyncio.gather(*(stage.execute(sample_context) for stage in stages))
+
+    assert all(result.status.value == "completed" for result in results)
+    assert agent.batch_sizes == [6]
+
+
+@pytest.mark.asyncio
+async def test_working_awareness_stage_retries_transient_errors(mock_agent, sample_context, monkeypatch):
+    """Test that transient agent errors are retried under the concurrency limit."""
+    monkeypatch.setattr(calls, "RETRY_BASE_DELAY_SECONDS", 0.0)
+
+    mock_response = mock_agent.execute_with_reasoning.return_value
+
+    mock_agent.execute_with_reasoning.side_effect = [ConnectionError("reset"), mock_response, mock_response]
+
+    stage = WorkingAwarenessStage(agent=mock_agent, num_perspectives=2, max_concurrency=1, max_retries=1, enabled=True)
+
+    result = await stage.execute(sample_context)
+
+    assert result.status.value == "completed"
+    assert result.output.count("Mock response from agent") == 2
+    assert mock_agent.execute_with_reasoning.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_working_awareness_stage_stream(mock_agent, sample_context):
+    """Test that streamed chunks join into the combined stage output."""
+    stage = WorkingAwarenessStage(agent=mock_agent, num_perspectives=3, enabled=True)
+
+    chunks = [chunk async for chunk in stage.stream(sample_context)]
+
+    result = await stage.execute(sample_context)
+
+    assert len(chunks) == 4
+    assert "".join(chunks) == result.output
+
+
 @pytest.mark.asyncio
 async def test_compaction_stage(mock_compactor, sample_context):
     """Test the compaction stage."""
@@ -127,6 +261,107 @@ async def test_reranking_stage(mock_reranker, sample_context):
     assert result.status.value == "completed"
 
 
+@pytest.mark.asyncio
+async def test_reranking_stage_uses_shared_perspectives(mock_reranker, sample_context):
+    """Test that reranking prefers the perspective list shared by working awareness."""
+    sample_context.shared_data["perspectives"] = ["First", "Second"]
+
+    sample_context.previous_results.append(StageResult(stage_type=StageType.WORKING_AWARENESS, status=StageStatus.COMPLETED, output="Combined text"))
+
+    stage = RerankingStage(reranker=mock_reranker, enabled=True)
+
+    await stage.execute(sample_context)
+
+    assert mock_reranker.rerank.call_args.kwargs["documents"] == ["First", "Second"]
+
+
+def test_reranking_stage_extract_candidates_fallback(mock_reranker, sample_context):
+    """Test that other stage outputs are only used when no candidate stage produced output."""
+    stage = RerankingStage(reranker=mock_reranker, enabled=True)
+
+    sample_context.previous_results.append(StageResult(stage_type=StageType.PREPROCESSING, status=StageStatus.COMPLETED, output="Preprocessed"))
+
+    assert stage._extract_candidates(sample_context) == ["Preprocessed"]
+
+    sample_context.previous_results.append(StageResult(stage_type=StageType.COMPACTION, status=StageStatus.COMPLETED, output="Compacted"))
+
+    assert stage._extract_candidates(sample_context) == ["Compacted"]
+
+
+def test_reranking_stage_parse_perspectives(mock_reranker):
+    """Test splitting combined working awareness output into candidates."""
+    stage = RerankingStage(reranker=mock_reranker, enabled=True)
+
+    combined = "Multiple reasoning perspectives:\n\nPerspective 1:\nFirst, see Perspective 2: below\n\nPerspective 2:\nSecond"
+
+    assert stage._parse_perspectives(combined) == ["First, see Perspective 2: below", "Second"]
+    assert stage._parse_perspectives("No labels here") == ["No labels here"]
+
+
+@pytest.mark.asyncio
+async def test_reranking_stage_deduplicates_candidates(mock_reranker, sample_context):
+    """Test that duplicate candidates are only sent to the reranker once."""
+    for output in ("Same answer", "same   ANSWER", "Different answer"):
+        sample_context.previous_results.append(StageResult(stage_type=StageType.COMPACTION, status=StageStatus.COMPLETED, output=output))
+
+    stage = RerankingStage(reranker=mock_reranker, enabled=True)
+
+    result = await stage.execute(sample_context)
+
+    assert result.status.value == "completed"
+    assert mock_reranker.rerank.call_args.kwargs["documents"] == ["Same answer", "Different answer"]
+
+
+@pytest.mark.asyncio
+async def test_reranking_stage_caches_scores(sample_context):
+    """Test that cached scores skip the reranker on repeated candidates."""
+
+    async def rerank(query, documents):
+        ranked = [MockRankedResult(document=document, score=float(len(document))) for document in documents]
+
+        return sorted(ranked, key=lambda result: result.score, reverse=True)
+
+    reranker = AsyncMock()
+
+    reranker.rerank = AsyncMock(side_effect=rerank)
+
+    sample_context.previous_results.append(StageResult(stage_type=StageType.COMPACTION, status=StageStatus.COMPLETED, output="short"))
+    sample_context.previous_results.append(StageResult(stage_type=StageType.COMPACTION, status=StageStatus.COMPLETED, output="the longest candidate"))
+
+    stage = RerankingStage(reranker=reranker, cache=MemoryCache(), enabled=True)
+
+    first = await stage.execute(sample_context)
+
+    second = await stage.execute(sample_context)
+
+    assert first.output == "the longest candidate"
+    assert second.output == "the longest candidate"
+    assert reranker.rerank.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_reranking_stage_reranks_all_candidates_without_fresh_scores(sample_context):
+    """Test that a partial cache hit is not dropped when fresh results carry no scores."""
+    cache = MemoryCache()
+
+    reranker = AsyncMock()
+
+    reranker.rerank = AsyncMock(side_effect=lambda query, documents: [MockRankedResult(document=documents[0])])
+
+    sample_context.previous_results.append(StageResult(stage_type=StageType.COMPACTION, status=StageStatus.COMPLETED, output="cached best"))
+    sample_context.previous_results.append(StageResult(stage_type=StageType.COMPACTION, status=StageStatus.COMPLETED, output="fresh"))
+
+    stage = RerankingStage(reranker=reranker, cache=cache, enabled=True)
+
+    await cache.set(stage._score_cache_key("Test prompt", "cached best"), "0.9")
+
+    result = await stage.execute(sample_context)
+
+    assert result.output == "cached best"
+    assert reranker.rerank.call_count == 2
+    assert reranker.rerank.call_args.kwargs["documents"] == ["cached best", "fresh"]
+
+
 @pytest.mark.asyncio
 async def test_final_response_stage(mock_agent, sample_context):
     """Test the final response stage."""
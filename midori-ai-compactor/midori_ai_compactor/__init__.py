@@ -1,5 +1,7 @@
 """Midori AI Compactor - Flexible consolidation of multi-model reasoning outputs."""
 
+from .cache import CompactorCache
+
 from .compactor import ThinkingCompactor
 
 from .config import CompactorConfig
@@ -10,4 +12,4 @@ from .prompts import build_consolidation_prompt
 from .prompts import format_outputs_for_prompt
 
 
-__all__ = ["build_consolidation_prompt", "CompactorConfig", "DEFAULT_CONSOLIDATION_PROMPT", "format_outputs_for_prompt", "load_compactor_config", "ThinkingCompactor"]
+__all__ = ["build_consolidation_prompt", "CompactorCache", "CompactorConfig", "DEFAULT_CONSOLIDATION_PROMPT", "format_outputs_for_prompt", "load_compactor_config", "ThinkingCompactor"]
@@ -0,0 +1,24 @@
+"""Cache interface for storing consolidated compactor results."""
+
+from abc import ABC
+from abc import abstractmethod
+
+from typing import Optional
+
+
+class CompactorCache(ABC):
+    """Async key-value cache used by ThinkingCompactor to reuse consolidations.
+
+    Subclass it to back the compactor with any store. midori-ai-agents-demo
+    wraps its pipeline cache in a `CompactorCacheAdapter` subclass.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing or expired."""
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        """Store value under key, optionally expiring after ttl_seconds."""
+        ...
@@ -1,5 +1,7 @@
 """Main ThinkingCompactor class for consolidating multiple model outputs."""
 
+import hashlib
+
 from typing import Optional
 
 from midori_ai_logger import MidoriAiLogger
@@ -7,10 +9,32 @@ from midori_ai_logger import MidoriAiLogger
 from midori_ai_agent_base.models import AgentPayload
 from midori_ai_agent_base.protocol import MidoriAiAgentProtocol
 
+from .cache import CompactorCache
 from .config import CompactorConfig
 from .prompts import build_consolidation_prompt
 
 
+def _distinct_outputs(outputs: list[str]) -> list[str]:
+    """Drop outputs that duplicate an earlier one, ignoring case and whitespace.
+
+    Args:
+        outputs: List of strings from reasoning models
+
+    Returns:
+        The first occurrence of each distinct output, in the original order
+    """
+    distinct: dict[bytes, str] = {}
+
+    for output in outputs:
+        normalized = " ".join(output.casefold().split())
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+        if digest not in distinct:
+            distinct[digest] = output
+
+    return list(distinct.values())
+
+
 class ThinkingCompactor:
     """Consolidates multiple reasoning model outputs into a single message.
 
@@ -32,20 +56,32 @@ class ThinkingCompactor:
         ```
     """
 
-    def __init__(self, agent: MidoriAiAgentProtocol, config: Optional[CompactorConfig] = None) -> None:
+    __slots__ = ("_agent", "_config", "_cache", "_logger")
+
+    def __init__(self, agent: MidoriAiAgentProtocol, config: Optional[CompactorConfig] = None, cache: Optional[CompactorCache] = None) -> None:
         """Initialize the ThinkingCompactor.
 
         Args:
             agent: An instance of MidoriAiAgentProtocol to use for consolidation
             config: Optional configuration for customizing consolidation behavior
+            cache: Optional cache for reusing consolidations of identical output sets
         """
         self._agent = agent
         self._config = config if config is not None else CompactorConfig()
+        self._cache = cache
         self._logger = MidoriAiLogger(None, name="ThinkingCompactor")
 
     async def compact(self, outputs: list[str]) -> str:
         """Consolidate multiple model outputs into a single message.
 
+        Outputs that only differ in case or whitespace are merged before the
+        agent is called. If they all collapse into one, it is returned as-is
+        without an agent round-trip.
+
+        When a cache is configured, results are stored under a key derived
+        from the distinct outputs and the custom prompt, so the same set of
+        outputs is only consolidated once.
+
         Args:
             outputs: List of strings from reasoning models (any number, any language)
 
@@ -62,7 +98,26 @@ class ThinkingCompactor:
             await self._logger.print("Single output, returning as-is", mode="debug")
             return outputs[0]
 
-        prompt = build_consolidation_prompt(outputs, self._config.custom_prompt)
+        distinct_outputs = _distinct_outputs(outputs)
+
+        if len(distinct_outputs) == 1:
+            await self._logger.print("All outputs are duplicates, skipping agent call", mode="debug")
+            return distinct_outputs[0]
+
+        if len(distinct_outputs) < len(outputs):
+            await self._logger.print(f"Dropped {len(outputs) - len(distinct_outputs)} duplicate outputs", mode="debug")
+
+        cache_key: Optional[str] = None
+
+        if self._cache is not None:
+            cache_key = self._cache_key(distinct_outputs)
+            cached = await self._cache.get(cache_key)
+
+            if cached is not None:
+                await self._logger.print("Compaction served from cache", mode="debug")
+                return cached
+
+        prompt = build_consolidation_prompt(distinct_outputs, self._config.custom_prompt)
 
         payload = AgentPayload(user_message=prompt, thinking_blob="", system_context="", user_profile={}, tools_available=[], session_id="compactor-session")
 
@@ -70,4 +125,34 @@ class ThinkingCompactor:
 
         await self._logger.print(f"Compaction complete, response length: {len(response.response)}", mode="debug")
 
+        if self._cache is not None and cache_key is not None:
+            await self._cache.set(cache_key, response.response, ttl_seconds=self._config.cache_ttl_seconds)
+
         return response.response
+
+    def _cache_key(self, outputs: list[str]) -> str:
+        """Build a content-addressed cache key for a set of outputs.
+
+        The outputs are sorted so the key does not depend on the order the
+        reasoning models finished in, and the custom prompt is included so
+        different consolidation instructions never share an entry.
+
+        Args:
+            outputs: Distinct outputs that will be consolidated
+
+        Returns:
+            Hex digest identifying the outputs and prompt
+        """
+        digest = hashlib.blake2b(digest_size=32)
+
+        for output in sorted(outputs):
+            digest.update(output.encode("utf-8"))
+            digest.update(b"\0")
+
+        custom_prompt = self._config.custom_prompt
+
+        if custom_prompt is not None:
+            digest.update(b"\1")
+            digest.update(custom_prompt.encode("utf-8"))
+
+        return f"compactor:{digest.hexdigest()}"
@@ -4,8 +4,11 @@ This module looks for a `config.toml` file in this package's
 ancestor directories and returns compactor-related configuration.
 """
 
+import os
 import tomllib as _toml
 
+from functools import lru_cache
+
 from dataclasses import dataclass
 
 from pathlib import Path
@@ -13,43 +16,64 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompactorConfig:
     """Configuration for the compactor loaded from TOML.
 
     Attributes:
         custom_prompt: Optional custom prompt template for consolidation.
             Use {outputs} placeholder for the formatted outputs.
+        cache_ttl_seconds: Optional lifetime of cached consolidations when a
+            cache is passed to ThinkingCompactor. None keeps them until evicted.
     """
 
     custom_prompt: Optional[str] = None
+    cache_ttl_seconds: Optional[int] = None
 
 
 def _find_config_file(name: str = "config.toml") -> Optional[Path]:
     """Search upward from this file for a TOML config file and return its Path.
 
+    The walk is not cached here. load_compactor_config caches its result,
+    so clearing that cache also repeats the search. The walk uses plain
+    string paths with one `os.path.isfile` stat call per level, and only
+    builds a Path for the match.
+
     Returns None if no config file is found.
     """
-    here = Path(__file__).resolve()
+    directory = os.path.dirname(os.path.realpath(__file__))
+
+    while True:
+        candidate = os.path.join(directory, name)
 
-    for parent in (here, *here.parents):
-        candidate = parent / name
+        if os.path.isfile(candidate):
+            return Path(candidate)
 
-        if candidate.exists():
-            return candidate
+        parent = os.path.dirname(directory)
 
-    return None
+        if parent == directory:
+            return None
 
+        directory = parent
 
-def load_compactor_config() -> CompactorConfig:
+
+@lru_cache(maxsize=4)
+def load_compactor_config(name: str = "config.toml") -> CompactorConfig:
     """Load compactor-related config from the TOML file.
 
-    Loads settings from `[midori_ai_compactor]` section.
+    Loads settings from `[midori_ai_compactor]` section. The parsed config
+    is cached per file name, so repeated calls skip the filesystem walk and
+    the TOML parse. Call `load_compactor_config.cache_clear()` to pick up
+    changes to the file, including a file created or moved after the first
+    call.
+
+    Args:
+        name: Config file name to search for
 
     Returns:
         CompactorConfig with loaded values. Fields default to None if missing.
     """
-    path = _find_config_file()
+    path = _find_config_file(name)
 
     if path is None:
         return CompactorConfig()
@@ -65,4 +89,4 @@ def load_compactor_config() -> CompactorConfig:
     if section is None or not isinstance(section, dict):
         return CompactorConfig()
 
-    return CompactorConfig(custom_prompt=section.get("custom_prompt"))
+    return CompactorConfig(custom_prompt=section.get("custom_prompt"), cache_ttl_seconds=section.get("cache_ttl_seconds"))
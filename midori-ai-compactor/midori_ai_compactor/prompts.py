@@ -1,5 +1,9 @@
 """Consolidation prompt templates for the compactor."""
 
+from string import Formatter
+
+from functools import lru_cache
+
 
 DEFAULT_CONSOLIDATION_PROMPT = """You are an intelligent consolidation agent. Your task is to merge multiple reasoning outputs into a single, coherent, and easy-to-parse message.
 
@@ -17,6 +21,51 @@ REASONING OUTPUTS TO CONSOLIDATE:
 
 CONSOLIDATED OUTPUT:"""
 
+_DEFAULT_PREFIX, _DEFAULT_SUFFIX = DEFAULT_CONSOLIDATION_PROMPT.split("{outputs}", 1)
+
+_FORMATTER = Formatter()
+
+
+@lru_cache(maxsize=32)
+def _split_template(template: str) -> tuple[str, str] | None:
+    """Validate a custom template and split it around its `{outputs}` placeholder.
+
+    Only templates whose single `{outputs}` is their only brace can be
+    split, because any other braces carry str.format meaning (escapes or
+    additional fields) that plain concatenation would not reproduce.
+
+    Args:
+        template: Custom prompt template
+
+    Returns:
+        The (prefix, suffix) pair, or None if the template needs str.format
+
+    Raises:
+        ValueError: If the template has no `{outputs}` field, uses any other
+            field, or has unbalanced braces
+    """
+    fields = {field_name for _, field_name, _, _ in _FORMATTER.parse(template) if field_name is not None}
+
+    if "outputs" not in fields:
+        raise ValueError("Custom consolidation prompt must contain an {outputs} placeholder")
+
+    unknown_fields = sorted(fields - {"outputs"})
+
+    if unknown_fields:
+        raise ValueError(f"Custom consolidation prompt has unsupported placeholders: {unknown_fields}")
+
+    prefix, placeholder, suffix = template.partition("{outputs}")
+
+    if not placeholder:
+        return None
+
+    rest = prefix + suffix
+
+    if "{" in rest or "}" in rest:
+        return None
+
+    return prefix, suffix
+
 
 def format_outputs_for_prompt(outputs: list[str]) -> str:
     """Format a list of outputs for inclusion in the consolidation prompt.
@@ -27,12 +76,7 @@ def format_outputs_for_prompt(outputs: list[str]) -> str:
     Returns:
         Formatted string with numbered outputs
     """
-    formatted_parts: list[str] = []
-
-    for i, output in enumerate(outputs, start=1):
-        formatted_parts.append(f"--- Output {i} ---\n{output}")
-
-    return "\n\n".join(formatted_parts)
+    return "\n\n".join(f"--- Output {i} ---\n{output}" for i, output in enumerate(outputs, start=1))
 
 
 def build_consolidation_prompt(outputs: list[str], custom_prompt: str | None = None) -> str:
@@ -40,12 +84,25 @@ def build_consolidation_prompt(outputs: list[str], custom_prompt: str | None = N
 
     Args:
         outputs: List of reasoning model outputs
-        custom_prompt: Optional custom prompt template (must contain {outputs} placeholder)
+        custom_prompt: Optional custom prompt template (must contain {outputs} placeholder).
+            Templates are pre-split around their placeholder once and
+            cached, so repeated calls are plain concatenation.
 
     Returns:
         Complete prompt string ready for the agent
+
+    Raises:
+        ValueError: If the custom prompt has no `{outputs}` placeholder or
+            uses any other placeholder
     """
     formatted_outputs = format_outputs_for_prompt(outputs)
-    prompt_template = custom_prompt if custom_prompt is not None else DEFAULT_CONSOLIDATION_PROMPT
 
-    return prompt_template.format(outputs=formatted_outputs)
+    if custom_prompt is None:
+        return _DEFAULT_PREFIX + formatted_outputs + _DEFAULT_SUFFIX
+
+    parts = _split_template(custom_prompt)
+
+    if parts is None:
+        return custom_prompt.format(outputs=formatted_outputs)
+
+    return parts[0] + formatted_outputs + parts[1]
@@ -6,6 +6,9 @@ from unittest.mock import patch
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
+from midori_ai_agent_base.models import AgentResponse
+
+from midori_ai_compactor import CompactorCache
 from midori_ai_compactor import ThinkingCompactor
 from midori_ai_compactor import CompactorConfig
 from midori_ai_compactor import load_compactor_config
@@ -14,21 +17,47 @@ from midori_ai_compactor import build_consolidation_prompt
 from midori_ai_compactor import format_outputs_for_prompt
 
 
+class DictCache(CompactorCache):
+    """Minimal in-memory CompactorCache for tests."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> None:
+        self.values[key] = value
+        self.ttls[key] = ttl_seconds
+
+
 class TestCompactorConfig:
     """Tests for CompactorConfig dataclass."""
 
     def test_default_values(self) -> None:
         config = CompactorConfig()
         assert config.custom_prompt is None
+        assert config.cache_ttl_seconds is None
 
     def test_custom_prompt(self) -> None:
         config = CompactorConfig(custom_prompt="Custom: {outputs}")
         assert config.custom_prompt == "Custom: {outputs}"
 
+    def test_frozen_and_slotted(self) -> None:
+        config = CompactorConfig(custom_prompt="Custom: {outputs}")
+        assert not hasattr(config, "__dict__")
+        assert hash(config) == hash(CompactorConfig(custom_prompt="Custom: {outputs}"))
+        with pytest.raises(AttributeError):
+            config.custom_prompt = "Other"  # type: ignore[misc]
+
 
 class TestLoadCompactorConfig:
     """Tests for load_compactor_config function."""
 
+    def setup_method(self) -> None:
+        load_compactor_config.cache_clear()
+
     def test_returns_default_when_no_file(self) -> None:
         with patch("midori_ai_compactor.config._find_config_file", return_value=None):
             config = load_compactor_config()
@@ -43,6 +72,32 @@ class TestLoadCompactorConfig:
                 config = load_compactor_config()
                 assert config.custom_prompt is None
 
+    def test_caches_parsed_config(self) -> None:
+        mock_path = MagicMock()
+        mock_path.open = MagicMock()
+
+        with patch("midori_ai_compactor.config._find_config_file", return_value=mock_path):
+            with patch("midori_ai_compactor.config._toml.load", return_value={"midori_ai_compactor": {"custom_prompt": "P: {outputs}"}}) as mock_load:
+                first = load_compactor_config()
+                second = load_compactor_config()
+
+        assert first is second
+        assert first.custom_prompt == "P: {outputs}"
+        assert mock_load.call_count == 1
+
+    def test_cache_clear_repeats_file_search(self) -> None:
+        mock_path = MagicMock()
+        mock_path.open = MagicMock()
+
+        with patch("midori_ai_compactor.config._find_config_file", side_effect=[None, mock_path]):
+            with patch("midori_ai_compactor.config._toml.load", return_value={"midori_ai_compactor": {"custom_prompt": "P: {outputs}"}}):
+                first = load_compactor_config()
+                load_compactor_config.cache_clear()
+                second = load_compactor_config()
+
+        assert first.custom_prompt is None
+        assert second.custom_prompt == "P: {outputs}"
+
 
 class TestPromptFormatting:
     """Tests for prompt formatting functions."""
@@ -84,6 +139,11 @@ class TestPromptFormatting:
         assert "--- Output 2 ---" in result
         assert "REASONING OUTPUTS TO CONSOLIDATE:" in result
 
+    def test_build_consolidation_prompt_default_matches_format(self) -> None:
+        outputs = ["Output 1", "Output 2"]
+        expected = DEFAULT_CONSOLIDATION_PROMPT.format(outputs=format_outputs_for_prompt(outputs))
+        assert build_consolidation_prompt(outputs) == expected
+
     def test_build_consolidation_prompt_custom(self) -> None:
         outputs = ["Output 1", "Output 2"]
         custom = "Merge these:\n{outputs}\nDone."
@@ -93,6 +153,21 @@ class TestPromptFormatting:
         assert "Done." in result
         assert "REASONING OUTPUTS TO CONSOLIDATE:" not in result
 
+    def test_build_consolidation_prompt_custom_with_escaped_braces(self) -> None:
+        outputs = ["Output 1"]
+        custom = "Reply as {{json}}:\n{outputs}"
+        result = build_consolidation_prompt(outputs, custom)
+        assert result == custom.format(outputs=format_outputs_for_prompt(outputs))
+        assert result.startswith("Reply as {json}:")
+
+    def test_build_consolidation_prompt_requires_outputs_placeholder(self) -> None:
+        with pytest.raises(ValueError, match="outputs"):
+            build_consolidation_prompt(["Output 1"], "Merge these please.")
+
+    def test_build_consolidation_prompt_rejects_unknown_placeholders(self) -> None:
+        with pytest.raises(ValueError, match="name"):
+            build_consolidation_prompt(["Output 1"], "Hi {name}:\n{outputs}")
+
 
 class TestDefaultPrompt:
     """Tests for the default consolidation prompt."""
@@ -157,10 +232,89 @@ class TestThinkingCompactorCompact:
             assert result == "Single output"
             mock_agent.invoke.assert_not_called()
 
+    async def test_compact_identical_outputs_skips_agent(self) -> None:
+        mock_agent = MagicMock()
+        mock_agent.invoke = AsyncMock()
+
+        with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
+            mock_logger = MagicMock()
+            mock_logger.print = AsyncMock()
+            mock_logger_class.return_value = mock_logger
+
+            compactor = ThinkingCompactor(agent=mock_agent)
+            result = await compactor.compact(["Same  answer", "same answer", "Same answer\n", "SAME ANSWER"])
+
+            assert result == "Same  answer"
+            mock_agent.invoke.assert_not_called()
+
+    async def test_compact_duplicates_use_case_folding(self) -> None:
+        mock_agent = MagicMock()
+        mock_agent.invoke = AsyncMock()
+
+        with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
+            mock_logger = MagicMock()
+            mock_logger.print = AsyncMock()
+            mock_logger_class.return_value = mock_logger
+
+            compactor = ThinkingCompactor(agent=mock_agent)
+            result = await compactor.compact(["Die Straße", "DIE STRASSE"])
+
+            assert result == "Die Straße"
+            mock_agent.invoke.assert_not_called()
+
+    async def test_compact_drops_duplicate_outputs(self) -> None:
+        mock_agent = MagicMock()
+        mock_response = AgentResponse(thinking="", response="Consolidated result")
+        mock_agent.invoke = AsyncMock(return_value=mock_response)
+
+        with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
+            mock_logger = MagicMock()
+            mock_logger.print = AsyncMock()
+            mock_logger_class.return_value = mock_logger
+
+            compactor = ThinkingCompactor(agent=mock_agent)
+            result = await compactor.compact(["Output A", "output a", "Output B"])
+
+            assert result == "Consolidated result"
+            payload = mock_agent.invoke.call_args[0][0]
+            assert "--- Output 2 ---\nOutput B" in payload.user_message
+            assert "--- Output 3 ---" not in payload.user_message
+
+    async def test_compact_uses_cache(self) -> None:
+        mock_agent = MagicMock()
+        mock_response = AgentResponse(thinking="", response="Cached result")
+        mock_agent.invoke = AsyncMock(return_value=mock_response)
+        cache = DictCache()
+        config = CompactorConfig(cache_ttl_seconds=60)
+
+        with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
+            mock_logger = MagicMock()
+            mock_logger.print = AsyncMock()
+            mock_logger_class.return_value = mock_logger
+
+            compactor = ThinkingCompactor(agent=mock_agent, config=config, cache=cache)
+            first = await compactor.compact(["Output A", "Output B"])
+            second = await compactor.compact(["Output B", "Output A"])
+
+            assert first == "Cached result"
+            assert second == "Cached result"
+            mock_agent.invoke.assert_called_once()
+            assert list(cache.ttls.values()) == [60]
+
+    async def test_compact_cache_key_includes_custom_prompt(self) -> None:
+        mock_agent = MagicMock()
+        cache = DictCache()
+
+        with patch("midori_ai_compactor.compactor.MidoriAiLogger"):
+            default_compactor = ThinkingCompactor(agent=mock_agent, cache=cache)
+            custom_compactor = ThinkingCompactor(agent=mock_agent, config=CompactorConfig(custom_prompt="Merge:\n{outputs}"), cache=cache)
+
+            outputs = ["Output A", "Output B"]
+            assert default_compactor._cache_key(outputs) != custom_compactor._cache_key(outputs)
+
     async def test_compact_two_outputs(self) -> None:
         mock_agent = MagicMock()
-        mock_response = MagicMock()
-        mock_response.response = "Consolidated result"
+        mock_response = AgentResponse(thinking="", response="Consolidated result")
         mock_agent.invoke = AsyncMock(return_value=mock_response)
 
         with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
@@ -176,8 +330,7 @@ class TestThinkingCompactorCompact:
 
     async def test_compact_four_outputs(self) -> None:
         mock_agent = MagicMock()
-        mock_response = MagicMock()
-        mock_response.response = "Four outputs consolidated"
+        mock_response = AgentResponse(thinking="", response="Four outputs consolidated")
         mock_agent.invoke = AsyncMock(return_value=mock_response)
 
         with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
@@ -198,8 +351,7 @@ class TestThinkingCompactorCompact:
 
     async def test_compact_many_outputs(self) -> None:
         mock_agent = MagicMock()
-        mock_response = MagicMock()
-        mock_response.response = "Many outputs consolidated"
+        mock_response = AgentResponse(thinking="", response="Many outputs consolidated")
         mock_agent.invoke = AsyncMock(return_value=mock_response)
 
         with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
@@ -216,8 +368,7 @@ class TestThinkingCompactorCompact:
 
     async def test_compact_mixed_languages(self) -> None:
         mock_agent = MagicMock()
-        mock_response = MagicMock()
-        mock_response.response = "Multilingual consolidated"
+        mock_response = AgentResponse(thinking="", response="Multilingual consolidated")
         mock_agent.invoke = AsyncMock(return_value=mock_response)
 
         with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
@@ -238,8 +389,7 @@ class TestThinkingCompactorCompact:
 
     async def test_compact_with_custom_prompt(self) -> None:
         mock_agent = MagicMock()
-        mock_response = MagicMock()
-        mock_response.response = "Custom prompt result"
+        mock_response = AgentResponse(thinking="", response="Custom prompt result")
         mock_agent.invoke = AsyncMock(return_value=mock_response)
         config = CompactorConfig(custom_prompt="Merge:\n{outputs}\nEnd.")
 
@@ -259,8 +409,7 @@ class TestThinkingCompactorCompact:
 
     async def test_compact_payload_structure(self) -> None:
         mock_agent = MagicMock()
-        mock_response = MagicMock()
-        mock_response.response = "Result"
+        mock_response = AgentResponse(thinking="", response="Result")
         mock_agent.invoke = AsyncMock(return_value=mock_response)
 
         with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
@@ -287,8 +436,7 @@ class TestThinkingCompactorLogging:
 
     async def test_compact_logs_debug_messages(self) -> None:
         mock_agent = MagicMock()
-        mock_response = MagicMock()
-        mock_response.response = "Result"
+        mock_response = AgentResponse(thinking="", response="Result")
         mock_agent.invoke = AsyncMock(return_value=mock_response)
 
         with patch("midori_ai_compactor.compactor.MidoriAiLogger") as mock_logger_class:
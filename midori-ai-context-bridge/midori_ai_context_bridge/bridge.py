@@ -4,6 +4,8 @@ This module provides the primary interface for storing and retrieving
 reasoning data with time-based memory decay.
 """
 
+import time
+
 from typing import Optional
 
 from midori_ai_logger import MidoriAiLogger
@@ -22,6 +24,8 @@ from .storage import ReasoningEntry
 
 _logger = MidoriAiLogger(None, name="ContextBridge")
 
+_STATS_LIMIT_PER_TYPE = 100
+
 
 class ContextBridge:
     """Persistent thinking cache with ChromaDB storage and time-based decay.
@@ -60,7 +64,7 @@ class ContextBridge:
         self._config = config or BridgeConfig(max_tokens_per_summary=max_tokens_per_summary)
         self._storage = ChromaStorage(collection_name=self._config.chroma_collection_name, persist_directory=persist_directory)
         self._compressor = create_compressor(max_tokens=self._config.max_tokens_per_summary)
-        self._corruptors = {ModelType.PREPROCESSING: MemoryCorruptor(self._config.get_decay_config(ModelType.PREPROCESSING)), ModelType.WORKING_AWARENESS: MemoryCorruptor(self._config.get_decay_config(ModelType.WORKING_AWARENESS))}
+        self._corruptors = {model_type: MemoryCorruptor(self._config.get_decay_config(model_type)) for model_type in ModelType}
 
     @property
     def config(self) -> BridgeConfig:
@@ -109,6 +113,9 @@ class ContextBridge:
 
         Retrieves stored reasoning, applies time-based corruption,
         removes expired entries, and returns compressed context.
+        Expired entries are found first; surviving entries are then
+        corrupted lazily as the compressor consumes them, so entries past
+        the token budget are never corrupted.
 
         Args:
             session_id: Session identifier
@@ -122,35 +129,39 @@ class ContextBridge:
         if not entries:
             return ""
         corruptor = self.get_corruptor(model_type)
+        should_remove = corruptor.should_remove
         entries_to_remove = []
-        processed_texts = []
+        surviving = []
+        now = time.time()
         for entry in entries:
-            age = entry.age_minutes
-            corrupted, should_remove = corruptor.process_text(entry.text, age)
-            if should_remove:
+            age = entry.age_minutes_at(now)
+            if should_remove(age):
                 entries_to_remove.append(entry.id)
-                await _logger.print(f"Marking entry {entry.id} for removal (age={age:.1f}m)", mode="debug")
-            elif corrupted and include_corrupted:
-                processed_texts.append(corrupted)
+            else:
+                surviving.append((entry.text, age))
         if entries_to_remove:
             await self._storage.delete_entries(entries_to_remove)
             await _logger.print(f"Removed {len(entries_to_remove)} expired entries", mode="debug")
-        if not processed_texts:
+        if not include_corrupted or not surviving:
             return ""
-        return await self._compressor.compress(processed_texts)
+        corrupt_text = corruptor.corrupt_text
+        corrupted_texts = (corrupted for corrupted in (corrupt_text(text, age) for text, age in surviving) if corrupted)
+        return self._compressor.compress(corrupted_texts)
 
     async def cleanup_expired(self) -> int:
         """Clean up all expired entries across all sessions.
 
+        Expired IDs are handed to storage in one call, which splits large
+        deletes into concurrent chunks.
+
         Returns:
             Number of entries removed
         """
         all_entries = await self._storage.get_all_entries()
-        entries_to_remove = []
-        for entry in all_entries:
-            corruptor = self.get_corruptor(entry.model_type)
-            if corruptor.should_remove(entry.age_minutes):
-                entries_to_remove.append(entry.id)
+        preprocessing_should_remove = self._corruptors[ModelType.PREPROCESSING].should_remove_seconds
+        working_should_remove = self._corruptors[ModelType.WORKING_AWARENESS].should_remove_seconds
+        now = time.time()
+        entries_to_remove = [entry.id for entry in all_entries if (preprocessing_should_remove if entry.model_type is ModelType.PREPROCESSING else working_should_remove)(now - entry.timestamp)]
         if entries_to_remove:
             await self._storage.delete_entries(entries_to_remove)
             await _logger.print(f"Cleanup removed {len(entries_to_remove)} expired entries", mode="debug")
@@ -159,19 +170,41 @@ class ContextBridge:
     async def get_session_stats(self, session_id: str) -> dict:
         """Get statistics for a session's stored reasoning.
 
+        Both model types are read with a single storage query capped at
+        200 entries, the combined size of the two 100-entry per-type
+        windows. If that query fills its cap, one type may have crowded
+        out the other, so each type is re-read with its own 100-entry
+        window instead. Either way, entries past a type's first 100 are
+        skipped, so each type is counted over the same 100-entry window.
+
         Args:
             session_id: Session identifier
 
         Returns:
             Dict with counts and age statistics
         """
-        preprocessing_entries = await self._storage.get_entries_for_session(session_id, ModelType.PREPROCESSING)
-        working_entries = await self._storage.get_entries_for_session(session_id, ModelType.WORKING_AWARENESS)
-        preprocessing_count = len(preprocessing_entries)
-        working_awareness_count = len(working_entries)
+        combined_limit = _STATS_LIMIT_PER_TYPE * len(ModelType)
+        entries = await self._storage.get_entries_for_session(session_id, limit=combined_limit)
+        if len(entries) >= combined_limit:
+            entries = []
+            for model_type in ModelType:
+                entries.extend(await self._storage.get_entries_for_session(session_id, model_type, limit=_STATS_LIMIT_PER_TYPE))
+        counts = {ModelType.PREPROCESSING: 0, ModelType.WORKING_AWARENESS: 0}
+        min_ages: dict[ModelType, float] = {}
+        now = time.time()
+        for entry in entries:
+            model_type = entry.model_type
+            if counts[model_type] >= _STATS_LIMIT_PER_TYPE:
+                continue
+            age = entry.age_minutes_at(now)
+            counts[model_type] += 1
+            if model_type not in min_ages or age < min_ages[model_type]:
+                min_ages[model_type] = age
+        preprocessing_count = counts[ModelType.PREPROCESSING]
+        working_awareness_count = counts[ModelType.WORKING_AWARENESS]
         total_count = preprocessing_count + working_awareness_count
-        oldest_preprocessing_age = min((e.age_minutes for e in preprocessing_entries), default=0)
-        oldest_working_age = min((e.age_minutes for e in working_entries), default=0)
+        oldest_preprocessing_age = min_ages.get(ModelType.PREPROCESSING, 0)
+        oldest_working_age = min_ages.get(ModelType.WORKING_AWARENESS, 0)
         return {"session_id": session_id, "preprocessing_count": preprocessing_count, "working_awareness_count": working_awareness_count, "total_count": total_count, "oldest_preprocessing_age_minutes": oldest_preprocessing_age, "oldest_working_age_minutes": oldest_working_age}
 
     async def clear_session(self, session_id: str) -> int:
@@ -4,6 +4,7 @@ This module provides utilities for summarizing reasoning
 data before injection into new prompts.
 """
 
+from typing import Iterable
 from typing import Optional
 
 
@@ -21,35 +22,44 @@ class ContextCompressor:
             max_tokens: Maximum tokens for the compressed output
         """
         self._max_tokens = max_tokens
+        self._max_chars = max_tokens << 2
 
     @property
     def max_tokens(self) -> int:
         """Return the maximum token limit."""
         return self._max_tokens
 
-    async def compress(self, texts: list[str], separator: str = "\n\n---\n\n") -> str:
+    def compress(self, texts: Iterable[str], separator: str = "\n\n---\n\n") -> str:
         """Compress multiple reasoning texts into a summary.
 
         This is a simple implementation that truncates to fit the
         token limit. In production, this could use an LLM for
-        intelligent summarization.
+        intelligent summarization. It does no I/O, so it is a plain
+        synchronous method. Texts are appended only until the character
+        budget is reached, so oversized input is never joined in full.
+        Any iterable is accepted; a generator is only consumed up to the
+        text that exhausts the budget.
 
         Args:
-            texts: List of reasoning texts to compress
+            texts: Reasoning texts to compress
             separator: Separator between texts
 
         Returns:
             Compressed summary string
         """
-        if not texts:
-            return ""
-        combined = separator.join(texts)
-        estimated_chars = self._max_tokens * 4
-        if len(combined) > estimated_chars:
-            combined = combined[:estimated_chars] + "..."
-        return combined
-
-    async def compress_with_labels(self, labeled_texts: list[tuple[str, str]], separator: str = "\n\n") -> str:
+        budget = self._max_chars
+        parts: list[str] = []
+        used = 0
+        for i, text in enumerate(texts):
+            piece = separator + text if i else text
+            if used + len(piece) > budget:
+                parts.append(piece[: budget - used])
+                return "".join(parts) + "..."
+            parts.append(piece)
+            used += len(piece)
+        return "".join(parts)
+
+    def compress_with_labels(self, labeled_texts: list[tuple[str, str]], separator: str = "\n\n") -> str:
         """Compress texts with labels for context.
 
         Args:
@@ -59,17 +69,14 @@ class ContextCompressor:
         Returns:
             Compressed summary with labels
         """
-        if not labeled_texts:
-            return ""
-        lines = []
-        for label, text in labeled_texts:
-            lines.append(f"[{label}]\n{text}")
-        return await self.compress(lines, separator)
-
-    def estimate_tokens(self, text: str) -> int:
+        return self.compress((f"[{label}]\n{text}" for label, text in labeled_texts), separator)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
         """Estimate token count for text.
 
-        Uses simple character-based estimation (4 chars ≈ 1 token).
+        Uses simple character-based estimation (4 chars ≈ 1 token). The
+        ratio is a power of two, so the estimate is a right shift.
 
         Args:
             text: Text to estimate
@@ -77,7 +84,7 @@ class ContextCompressor:
         Returns:
             Estimated token count
         """
-        return len(text) // 4
+        return len(text) >> 2
 
 
 def create_compressor(max_tokens: Optional[int] = None) -> ContextCompressor:
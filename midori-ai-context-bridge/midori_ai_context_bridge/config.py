@@ -4,6 +4,7 @@ This module defines decay configuration and model types for
 time-based memory corruption.
 """
 
+from dataclasses import field
 from dataclasses import dataclass
 
 from enum import Enum
@@ -22,24 +23,36 @@ class ModelType(Enum):
     WORKING_AWARENESS = "working_awareness"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DecayConfig:
     """Configuration for time-based memory decay.
 
+    The config is frozen so the thresholds derived at construction always
+    match decay_minutes and removal_multiplier. Build a new config (for
+    example with dataclasses.replace) to change the decay window.
+
     Attributes:
         decay_minutes: Minutes before corruption begins
         removal_multiplier: Multiplier for decay_minutes to get removal threshold
         corruption_intensity: Maximum corruption intensity (0.0 to 1.0)
+        removal_minutes: Removal threshold in minutes, derived at construction
+        removal_seconds: Removal threshold in seconds, derived at construction
     """
 
     decay_minutes: int
     removal_multiplier: float = 3.0
     corruption_intensity: float = 0.3
+    removal_minutes: float = field(init=False)
+    removal_seconds: float = field(init=False)
+    _inv_time_range: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def removal_minutes(self) -> float:
-        """Return the removal threshold in minutes."""
-        return self.decay_minutes * self.removal_multiplier
+    def __post_init__(self) -> None:
+        """Precompute the removal thresholds and inverse decay window."""
+        removal_minutes = self.decay_minutes * self.removal_multiplier
+        time_range = removal_minutes - self.decay_minutes
+        object.__setattr__(self, "removal_minutes", removal_minutes)
+        object.__setattr__(self, "removal_seconds", removal_minutes * 60.0)
+        object.__setattr__(self, "_inv_time_range", 1.0 / time_range if time_range > 0 else 0.0)
 
 
 DEFAULT_DECAY_CONFIGS = {
@@ -48,7 +61,7 @@ DEFAULT_DECAY_CONFIGS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeConfig:
     """Configuration for the ContextBridge.
 
@@ -80,6 +93,6 @@ class BridgeConfig:
         Returns:
             DecayConfig for the specified model type
         """
-        if model_type == ModelType.PREPROCESSING:
+        if model_type is ModelType.PREPROCESSING:
             return self.preprocessing_decay or DEFAULT_DECAY_CONFIGS[ModelType.PREPROCESSING]
         return self.working_awareness_decay or DEFAULT_DECAY_CONFIGS[ModelType.WORKING_AWARENESS]
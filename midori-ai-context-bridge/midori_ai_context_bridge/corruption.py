@@ -4,7 +4,7 @@ This module implements gradual memory degradation based on age.
 Older data gets increasingly corrupted before eventual removal.
 """
 
-import random
+import numpy as np
 
 from typing import Optional
 from typing import Tuple
@@ -12,6 +12,11 @@ from typing import Tuple
 from .config import DecayConfig
 
 
+_REPLACEMENT_CODES = np.frombuffer("abcdefghijklmnopqrstuvwxyz ".encode("utf-32-le"), dtype=np.uint32)
+
+_SPARSE_CORRUPTION_RATE = 0.1
+
+
 class MemoryCorruptor:
     """Applies time-based corruption to stored reasoning text.
 
@@ -29,7 +34,7 @@ class MemoryCorruptor:
             seed: Optional random seed for reproducible corruption
         """
         self._config = decay_config
-        self._rng = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
 
     @property
     def decay_minutes(self) -> int:
@@ -50,17 +55,29 @@ class MemoryCorruptor:
         Returns:
             Severity value between 0.0 (no corruption) and 1.0 (max corruption)
         """
-        if age_minutes < self._config.decay_minutes:
+        decay_minutes = self._config.decay_minutes
+        if age_minutes < decay_minutes:
             return 0.0
-        time_range = self._config.removal_minutes - self._config.decay_minutes
-        if time_range <= 0:
+        inv_time_range = self._config._inv_time_range
+        if inv_time_range == 0.0:
             return 1.0
-        severity = (age_minutes - self._config.decay_minutes) / time_range
+        severity = (age_minutes - decay_minutes) * inv_time_range
         return min(1.0, max(0.0, severity))
 
     def corrupt_text(self, text: str, age_minutes: float) -> str:
         """Apply corruption based on age.
 
+        Each character is independently corrupted with probability
+        severity * corruption_intensity; a corrupted character is either
+        removed or replaced by a random letter or space, with equal odds.
+        The draws are vectorized over the text's code points (UTF-32), so
+        any Unicode text is handled without a per-character Python loop.
+        Below a 10% rate, the number of corrupted characters is drawn from
+        the equivalent binomial distribution and only those positions are
+        sampled, so lightly aged text costs O(corrupted) random draws.
+        Text at or past the removal threshold is returned as an empty string
+        without drawing anything.
+
         Args:
             text: Original text to potentially corrupt
             age_minutes: Age of the data in minutes
@@ -68,20 +85,30 @@ class MemoryCorruptor:
         Returns:
             Corrupted text with random character modifications/removals
         """
+        if age_minutes >= self._config.removal_minutes:
+            return ""
         severity = self.calculate_severity(age_minutes)
         if severity <= 0.0:
             return text
         corruption_rate = severity * self._config.corruption_intensity
-        corrupted_chars = []
-        for char in text:
-            if self._rng.random() < corruption_rate:
-                if self._rng.random() < 0.5:
-                    continue
-                else:
-                    corrupted_chars.append(self._rng.choice("abcdefghijklmnopqrstuvwxyz "))
-            else:
-                corrupted_chars.append(char)
-        return "".join(corrupted_chars)
+        n = len(text)
+        if corruption_rate < _SPARSE_CORRUPTION_RATE:
+            corrupted_count = int(self._rng.binomial(n, corruption_rate))
+            if corrupted_count == 0:
+                return text
+            positions = self._rng.choice(n, size=corrupted_count, replace=False)
+            delete_draws = self._rng.random(corrupted_count) < 0.5
+            replaced = positions[~delete_draws]
+            deleted = positions[delete_draws]
+            replace_count = len(replaced)
+        else:
+            corrupt_mask = self._rng.random(n) < corruption_rate
+            deleted = corrupt_mask & (self._rng.random(n) < 0.5)
+            replaced = corrupt_mask & ~deleted
+            replace_count = int(replaced.sum())
+        codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32).copy()
+        codes[replaced] = _REPLACEMENT_CODES[self._rng.integers(_REPLACEMENT_CODES.size, size=replace_count)]
+        return np.delete(codes, deleted).tobytes().decode("utf-32-le", "surrogatepass")
 
     def should_remove(self, age_minutes: float) -> bool:
         """Check if data should be permanently removed.
@@ -94,6 +121,20 @@ class MemoryCorruptor:
         """
         return age_minutes >= self._config.removal_minutes
 
+    def should_remove_seconds(self, age_seconds: float) -> bool:
+        """Check if data should be permanently removed, given its age in seconds.
+
+        Sweeps that already hold raw timestamps can compare the elapsed
+        seconds directly and skip the conversion to minutes.
+
+        Args:
+            age_seconds: Age of the data in seconds
+
+        Returns:
+            True if data is old enough to remove
+        """
+        return age_seconds >= self._config.removal_seconds
+
     def process_text(self, text: str, age_minutes: float) -> Tuple[str | None, bool]:
         """Process text with corruption and removal logic.
 
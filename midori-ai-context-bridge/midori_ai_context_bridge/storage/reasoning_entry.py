@@ -5,28 +5,41 @@ with reasoning-specific fields and behavior.
 """
 
 import time
+import operator
 
 from typing import Any
 from typing import Optional
 
-from pydantic import BaseModel
-from pydantic import Field
+from dataclasses import field
+from dataclasses import dataclass
+
+from functools import reduce
 
 from midori_ai_vector_manager import VectorEntry
 
 from ..config import ModelType
 
 
-class ReasoningEntry(BaseModel):
+@dataclass(slots=True)
+class ReasoningEntry:
     """Extended entry with reasoning-specific fields and multiple vector entries.
 
     Attributes:
         model_type: Type of model (preprocessing or working_awareness)
         entries: List of vector entries for flexibility
+
+    The oldest entry timestamp is cached at construction and kept current
+    by add_entry, so entries should be added through add_entry rather than
+    by mutating the list directly.
     """
 
     model_type: ModelType
-    entries: list[VectorEntry] = Field(default_factory=list)
+    entries: list[VectorEntry] = field(default_factory=list)
+    _oldest_ts: Optional[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the oldest timestamp of the initial entries."""
+        self._oldest_ts = min((e.timestamp for e in self.entries), default=None)
 
     def add_entry(self, entry: VectorEntry) -> None:
         """Add a vector entry to this reasoning context.
@@ -35,6 +48,8 @@ class ReasoningEntry(BaseModel):
             entry: VectorEntry to add
         """
         self.entries.append(entry)
+        if self._oldest_ts is None or entry.timestamp < self._oldest_ts:
+            self._oldest_ts = entry.timestamp
 
     def get_entries(self) -> list[VectorEntry]:
         """Get all vector entries.
@@ -51,10 +66,24 @@ class ReasoningEntry(BaseModel):
         Returns:
             Age in minutes, 0.0 if no entries
         """
-        if not self.entries:
+        return self.age_minutes_at(time.time())
+
+    def age_minutes_at(self, now: float) -> float:
+        """Return age of oldest entry in minutes relative to a given time.
+
+        Loops over many entries can read the clock once and pass it here,
+        so every entry is aged against the same instant.
+
+        Args:
+            now: Reference time as a Unix timestamp
+
+        Returns:
+            Age in minutes, 0.0 if no entries
+        """
+        oldest = self._oldest_ts
+        if oldest is None:
             return 0.0
-        oldest = min(e.timestamp for e in self.entries)
-        return (time.time() - oldest) / 60.0
+        return (now - oldest) / 60.0
 
     @property
     def id(self) -> Optional[str]:
@@ -83,7 +112,10 @@ class ReasoningEntry(BaseModel):
         Returns:
             Combined text from all entries
         """
-        return " ".join(e.text for e in self.entries)
+        entries = self.entries
+        if len(entries) == 1:
+            return entries[0].text
+        return " ".join([e.text for e in entries])
 
     @property
     def timestamp(self) -> float:
@@ -92,18 +124,20 @@ class ReasoningEntry(BaseModel):
         Returns:
             Timestamp of oldest entry, 0.0 if no entries
         """
-        if not self.entries:
-            return 0.0
-        return min(e.timestamp for e in self.entries)
+        oldest = self._oldest_ts
+        return 0.0 if oldest is None else oldest
 
     @property
     def metadata(self) -> dict[str, Any]:
         """Return combined metadata from all entries.
 
+        A single-entry wrapper returns that entry's metadata dict itself
+        rather than a merged copy.
+
         Returns:
             Merged metadata from all entries
         """
-        combined: dict[str, Any] = {}
-        for entry in self.entries:
-            combined.update(entry.metadata)
-        return combined
+        entries = self.entries
+        if len(entries) == 1:
+            return entries[0].metadata
+        return reduce(operator.ior, (e.metadata for e in entries), {})
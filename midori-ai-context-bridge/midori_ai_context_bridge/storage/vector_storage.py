@@ -4,9 +4,14 @@ This module provides a wrapper around ChromaVectorStore that maintains
 the context-bridge API while using vector-manager for storage.
 """
 
+import asyncio
+
 from typing import Any
 from typing import Optional
 
+from functools import lru_cache
+
+from midori_ai_vector_manager import VectorEntry
 from midori_ai_vector_manager import ChromaVectorStore
 
 from ..config import ModelType
@@ -14,6 +19,30 @@ from ..config import ModelType
 from .reasoning_entry import ReasoningEntry
 
 
+_MODEL_TYPE_CACHE = {model_type.value: model_type for model_type in ModelType}
+
+_DELETE_CHUNK_SIZE = 1000
+
+
+@lru_cache(maxsize=256)
+def _session_filter(session_id: str, model_type_value: Optional[str]) -> dict[str, Any]:
+    """Return the shared query filter for a session and optional model type.
+
+    Repeated queries for the same session reuse one dict. The vector stores
+    only read their filters, so the cached dict is never mutated.
+
+    Args:
+        session_id: Session identifier to filter by
+        model_type_value: Optional model type value to filter by
+
+    Returns:
+        Metadata filter dict for the vector store query
+    """
+    if model_type_value is None:
+        return {"session_id": session_id}
+    return {"session_id": session_id, "model_type": model_type_value}
+
+
 class ChromaStorage:
     """ChromaDB-based storage for reasoning data using vector-manager.
 
@@ -62,10 +91,25 @@ class ChromaStorage:
             metadata: Metadata dictionary from VectorEntry
 
         Returns:
-            ModelType enum value
+            ModelType enum value, PREPROCESSING when missing or unknown
         """
-        model_type_str = metadata.get("model_type", ModelType.PREPROCESSING.value)
-        return ModelType(model_type_str)
+        return _MODEL_TYPE_CACHE.get(metadata.get("model_type"), ModelType.PREPROCESSING)
+
+    def _wrap_entries(self, vector_entries: list[VectorEntry]) -> list[ReasoningEntry]:
+        """Wrap each VectorEntry returned by the store in its own ReasoningEntry.
+
+        The model type lookup from _extract_model_type is inlined so each
+        row costs two dict lookups rather than a method call.
+
+        Args:
+            vector_entries: Entries returned by a store query
+
+        Returns:
+            One single-entry ReasoningEntry per VectorEntry
+        """
+        lookup = _MODEL_TYPE_CACHE.get
+        default = ModelType.PREPROCESSING
+        return [ReasoningEntry(model_type=lookup(vector_entry.metadata.get("model_type"), default), entries=[vector_entry]) for vector_entry in vector_entries]
 
     async def get_entries_for_session(self, session_id: str, model_type: Optional[ModelType] = None, limit: int = 100) -> list[ReasoningEntry]:
         """Get entries for a session, optionally filtered by model type.
@@ -78,21 +122,16 @@ class ChromaStorage:
         Returns:
             List of ReasoningEntry objects
         """
-        filters: dict[str, Any] = {"session_id": session_id}
-        if model_type is not None:
-            filters["model_type"] = model_type.value
+        filters = _session_filter(session_id, None if model_type is None else model_type.value)
         vector_entries = await self._store.query(filters=filters, limit=limit)
-        reasoning_entries = []
-        for vector_entry in vector_entries:
-            model_type_enum = self._extract_model_type(vector_entry.metadata)
-            reasoning_entry = ReasoningEntry(model_type=model_type_enum)
-            reasoning_entry.add_entry(vector_entry)
-            reasoning_entries.append(reasoning_entry)
-        return reasoning_entries
+        return self._wrap_entries(vector_entries)
 
     async def delete_entries(self, entry_ids: list[str]) -> int:
         """Delete entries by their IDs.
 
+        Lists longer than 1000 IDs are split into chunks that are deleted
+        concurrently, so their round-trips overlap.
+
         Args:
             entry_ids: List of entry IDs to delete
 
@@ -101,7 +140,10 @@ class ChromaStorage:
         """
         if not entry_ids:
             return 0
-        return await self._store.delete(entry_ids)
+        if len(entry_ids) <= _DELETE_CHUNK_SIZE:
+            return await self._store.delete(entry_ids)
+        chunks = [entry_ids[i : i + _DELETE_CHUNK_SIZE] for i in range(0, len(entry_ids), _DELETE_CHUNK_SIZE)]
+        return sum(await asyncio.gather(*(self._store.delete(chunk) for chunk in chunks)))
 
     async def get_all_entries(self, limit: int = 1000) -> list[ReasoningEntry]:
         """Get all entries in the storage.
@@ -113,13 +155,7 @@ class ChromaStorage:
             List of all ReasoningEntry objects
         """
         vector_entries = await self._store.query(filters={}, limit=limit)
-        reasoning_entries = []
-        for vector_entry in vector_entries:
-            model_type_enum = self._extract_model_type(vector_entry.metadata)
-            reasoning_entry = ReasoningEntry(model_type=model_type_enum)
-            reasoning_entry.add_entry(vector_entry)
-            reasoning_entries.append(reasoning_entry)
-        return reasoning_entries
+        return self._wrap_entries(vector_entries)
 
     async def count(self) -> int:
         """Return the total number of entries in storage.
@@ -1,8 +1,10 @@
 """Tests for the context bridge package."""
 
+import dataclasses
 import pytest
 import time
 
+from unittest.mock import AsyncMock
 
 from midori_ai_context_bridge import BridgeConfig
 from midori_ai_context_bridge import ChromaStorage
@@ -34,6 +36,25 @@ class TestDecayConfig:
         assert config.corruption_intensity == 0.5
         assert config.removal_minutes == 120.0
 
+    def test_removal_minutes_not_an_init_argument(self) -> None:
+        with pytest.raises(TypeError):
+            DecayConfig(decay_minutes=30, removal_minutes=10.0)
+
+    def test_uses_slots(self) -> None:
+        config = DecayConfig(decay_minutes=30)
+        assert not hasattr(config, "__dict__")
+        # Frozen slotted dataclasses raise TypeError here on Python 3.11.
+        with pytest.raises((AttributeError, TypeError)):
+            config.unknown_field = 1
+
+    def test_is_frozen(self) -> None:
+        config = DecayConfig(decay_minutes=30)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.decay_minutes = 60
+        replaced = dataclasses.replace(config, decay_minutes=60)
+        assert replaced.removal_minutes == 180.0
+        assert replaced.removal_seconds == 10800
+
 
 class TestBridgeConfig:
     """Tests for BridgeConfig dataclass."""
@@ -50,6 +71,10 @@ class TestBridgeConfig:
         assert config.preprocessing_decay.decay_minutes == 30
         assert config.working_awareness_decay.decay_minutes == 720
 
+    def test_uses_slots(self) -> None:
+        config = BridgeConfig()
+        assert not hasattr(config, "__dict__")
+
     def test_get_decay_config(self) -> None:
         config = BridgeConfig()
         preprocessing_config = config.get_decay_config(ModelType.PREPROCESSING)
@@ -57,6 +82,11 @@ class TestBridgeConfig:
         assert preprocessing_config.decay_minutes == 30
         assert working_config.decay_minutes == 720
 
+    def test_get_decay_config_follows_reassignment(self) -> None:
+        config = BridgeConfig()
+        config.preprocessing_decay = DecayConfig(decay_minutes=5)
+        assert config.get_decay_config(ModelType.PREPROCESSING).decay_minutes == 5
+
 
 class TestMemoryCorruptor:
     """Tests for MemoryCorruptor class."""
@@ -87,6 +117,12 @@ class TestMemoryCorruptor:
         assert corruptor.calculate_severity(90) == 1.0
         assert corruptor.calculate_severity(100) == 1.0
 
+    def test_calculate_severity_empty_window(self) -> None:
+        config = DecayConfig(decay_minutes=30, removal_multiplier=1.0)
+        corruptor = MemoryCorruptor(config)
+        assert corruptor.calculate_severity(29) == 0.0
+        assert corruptor.calculate_severity(30) == 1.0
+
     def test_corrupt_text_no_corruption_for_fresh(self) -> None:
         config = DecayConfig(decay_minutes=30)
         corruptor = MemoryCorruptor(config, seed=42)
@@ -104,6 +140,12 @@ class TestMemoryCorruptor:
         assert result != text
         assert len(result) <= len(text) + 5
 
+    def test_corrupt_text_empty_when_expired(self) -> None:
+        config = DecayConfig(decay_minutes=30, removal_multiplier=3.0)
+        corruptor = MemoryCorruptor(config, seed=42)
+        assert corruptor.corrupt_text("Hello world", 90) == ""
+        assert corruptor.corrupt_text("Hello world", 500) == ""
+
     def test_corrupt_text_reproducible_with_seed(self) -> None:
         config = DecayConfig(decay_minutes=30)
         corruptor1 = MemoryCorruptor(config, seed=42)
@@ -113,6 +155,31 @@ class TestMemoryCorruptor:
         result2 = corruptor2.corrupt_text(text, 60)
         assert result1 == result2
 
+    def test_corrupt_text_preserves_unicode(self) -> None:
+        config = DecayConfig(decay_minutes=30, corruption_intensity=0.3)
+        corruptor = MemoryCorruptor(config, seed=7)
+        text = "日本語のテキスト" * 50
+        result = corruptor.corrupt_text(text, 60)
+        assert result != text
+        assert len(result) <= len(text)
+        assert set(result) <= set(text) | set("abcdefghijklmnopqrstuvwxyz ")
+
+    def test_corrupt_text_sparse_rate(self) -> None:
+        config = DecayConfig(decay_minutes=30, corruption_intensity=0.3)
+        corruptor = MemoryCorruptor(config, seed=3)
+        text = "a" * 10000
+        result = corruptor.corrupt_text(text, 36)
+        assert result != text
+        assert 9800 < len(result) < 10000
+
+    def test_corrupt_text_accepts_lone_surrogates(self) -> None:
+        config = DecayConfig(decay_minutes=30, corruption_intensity=0.3)
+        corruptor = MemoryCorruptor(config, seed=7)
+        text = "ab\ud800cd" * 50
+        result = corruptor.corrupt_text(text, 60)
+        assert result != text
+        assert set(result) <= set(text) | set("abcdefghijklmnopqrstuvwxyz ")
+
     def test_should_remove(self) -> None:
         config = DecayConfig(decay_minutes=30, removal_multiplier=3.0)
         corruptor = MemoryCorruptor(config)
@@ -122,6 +189,21 @@ class TestMemoryCorruptor:
         assert corruptor.should_remove(90)
         assert corruptor.should_remove(100)
 
+    def test_should_remove_seconds(self) -> None:
+        config = DecayConfig(decay_minutes=30, removal_multiplier=3.0)
+        corruptor = MemoryCorruptor(config)
+        assert config.removal_seconds == 5400
+        assert not corruptor.should_remove_seconds(5399.5)
+        assert corruptor.should_remove_seconds(5400)
+
+    def test_should_remove_seconds_matches_minutes_at_boundary(self) -> None:
+        config = DecayConfig(decay_minutes=1, removal_multiplier=1.00001)
+        corruptor = MemoryCorruptor(config)
+        for age_seconds in (60.0003, 60.0005, 60.0007, 60.0009):
+            assert corruptor.should_remove_seconds(age_seconds) == corruptor.should_remove(age_seconds / 60)
+        assert not corruptor.should_remove_seconds(60.0003)
+        assert corruptor.should_remove_seconds(60.0009)
+
     def test_process_text_fresh(self) -> None:
         config = DecayConfig(decay_minutes=30)
         corruptor = MemoryCorruptor(config)
@@ -140,39 +222,54 @@ class TestMemoryCorruptor:
 class TestContextCompressor:
     """Tests for ContextCompressor class."""
 
-    @pytest.mark.asyncio
-    async def test_compress_empty(self) -> None:
+    def test_compress_empty(self) -> None:
         compressor = ContextCompressor(max_tokens=500)
-        result = await compressor.compress([])
+        result = compressor.compress([])
         assert result == ""
 
-    @pytest.mark.asyncio
-    async def test_compress_single(self) -> None:
+    def test_compress_single(self) -> None:
         compressor = ContextCompressor(max_tokens=500)
-        result = await compressor.compress(["Hello world"])
+        result = compressor.compress(["Hello world"])
         assert result == "Hello world"
 
-    @pytest.mark.asyncio
-    async def test_compress_multiple(self) -> None:
+    def test_compress_multiple(self) -> None:
         compressor = ContextCompressor(max_tokens=500)
-        result = await compressor.compress(["First", "Second", "Third"])
+        result = compressor.compress(["First", "Second", "Third"])
         assert "First" in result
         assert "Second" in result
         assert "Third" in result
 
-    @pytest.mark.asyncio
-    async def test_compress_truncation(self) -> None:
+    def test_compress_truncation(self) -> None:
         compressor = ContextCompressor(max_tokens=10)
         long_text = "a" * 1000
-        result = await compressor.compress([long_text])
+        result = compressor.compress([long_text])
         assert len(result) < len(long_text)
         assert result.endswith("...")
 
-    @pytest.mark.asyncio
-    async def test_compress_with_labels(self) -> None:
+    def test_compress_stops_consuming_at_budget(self) -> None:
+        compressor = ContextCompressor(max_tokens=10)
+        consumed = []
+
+        def texts():
+            for text in ["a" * 30, "b" * 30, "c" * 30]:
+                consumed.append(text)
+                yield text
+
+        result = compressor.compress(texts())
+        assert result.endswith("...")
+        assert len(consumed) == 2
+
+    def test_compress_truncation_matches_joined_prefix(self) -> None:
+        compressor = ContextCompressor(max_tokens=10)
+        texts = ["a" * 15, "b" * 15, "c" * 15]
+        joined = "\n\n---\n\n".join(texts)
+        assert compressor.compress(texts) == joined[:40] + "..."
+        assert compressor.compress(["a" * 10, "b" * 10]) == "a" * 10 + "\n\n---\n\n" + "b" * 10
+
+    def test_compress_with_labels(self) -> None:
         compressor = ContextCompressor(max_tokens=500)
         labeled = [("Label1", "Text1"), ("Label2", "Text2")]
-        result = await compressor.compress_with_labels(labeled)
+        result = compressor.compress_with_labels(labeled)
         assert "[Label1]" in result
         assert "Text1" in result
         assert "[Label2]" in result
@@ -247,6 +344,53 @@ class TestChromaStorage:
         assert len(entries) == 2
         await storage.clear()
 
+    def test_extract_model_type(self) -> None:
+        storage = ChromaStorage.__new__(ChromaStorage)
+        assert storage._extract_model_type({"model_type": "working_awareness"}) is ModelType.WORKING_AWARENESS
+        assert storage._extract_model_type({"model_type": "preprocessing"}) is ModelType.PREPROCESSING
+        assert storage._extract_model_type({}) is ModelType.PREPROCESSING
+        assert storage._extract_model_type({"model_type": "unknown"}) is ModelType.PREPROCESSING
+
+    @pytest.mark.asyncio
+    async def test_get_entries_wraps_each_vector_entry(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        storage = ChromaStorage.__new__(ChromaStorage)
+        storage._store = AsyncMock()
+        storage._store.query.return_value = [
+            VectorEntry(id="a", text="A", timestamp=100.0, sender=None, metadata={"session_id": "s", "model_type": "preprocessing"}),
+            VectorEntry(id="b", text="B", timestamp=200.0, sender=None, metadata={"session_id": "s", "model_type": "working_awareness"}),
+        ]
+        entries = await storage.get_entries_for_session("s")
+        assert [entry.id for entry in entries] == ["a", "b"]
+        assert [entry.model_type for entry in entries] == [ModelType.PREPROCESSING, ModelType.WORKING_AWARENESS]
+        assert all(len(entry.entries) == 1 for entry in entries)
+        assert [entry.id for entry in await storage.get_all_entries()] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_delete_entries_chunks_large_lists(self) -> None:
+        storage = ChromaStorage.__new__(ChromaStorage)
+        storage._store = AsyncMock()
+        storage._store.delete.side_effect = lambda ids: len(ids)
+        assert await storage.delete_entries([]) == 0
+        storage._store.delete.assert_not_awaited()
+        assert await storage.delete_entries([f"id-{i}" for i in range(2500)]) == 2500
+        chunk_sizes = sorted(len(call.args[0]) for call in storage._store.delete.call_args_list)
+        assert chunk_sizes == [500, 1000, 1000]
+
+    @pytest.mark.asyncio
+    async def test_get_entries_reuses_session_filter(self) -> None:
+        storage = ChromaStorage.__new__(ChromaStorage)
+        storage._store = AsyncMock()
+        storage._store.query.return_value = []
+        await storage.get_entries_for_session("filter:1", ModelType.WORKING_AWARENESS)
+        await storage.get_entries_for_session("filter:1", ModelType.WORKING_AWARENESS)
+        await storage.get_entries_for_session("filter:1")
+        first, second, third = (call.kwargs["filters"] for call in storage._store.query.call_args_list)
+        assert first == {"session_id": "filter:1", "model_type": "working_awareness"}
+        assert first is second
+        assert third == {"session_id": "filter:1"}
+
 
 class TestContextBridge:
     """Tests for ContextBridge class."""
@@ -318,10 +462,104 @@ class TestContextBridge:
         assert bridge.config.working_awareness_decay.decay_minutes == 120
         await bridge.storage.clear()
 
+    @pytest.mark.asyncio
+    async def test_get_prior_reasoning_removes_expired_before_compressing(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        bridge = ContextBridge(max_tokens_per_summary=500)
+        expired = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+        expired.add_entry(VectorEntry(id="expired", text="Expired", timestamp=time.time() - 91 * 60, sender=None, metadata={}))
+        fresh = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+        fresh.add_entry(VectorEntry(id="fresh", text="Fresh", timestamp=time.time(), sender=None, metadata={}))
+        bridge._storage = AsyncMock()
+        bridge._storage.get_entries_for_session.return_value = [expired, fresh]
+        context = await bridge.get_prior_reasoning("user:mock", ModelType.PREPROCESSING)
+        assert context == "Fresh"
+        bridge._storage.delete_entries.assert_awaited_once_with(["expired"])
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_deletes_in_one_call(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        bridge = ContextBridge(max_tokens_per_summary=500)
+        old = time.time() - 91 * 60
+        entries = []
+        for i in range(600):
+            entry = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+            entry.add_entry(VectorEntry(id=f"old-{i}", text="Old", timestamp=old, sender=None, metadata={}))
+            entries.append(entry)
+        fresh = ReasoningEntry(model_type=ModelType.WORKING_AWARENESS)
+        fresh.add_entry(VectorEntry(id="fresh", text="Fresh", timestamp=old, sender=None, metadata={}))
+        entries.append(fresh)
+        bridge._storage = AsyncMock()
+        bridge._storage.get_all_entries.return_value = entries
+        removed = await bridge.cleanup_expired()
+        assert removed == 600
+        bridge._storage.delete_entries.assert_awaited_once()
+        assert len(bridge._storage.delete_entries.call_args.args[0]) == 600
+
+    @pytest.mark.asyncio
+    async def test_get_session_stats_rereads_per_type_when_one_type_fills_the_query(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        bridge = ContextBridge(max_tokens_per_summary=500)
+        now = time.time()
+        preprocessing = []
+        for i in range(200):
+            entry = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+            entry.add_entry(VectorEntry(id=f"pre-{i}", text="Pre", timestamp=now, sender=None, metadata={}))
+            preprocessing.append(entry)
+        working = ReasoningEntry(model_type=ModelType.WORKING_AWARENESS)
+        working.add_entry(VectorEntry(id="work", text="Work", timestamp=now - 600, sender=None, metadata={}))
+
+        async def get_entries_for_session(session_id, model_type=None, limit=100):
+            if model_type is None:
+                return preprocessing[:limit]
+            if model_type is ModelType.PREPROCESSING:
+                return preprocessing[:limit]
+            return [working][:limit]
+
+        bridge._storage = AsyncMock()
+        bridge._storage.get_entries_for_session.side_effect = get_entries_for_session
+        stats = await bridge.get_session_stats("user:mock")
+        assert stats["preprocessing_count"] == 100
+        assert stats["working_awareness_count"] == 1
+        assert stats["total_count"] == 101
+        assert stats["oldest_working_age_minutes"] >= 10
+
+    @pytest.mark.asyncio
+    async def test_get_session_stats_caps_each_type_below_the_combined_limit(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        bridge = ContextBridge(max_tokens_per_summary=500)
+        now = time.time()
+        entries = []
+        for i in range(150):
+            entry = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+            entry.add_entry(VectorEntry(id=f"pre-{i}", text="Pre", timestamp=now, sender=None, metadata={}))
+            entries.append(entry)
+        for i in range(10):
+            entry = ReasoningEntry(model_type=ModelType.WORKING_AWARENESS)
+            entry.add_entry(VectorEntry(id=f"work-{i}", text="Work", timestamp=now, sender=None, metadata={}))
+            entries.append(entry)
+        bridge._storage = AsyncMock()
+        bridge._storage.get_entries_for_session.return_value = entries
+        stats = await bridge.get_session_stats("user:mock")
+        bridge._storage.get_entries_for_session.assert_awaited_once()
+        assert stats["preprocessing_count"] == 100
+        assert stats["working_awareness_count"] == 10
+        assert stats["total_count"] == 110
+
 
 class TestReasoningEntry:
     """Tests for ReasoningEntry dataclass."""
 
+    def test_defaults_and_slots(self) -> None:
+        reasoning_entry = ReasoningEntry(model_type=ModelType.WORKING_AWARENESS)
+        assert reasoning_entry.entries == []
+        assert reasoning_entry.entries is not ReasoningEntry(model_type=ModelType.WORKING_AWARENESS).entries
+        assert not hasattr(reasoning_entry, "__dict__")
+
     def test_age_minutes_property(self) -> None:
         from midori_ai_vector_manager import VectorEntry
 
@@ -330,3 +568,45 @@ class TestReasoningEntry:
         reasoning_entry.add_entry(vector_entry)
         age = reasoning_entry.age_minutes
         assert 1.9 < age < 2.1
+
+    def test_age_minutes_at(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        reasoning_entry = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+        assert reasoning_entry.age_minutes_at(1000.0) == 0.0
+        reasoning_entry.add_entry(VectorEntry(id="a", text="A", timestamp=400.0, sender=None, metadata={}))
+        reasoning_entry.add_entry(VectorEntry(id="b", text="B", timestamp=700.0, sender=None, metadata={}))
+        assert reasoning_entry.age_minutes_at(1000.0) == 10.0
+
+    def test_timestamp_tracks_oldest_entry(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        reasoning_entry = ReasoningEntry(model_type=ModelType.PREPROCESSING, entries=[VectorEntry(id="a", text="A", timestamp=500.0, sender=None, metadata={})])
+        assert reasoning_entry.timestamp == 500.0
+        reasoning_entry.add_entry(VectorEntry(id="b", text="B", timestamp=800.0, sender=None, metadata={}))
+        assert reasoning_entry.timestamp == 500.0
+        reasoning_entry.add_entry(VectorEntry(id="c", text="C", timestamp=200.0, sender=None, metadata={}))
+        assert reasoning_entry.timestamp == 200.0
+        assert ReasoningEntry(model_type=ModelType.PREPROCESSING).timestamp == 0.0
+
+    def test_text_joins_entries(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        reasoning_entry = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+        assert reasoning_entry.text == ""
+        reasoning_entry.add_entry(VectorEntry(id="a", text="first", timestamp=1.0, sender=None, metadata={}))
+        assert reasoning_entry.text == "first"
+        reasoning_entry.add_entry(VectorEntry(id="b", text="second", timestamp=2.0, sender=None, metadata={}))
+        assert reasoning_entry.text == "first second"
+
+    def test_metadata_merges_entries(self) -> None:
+        from midori_ai_vector_manager import VectorEntry
+
+        reasoning_entry = ReasoningEntry(model_type=ModelType.PREPROCESSING)
+        assert reasoning_entry.metadata == {}
+        first = VectorEntry(id="a", text="A", timestamp=1.0, sender=None, metadata={"session_id": "s", "step": 1})
+        reasoning_entry.add_entry(first)
+        assert reasoning_entry.metadata is first.metadata
+        reasoning_entry.add_entry(VectorEntry(id="b", text="B", timestamp=2.0, sender=None, metadata={"step": 2}))
+        assert reasoning_entry.metadata == {"session_id": "s", "step": 2}
+        assert first.metadata == {"session_id": "s", "step": 1}
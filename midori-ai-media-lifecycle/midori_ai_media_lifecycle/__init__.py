@@ -1,10 +1,14 @@
 """Midori AI Media Lifecycle - Time-based lifecycle management for media objects."""
 
 from .decay import DecayConfig
+from .decay import ExponentialDecayConfig
 from .decay import get_age_minutes
+from .decay import get_age_minutes_from_epoch
+from .decay import get_parsing_probabilities
 from .decay import get_parsing_probability
 from .decay import is_aged_out
 from .decay import should_parse
+from .decay import to_datetime64
 
 from .lifecycle import LifecycleManager
 from .lifecycle import create_lifecycle_manager
@@ -12,4 +16,4 @@ from .lifecycle import create_lifecycle_manager
 from .scheduler import CleanupScheduler
 
 
-__all__ = ["CleanupScheduler", "DecayConfig", "LifecycleManager", "create_lifecycle_manager", "get_age_minutes", "get_parsing_probability", "is_aged_out", "should_parse"]
+__all__ = ["CleanupScheduler", "DecayConfig", "ExponentialDecayConfig", "LifecycleManager", "create_lifecycle_manager", "get_age_minutes", "get_age_minutes_from_epoch", "get_parsing_probabilities", "get_parsing_probability", "is_aged_out", "should_parse", "to_datetime64"]
@@ -1,19 +1,32 @@
 """Parsing probability decay calculations for media lifecycle."""
 
+import math
+import time
 import random
 
+import numpy as np
+
 from datetime import datetime
 from datetime import timezone
 
+from typing import Iterable
+
 
 class DecayConfig:
     """Configuration for decay timeline.
 
+    The decay window and its inverse are derived once at construction, so
+    the thresholds should be treated as fixed after a config is created.
+    Instances use __slots__ to keep attribute access on the scoring path cheap.
+
     Attributes:
         full_probability_minutes: Minutes during which parsing probability is 100%
         zero_probability_minutes: Minutes at which parsing probability reaches 0%
+        decay_window_minutes: Duration of the decay window in minutes
     """
 
+    __slots__ = ("full_probability_minutes", "zero_probability_minutes", "decay_window_minutes", "_inv_decay_window_minutes")
+
     def __init__(self, full_probability_minutes: float = 35.0, zero_probability_minutes: float = 90.0) -> None:
         """Initialize decay configuration.
 
@@ -27,37 +40,138 @@ class DecayConfig:
             raise ValueError("zero_probability_minutes must be greater than full_probability_minutes")
         self.full_probability_minutes = full_probability_minutes
         self.zero_probability_minutes = zero_probability_minutes
+        self.decay_window_minutes = zero_probability_minutes - full_probability_minutes
+        self._inv_decay_window_minutes = 1.0 / self.decay_window_minutes
+
+    def probability_at(self, age_minutes: float) -> float:
+        """Return the parsing probability for a given age (linear decay, clamped).
+
+        Args:
+            age_minutes: Age of the media in minutes
+
+        Returns:
+            Probability as float from 0.0 to 1.0
+        """
+        probability = 1.0 - (age_minutes - self.full_probability_minutes) * self._inv_decay_window_minutes
+        if probability <= 0.0:
+            return 0.0
+        if probability >= 1.0:
+            return 1.0
+        return probability
+
+    def probabilities_at(self, age_minutes: np.ndarray) -> np.ndarray:
+        """Vectorized probability_at over an array of ages in minutes."""
+        return np.clip(1.0 - (age_minutes - self.full_probability_minutes) * self._inv_decay_window_minutes, 0.0, 1.0)
+
+
+class ExponentialDecayConfig(DecayConfig):
+    """Memoryless exponential decay: parsing probability halves every half-life.
+
+    Probability is exp(-lambda * age) with lambda = ln(2) / half_life_minutes,
+    starting at 100% with no flat period. Media is aged out once probability
+    drops to aged_out_probability, which sets zero_probability_minutes, so
+    is_aged_out and cleanup work unchanged. Decays compose by adding their
+    rates (see compose).
+
+    Attributes:
+        half_life_minutes: Minutes for parsing probability to halve
+        aged_out_probability: Probability at which media counts as aged out
+        lambda_per_minute: Decay rate, ln(2) / half_life_minutes
+    """
+
+    __slots__ = ("half_life_minutes", "aged_out_probability", "lambda_per_minute")
+
+    def __init__(self, half_life_minutes: float = 20.0, aged_out_probability: float = 0.001) -> None:
+        """Initialize exponential decay configuration.
+
+        Args:
+            half_life_minutes: Minutes for probability to halve (default 20)
+            aged_out_probability: Ageout probability threshold (default 0.001)
+        """
+        if half_life_minutes <= 0:
+            raise ValueError("half_life_minutes must be positive")
+        if not 0.0 < aged_out_probability < 1.0:
+            raise ValueError("aged_out_probability must be between 0 and 1")
+        self.half_life_minutes = half_life_minutes
+        self.aged_out_probability = aged_out_probability
+        self.lambda_per_minute = math.log(2) / half_life_minutes
+        super().__init__(full_probability_minutes=0.0, zero_probability_minutes=-math.log(aged_out_probability) / self.lambda_per_minute)
+
+    def compose(self, other: "ExponentialDecayConfig") -> "ExponentialDecayConfig":
+        """Combine two exponential decays into one whose rate is their sum.
+
+        Args:
+            other: Decay to apply on top of this one
+
+        Returns:
+            ExponentialDecayConfig equal to applying both decays, using this
+            config's aged_out_probability
+        """
+        return ExponentialDecayConfig(half_life_minutes=math.log(2) / (self.lambda_per_minute + other.lambda_per_minute), aged_out_probability=self.aged_out_probability)
+
+    def probability_at(self, age_minutes: float) -> float:
+        """Return the parsing probability for a given age (exponential decay).
+
+        Args:
+            age_minutes: Age of the media in minutes
+
+        Returns:
+            Probability as float from 0.0 to 1.0
+        """
+        if age_minutes <= 0.0:
+            return 1.0
+        return math.exp(-self.lambda_per_minute * age_minutes)
+
+    def probabilities_at(self, age_minutes: np.ndarray) -> np.ndarray:
+        """Vectorized probability_at over an array of ages in minutes."""
+        return np.exp(-self.lambda_per_minute * np.maximum(age_minutes, 0.0))
+
 
-    @property
-    def decay_window_minutes(self) -> float:
-        """Duration of the decay window in minutes."""
-        return self.zero_probability_minutes - self.full_probability_minutes
+_DEFAULT_CONFIG = DecayConfig()
 
 
 def get_age_minutes(time_saved: datetime) -> float:
     """Calculate age of media in minutes from time_saved to now.
 
+    Compares epoch seconds against time.time() rather than building a
+    datetime for now. Naive time_saved values are treated as UTC.
+
     Args:
-        time_saved: When the media was saved (must be timezone-aware)
+        time_saved: When the media was saved
 
     Returns:
         Age in minutes as a float
     """
-    now = datetime.now(timezone.utc)
     if time_saved.tzinfo is None:
         time_saved = time_saved.replace(tzinfo=timezone.utc)
-    delta = now - time_saved
-    return delta.total_seconds() / 60.0
+    return (time.time() - time_saved.timestamp()) / 60.0
+
+
+def get_age_minutes_from_epoch(time_saved_epoch: float) -> float:
+    """Calculate age of media in minutes from a Unix epoch save time to now.
+
+    Cheaper than get_age_minutes: reads time.time() and does float math,
+    with no datetime objects involved.
+
+    Args:
+        time_saved_epoch: When the media was saved, as Unix epoch seconds
+
+    Returns:
+        Age in minutes as a float
+    """
+    return (time.time() - time_saved_epoch) / 60.0
 
 
 def get_parsing_probability(time_saved: datetime, config: DecayConfig | None = None) -> float:
     """Calculate parsing probability based on media age.
 
-    Timeline:
+    Timeline (DecayConfig):
     - 0 to full_probability_minutes: 100% probability
     - full_probability_minutes to zero_probability_minutes: Linear decay
     - After zero_probability_minutes: 0% probability
 
+    An ExponentialDecayConfig uses its exponential curve instead.
+
     Args:
         time_saved: When the media was saved
         config: Decay configuration (uses defaults if None)
@@ -66,15 +180,42 @@ def get_parsing_probability(time_saved: datetime, config: DecayConfig | None = N
         Probability as float from 0.0 to 1.0
     """
     if config is None:
-        config = DecayConfig()
-    age_minutes = get_age_minutes(time_saved)
-    if age_minutes <= config.full_probability_minutes:
-        return 1.0
-    if age_minutes >= config.zero_probability_minutes:
-        return 0.0
-    elapsed_in_window = age_minutes - config.full_probability_minutes
-    decay_fraction = elapsed_in_window / config.decay_window_minutes
-    return 1.0 - decay_fraction
+        config = _DEFAULT_CONFIG
+    return config.probability_at(get_age_minutes(time_saved))
+
+
+def to_datetime64(times_saved: Iterable[datetime]) -> np.ndarray:
+    """Convert datetimes to a UTC datetime64[us] array for batch scoring.
+
+    Timezone-aware values are converted to UTC; naive values are treated as UTC.
+
+    Args:
+        times_saved: When each media object was saved
+
+    Returns:
+        Array of naive UTC datetime64[us] values
+    """
+    return np.array([t if t.tzinfo is None else t.astimezone(timezone.utc).replace(tzinfo=None) for t in times_saved], dtype="datetime64[us]")
+
+
+def get_parsing_probabilities(times_saved: np.ndarray, config: DecayConfig | None = None) -> np.ndarray:
+    """Calculate parsing probabilities for many media objects at once.
+
+    Vectorized form of get_parsing_probability: all ages are computed
+    against a single clock reading and scored in one NumPy expression.
+
+    Args:
+        times_saved: UTC datetime64 array of save times (see to_datetime64)
+        config: Decay configuration (uses defaults if None)
+
+    Returns:
+        Float64 array of probabilities from 0.0 to 1.0
+    """
+    if config is None:
+        config = _DEFAULT_CONFIG
+    now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "us")
+    age_minutes = (now - times_saved.astype("datetime64[us]")).astype(np.float64) / 60e6
+    return config.probabilities_at(age_minutes)
 
 
 def should_parse(time_saved: datetime, config: DecayConfig | None = None) -> bool:
@@ -106,6 +247,6 @@ def is_aged_out(time_saved: datetime, config: DecayConfig | None = None) -> bool
         True if aged out, False otherwise
     """
     if config is None:
-        config = DecayConfig()
+        config = _DEFAULT_CONFIG
     age_minutes = get_age_minutes(time_saved)
     return age_minutes >= config.zero_probability_minutes
@@ -1,17 +1,27 @@
 """Main lifecycle manager for media objects."""
 
+import time
+import random
+import asyncio
+
+import numpy as np
+
 from datetime import datetime
+from datetime import timedelta
 from datetime import timezone
 
 from pathlib import Path
 
+from typing import Callable
+from typing import AsyncIterator
+
+from midori_ai_media_vault import MediaMetadata
 from midori_ai_media_vault import MediaObject
 from midori_ai_media_vault import MediaStorage
 
 from .decay import DecayConfig
-from .decay import get_parsing_probability
+from .decay import get_age_minutes_from_epoch
 from .decay import is_aged_out
-from .decay import should_parse
 
 
 def utcnow() -> datetime:
@@ -28,15 +38,24 @@ class LifecycleManager:
     - Clean up aged-out media from storage
     """
 
-    def __init__(self, storage: MediaStorage, config: DecayConfig | None = None) -> None:
+    def __init__(self, storage: MediaStorage, config: DecayConfig | None = None, max_concurrency: int = 32, id_to_time_saved: Callable[[str], datetime] | None = None) -> None:
         """Initialize lifecycle manager.
 
         Args:
             storage: MediaStorage instance for persistence
             config: Decay configuration (uses defaults if None)
+            max_concurrency: Maximum storage operations in flight during cleanup (default 32)
+            id_to_time_saved: Optional decoder for media IDs that embed their save time
+                (e.g. ULIDs); should raise ValueError for IDs it cannot decode
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self.storage = storage
         self.config = config if config is not None else DecayConfig()
+        self.max_concurrency = max_concurrency
+        self.id_to_time_saved = id_to_time_saved
+        self._rng = np.random.default_rng()
+        self._probability_accumulator = 0.0
 
     def get_parsing_probability(self, media: MediaObject) -> float:
         """Get parsing probability for a media object.
@@ -47,18 +66,96 @@ class LifecycleManager:
         Returns:
             Probability as float from 0.0 to 1.0
         """
-        return get_parsing_probability(media.metadata.time_saved, self.config)
+        return self.config.probability_at(get_age_minutes_from_epoch(media.metadata.time_saved_epoch))
+
+    def score_metadata(self, metadata: MediaMetadata) -> tuple[float, bool]:
+        """Get parsing probability and aged-out status from a single age read.
+
+        Takes metadata rather than a MediaObject, so callers can score media
+        loaded with MediaStorage.load_metadata without decrypting the payload.
+
+        Args:
+            metadata: Metadata of the media to check
+
+        Returns:
+            Tuple of (probability from 0.0 to 1.0, aged-out flag)
+        """
+        age_minutes = get_age_minutes_from_epoch(metadata.time_saved_epoch)
+        return self.config.probability_at(age_minutes), age_minutes >= self.config.zero_probability_minutes
 
     def should_parse(self, media: MediaObject) -> bool:
         """Determine probabilistically whether to parse media.
 
+        Delegates to should_parse_metadata, so subclasses only need to
+        override that method to change the decision.
+
+        Args:
+            media: The media object to check
+
+        Returns:
+            True if should parse, False otherwise
+        """
+        return self.should_parse_metadata(media.metadata)
+
+    def should_parse_metadata(self, metadata: MediaMetadata) -> bool:
+        """Determine probabilistically whether to parse media from its metadata.
+
+        Takes metadata rather than a MediaObject, so callers can decide
+        before loading or decrypting the payload.
+
+        Args:
+            metadata: Metadata of the media to check
+
+        Returns:
+            True if should parse, False otherwise
+        """
+        return random.random() < self.config.probability_at(get_age_minutes_from_epoch(metadata.time_saved_epoch))
+
+    def should_parse_accumulated(self, media: MediaObject) -> bool:
+        """Decide deterministically whether to parse media, without a PRNG.
+
+        Each call adds the media's parsing probability to a running
+        accumulator on this manager and returns True whenever it reaches
+        1.0, carrying the remainder. Over many calls the fraction of True
+        results matches the summed probabilities, like should_parse, but
+        decisions are evenly spaced rather than independent. Use
+        should_parse when independent random decisions are required.
+
         Args:
             media: The media object to check
 
         Returns:
             True if should parse, False otherwise
         """
-        return should_parse(media.metadata.time_saved, self.config)
+        self._probability_accumulator += self.get_parsing_probability(media)
+        if self._probability_accumulator >= 1.0:
+            self._probability_accumulator -= 1.0
+            return True
+        return False
+
+    def get_parsing_probabilities(self, media_list: list[MediaObject]) -> np.ndarray:
+        """Get parsing probabilities for many media objects in one vectorized pass.
+
+        Args:
+            media_list: The media objects to score
+
+        Returns:
+            Float64 array of probabilities, aligned with media_list
+        """
+        time_saved_epochs = np.fromiter((media.metadata.time_saved_epoch for media in media_list), dtype=np.float64, count=len(media_list))
+        return self.config.probabilities_at((time.time() - time_saved_epochs) / 60.0)
+
+    def should_parse_many(self, media_list: list[MediaObject]) -> list[bool]:
+        """Make probabilistic parse decisions for many media objects at once.
+
+        Args:
+            media_list: The media objects to check
+
+        Returns:
+            List of parse decisions, aligned with media_list
+        """
+        probabilities = self.get_parsing_probabilities(media_list)
+        return (self._rng.random(probabilities.size) < probabilities).tolist()
 
     def is_aged_out(self, media: MediaObject) -> bool:
         """Check if media has aged out and should be cleaned up.
@@ -69,7 +166,23 @@ class LifecycleManager:
         Returns:
             True if aged out, False otherwise
         """
-        return is_aged_out(media.metadata.time_saved, self.config)
+        return get_age_minutes_from_epoch(media.metadata.time_saved_epoch) >= self.config.zero_probability_minutes
+
+    def is_aged_out_id(self, media_id: str) -> bool:
+        """Check aged-out status from the media ID alone, without touching storage.
+
+        Args:
+            media_id: The media ID to check
+
+        Returns:
+            True if aged out, False otherwise
+
+        Raises:
+            ValueError: If no id_to_time_saved decoder is configured or it rejects the ID
+        """
+        if self.id_to_time_saved is None:
+            raise ValueError("id_to_time_saved is not configured")
+        return is_aged_out(self.id_to_time_saved(media_id), self.config)
 
     async def mark_loaded(self, media: MediaObject) -> MediaObject:
         """Mark media as loaded and persist the update.
@@ -104,26 +217,65 @@ class LifecycleManager:
     async def cleanup_aged_media(self) -> list[str]:
         """Remove all aged-out media from storage.
 
-        Iterates through all media and deletes those that have aged out.
+        Takes one clock reading to compute the ageout cutoff and streams
+        the IDs saved at or before it from storage (a metadata-only scan
+        that never decrypts media payloads). Deletes start while the scan
+        is still running, with at most max_concurrency in flight; the scan
+        waits for a free slot, so memory stays bounded on large vaults.
+        With an id_to_time_saved decoder, save times come from the IDs and
+        storage is only listed.
 
         Returns:
-            List of deleted media IDs
+            List of deleted media IDs, in completion order
+
+        Raises:
+            ExceptionGroup: If the scan or any delete fails
         """
+        cutoff = utcnow() - timedelta(minutes=self.config.zero_probability_minutes)
+        if self.id_to_time_saved is None:
+            aged_ids = self.storage.iter_aged_out(cutoff)
+        else:
+            aged_ids = self._iter_aged_out_by_id(cutoff, self.id_to_time_saved)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         deleted_ids: list[str] = []
-        media_ids = await self.storage.list_all()
-        for media_id in media_ids:
+
+        async def _delete(media_id: str) -> None:
             try:
-                media = await self.storage.load(media_id)
-                if self.is_aged_out(media):
-                    await self.storage.delete(media_id)
+                if await self.storage.delete(media_id):
                     deleted_ids.append(media_id)
-            except FileNotFoundError:
-                continue
+            finally:
+                semaphore.release()
+
+        async with asyncio.TaskGroup() as task_group:
+            async for media_id in aged_ids:
+                await semaphore.acquire()
+                task_group.create_task(_delete(media_id))
         return deleted_ids
 
+    async def _iter_aged_out_by_id(self, cutoff: datetime, id_to_time_saved: Callable[[str], datetime]) -> AsyncIterator[str]:
+        """Stream aged-out media IDs by decoding save times from the IDs.
+
+        IDs the decoder rejects with ValueError fall back to a metadata read.
+        """
+        async for media_id in self.storage.iter_all():
+            try:
+                time_saved = id_to_time_saved(media_id)
+            except ValueError:
+                try:
+                    time_saved = (await self.storage.load_metadata(media_id)).time_saved
+                except FileNotFoundError:
+                    continue
+            if time_saved.tzinfo is None:
+                time_saved = time_saved.replace(tzinfo=timezone.utc)
+            if time_saved <= cutoff:
+                yield media_id
+
     async def get_media_status(self, media_id: str) -> dict[str, object]:
         """Get status information for a media object.
 
+        Reads only the metadata sidecar, so repeated status polls never
+        decrypt the media payload.
+
         Args:
             media_id: The media ID to check
 
@@ -133,28 +285,29 @@ class LifecycleManager:
         Raises:
             FileNotFoundError: If media doesn't exist
         """
-        media = await self.storage.load(media_id)
-        probability = self.get_parsing_probability(media)
-        aged_out = self.is_aged_out(media)
+        metadata = await self.storage.load_metadata(media_id)
+        probability, aged_out = self.score_metadata(metadata)
         return {
             "media_id": media_id,
             "probability": probability,
             "aged_out": aged_out,
-            "time_saved": media.metadata.time_saved,
-            "time_loaded": media.metadata.time_loaded,
-            "time_parsed": media.metadata.time_parsed,
+            "time_saved": metadata.time_saved,
+            "time_loaded": metadata.time_loaded,
+            "time_parsed": metadata.time_parsed,
         }
 
 
-def create_lifecycle_manager(base_path: Path, config: DecayConfig | None = None) -> LifecycleManager:
+def create_lifecycle_manager(base_path: Path, config: DecayConfig | None = None, max_concurrency: int = 32, id_to_time_saved: Callable[[str], datetime] | None = None) -> LifecycleManager:
     """Factory function to create a LifecycleManager with new storage.
 
     Args:
         base_path: Directory for media storage
         config: Decay configuration (uses defaults if None)
+        max_concurrency: Maximum storage operations in flight during cleanup (default 32)
+        id_to_time_saved: Optional decoder for media IDs that embed their save time
 
     Returns:
         Configured LifecycleManager instance
     """
     storage = MediaStorage(base_path=base_path)
-    return LifecycleManager(storage=storage, config=config)
+    return LifecycleManager(storage=storage, config=config, max_concurrency=max_concurrency, id_to_time_saved=id_to_time_saved)
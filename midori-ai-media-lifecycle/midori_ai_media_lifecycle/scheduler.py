@@ -32,6 +32,7 @@ class CleanupScheduler:
         self.on_cleanup = on_cleanup
         self._task: asyncio.Task[None] | None = None
         self._running = False
+        self._stop_event = asyncio.Event()
 
     @property
     def is_running(self) -> bool:
@@ -39,7 +40,16 @@ class CleanupScheduler:
         return self._running
 
     async def _run_cleanup_loop(self) -> None:
-        """Internal loop that runs periodic cleanup."""
+        """Internal loop that runs periodic cleanup.
+
+        Runs are spaced on a fixed cadence measured from each run's start,
+        so cleanup duration does not stretch the interval. If a run overruns
+        a whole interval, the schedule resets from now rather than firing
+        back-to-back runs to catch up. Waits between runs end early when
+        stop() sets the stop event.
+        """
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         while self._running:
             try:
                 deleted_ids = await self.lifecycle_manager.cleanup_aged_media()
@@ -49,7 +59,14 @@ class CleanupScheduler:
                         self.on_cleanup(deleted_ids)
             except Exception as e:
                 await _logger.print(f"Error during media cleanup: {e}", mode="error")
-            await asyncio.sleep(self.interval_seconds)
+            next_tick += self.interval_seconds
+            now = loop.time()
+            if next_tick < now:
+                next_tick = now + self.interval_seconds
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=next_tick - now)
+            except TimeoutError:
+                pass
 
     def start(self) -> None:
         """Start the background cleanup task.
@@ -60,24 +77,23 @@ class CleanupScheduler:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._task = asyncio.create_task(self._run_cleanup_loop())
         _logger.rprint(f"Cleanup scheduler started (interval: {self.interval_seconds}s)", mode="debug")
 
     async def stop(self) -> None:
         """Stop the background cleanup task.
 
-        Gracefully stops the cleanup loop and waits for task completion.
+        Wakes the loop through the stop event, so stop() returns as soon as
+        any in-progress cleanup finishes instead of cancelling it midway.
         Safe to call multiple times - does nothing if not running.
         """
         if not self._running:
             return
         self._running = False
+        self._stop_event.set()
         if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+            await asyncio.shield(self._task)
             self._task = None
         await _logger.print("Cleanup scheduler stopped", mode="debug")
 
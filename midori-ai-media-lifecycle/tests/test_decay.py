@@ -7,10 +7,14 @@ from datetime import timedelta
 from datetime import timezone
 
 from midori_ai_media_lifecycle import DecayConfig
+from midori_ai_media_lifecycle import ExponentialDecayConfig
 from midori_ai_media_lifecycle import get_age_minutes
+from midori_ai_media_lifecycle import get_age_minutes_from_epoch
+from midori_ai_media_lifecycle import get_parsing_probabilities
 from midori_ai_media_lifecycle import get_parsing_probability
 from midori_ai_media_lifecycle import is_aged_out
 from midori_ai_media_lifecycle import should_parse
+from midori_ai_media_lifecycle import to_datetime64
 
 
 class TestDecayConfig:
@@ -34,6 +38,10 @@ class TestDecayConfig:
         config = DecayConfig()
         assert config.decay_window_minutes == 55.0
 
+    def test_uses_slots(self) -> None:
+        assert not hasattr(DecayConfig(), "__dict__")
+        assert not hasattr(ExponentialDecayConfig(), "__dict__")
+
     def test_negative_full_probability_raises(self) -> None:
         with pytest.raises(ValueError, match="must be non-negative"):
             DecayConfig(full_probability_minutes=-1.0)
@@ -47,6 +55,41 @@ class TestDecayConfig:
             DecayConfig(full_probability_minutes=50.0, zero_probability_minutes=50.0)
 
 
+class TestExponentialDecayConfig:
+    """Tests for ExponentialDecayConfig class."""
+
+    def test_half_life(self) -> None:
+        config = ExponentialDecayConfig(half_life_minutes=20.0)
+        assert config.probability_at(0.0) == 1.0
+        assert config.probability_at(-5.0) == 1.0
+        assert abs(config.probability_at(20.0) - 0.5) < 1e-12
+        assert abs(config.probability_at(40.0) - 0.25) < 1e-12
+
+    def test_aged_out_threshold(self) -> None:
+        config = ExponentialDecayConfig(half_life_minutes=20.0, aged_out_probability=0.001)
+        assert config.full_probability_minutes == 0.0
+        assert abs(config.probability_at(config.zero_probability_minutes) - 0.001) < 1e-12
+        assert is_aged_out(datetime.now(timezone.utc) - timedelta(minutes=config.zero_probability_minutes + 1), config) is True
+        assert is_aged_out(datetime.now(timezone.utc) - timedelta(minutes=60), config) is False
+
+    def test_compose_adds_rates(self) -> None:
+        composed = ExponentialDecayConfig(half_life_minutes=20.0).compose(ExponentialDecayConfig(half_life_minutes=20.0))
+        assert abs(composed.half_life_minutes - 10.0) < 1e-9
+        assert abs(composed.probability_at(30.0) - ExponentialDecayConfig(half_life_minutes=20.0).probability_at(30.0) ** 2) < 1e-12
+
+    def test_used_by_probability_functions(self) -> None:
+        config = ExponentialDecayConfig(half_life_minutes=20.0)
+        time_saved = datetime.now(timezone.utc) - timedelta(minutes=20)
+        assert 0.49 < get_parsing_probability(time_saved, config) < 0.51
+        assert 0.49 < get_parsing_probabilities(to_datetime64([time_saved]), config)[0] < 0.51
+
+    def test_invalid_values_raise(self) -> None:
+        with pytest.raises(ValueError, match="half_life_minutes"):
+            ExponentialDecayConfig(half_life_minutes=0.0)
+        with pytest.raises(ValueError, match="aged_out_probability"):
+            ExponentialDecayConfig(aged_out_probability=1.0)
+
+
 class TestGetAgeMinutes:
     """Tests for get_age_minutes function."""
 
@@ -73,6 +116,11 @@ class TestGetAgeMinutes:
         assert age >= 0.0
         assert age < 0.1
 
+    def test_from_epoch_matches_datetime(self) -> None:
+        one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        age = get_age_minutes_from_epoch(one_hour_ago.timestamp())
+        assert 59.9 < age < 60.1
+
 
 class TestGetParsingProbability:
     """Tests for get_parsing_probability function."""
@@ -127,6 +175,27 @@ class TestGetParsingProbability:
         assert 0.45 < probability < 0.55
 
 
+class TestGetParsingProbabilities:
+    """Tests for the vectorized get_parsing_probabilities function."""
+
+    def test_matches_scalar_version(self) -> None:
+        config = DecayConfig(full_probability_minutes=0.0, zero_probability_minutes=100.0)
+        now = datetime.now(timezone.utc)
+        times_saved = [now - timedelta(minutes=minutes) for minutes in (0, 25, 50, 75, 150)]
+        probabilities = get_parsing_probabilities(to_datetime64(times_saved), config)
+        expected = [get_parsing_probability(t, config) for t in times_saved]
+        assert probabilities.shape == (5,)
+        assert probabilities[-1] == 0.0
+        assert all(abs(p - e) < 0.01 for p, e in zip(probabilities, expected))
+
+    def test_converts_timezones_to_utc(self) -> None:
+        now = datetime.now(timezone.utc)
+        plus_two = timezone(timedelta(hours=2))
+        times_saved = to_datetime64([now.astimezone(plus_two) - timedelta(minutes=120), now.replace(tzinfo=None)])
+        probabilities = get_parsing_probabilities(times_saved)
+        assert probabilities.tolist() == [0.0, 1.0]
+
+
 class TestShouldParse:
     """Tests for should_parse function."""
 
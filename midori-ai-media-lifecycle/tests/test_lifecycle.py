@@ -1,6 +1,7 @@
 """Tests for lifecycle manager."""
 
 import pytest
+import asyncio
 
 from datetime import datetime
 from datetime import timedelta
@@ -8,6 +9,8 @@ from datetime import timezone
 
 from pathlib import Path
 
+from typing import AsyncIterator
+
 from midori_ai_media_lifecycle import CleanupScheduler
 from midori_ai_media_lifecycle import DecayConfig
 from midori_ai_media_lifecycle import LifecycleManager
@@ -46,6 +49,12 @@ class TestLifecycleManager:
         assert manager.storage == storage
         assert manager.config.full_probability_minutes == 35.0
         assert manager.config.zero_probability_minutes == 90.0
+        assert manager.max_concurrency == 32
+
+    def test_init_rejects_zero_concurrency(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            LifecycleManager(storage=storage, max_concurrency=0)
 
     def test_init_with_custom_config(self, tmp_path: Path) -> None:
         storage = MediaStorage(base_path=tmp_path)
@@ -68,6 +77,11 @@ class TestLifecycleManager:
         probability = manager.get_parsing_probability(media)
         assert probability == 0.0
 
+    def test_score_metadata(self, tmp_path: Path) -> None:
+        manager = LifecycleManager(storage=MediaStorage(base_path=tmp_path))
+        assert manager.score_metadata(create_test_media(age_minutes=0.0).metadata) == (1.0, False)
+        assert manager.score_metadata(create_test_media(age_minutes=120.0).metadata) == (0.0, True)
+
     def test_should_parse_fresh(self, tmp_path: Path) -> None:
         storage = MediaStorage(base_path=tmp_path)
         manager = LifecycleManager(storage=storage)
@@ -82,6 +96,30 @@ class TestLifecycleManager:
         results = [manager.should_parse(media) for _ in range(10)]
         assert not any(results)
 
+    def test_should_parse_metadata(self, tmp_path: Path) -> None:
+        manager = LifecycleManager(storage=MediaStorage(base_path=tmp_path))
+        assert all(manager.should_parse_metadata(create_test_media(age_minutes=0.0).metadata) for _ in range(10))
+        assert not any(manager.should_parse_metadata(create_test_media(age_minutes=120.0).metadata) for _ in range(10))
+
+    def test_should_parse_accumulated(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage, config=DecayConfig(full_probability_minutes=0.0, zero_probability_minutes=100.0))
+        fresh = create_test_media("fresh", age_minutes=-10.0)
+        aged = create_test_media("aged", age_minutes=120.0)
+        quarter = create_test_media("quarter", age_minutes=75.0)
+        assert all(manager.should_parse_accumulated(fresh) for _ in range(10))
+        assert not any(manager.should_parse_accumulated(aged) for _ in range(10))
+        decisions = [manager.should_parse_accumulated(quarter) for _ in range(100)]
+        assert 24 <= sum(decisions) <= 26
+
+    def test_should_parse_many(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage)
+        media_list = [create_test_media("fresh", age_minutes=0.0), create_test_media("aged", age_minutes=120.0)]
+        assert manager.get_parsing_probabilities(media_list).tolist() == [1.0, 0.0]
+        assert manager.should_parse_many(media_list) == [True, False]
+        assert manager.should_parse_many([]) == []
+
     def test_is_aged_out_fresh(self, tmp_path: Path) -> None:
         storage = MediaStorage(base_path=tmp_path)
         manager = LifecycleManager(storage=storage)
@@ -171,6 +209,96 @@ class TestLifecycleManagerAsync:
         assert set(deleted) == {"aged-1", "aged-2", "aged-3"}
         assert await storage.exists("fresh")
 
+    async def test_cleanup_aged_media_skips_full_loads(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage)
+        await storage.save(create_test_media("fresh", age_minutes=0.0))
+        await storage.save(create_test_media("aged", age_minutes=100.0))
+
+        async def fail_load(media_id: str) -> MediaObject:
+            raise AssertionError(f"cleanup should not load {media_id}")
+
+        storage.load = fail_load
+        assert await manager.cleanup_aged_media() == ["aged"]
+
+    async def test_cleanup_aged_media_with_id_decoder(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        now = datetime.now(timezone.utc)
+
+        def id_to_time_saved(media_id: str) -> datetime:
+            if not media_id.startswith("ts-"):
+                raise ValueError(media_id)
+            return now - timedelta(minutes=float(media_id[3:]))
+
+        manager = LifecycleManager(storage=storage, id_to_time_saved=id_to_time_saved)
+        await storage.save(create_test_media("ts-10", age_minutes=500.0))
+        await storage.save(create_test_media("ts-100", age_minutes=0.0))
+        await storage.save(create_test_media("legacy", age_minutes=100.0))
+        metadata_reads: list[str] = []
+        original_load_metadata = storage.load_metadata
+
+        async def tracking_load_metadata(media_id: str) -> MediaMetadata:
+            metadata_reads.append(media_id)
+            return await original_load_metadata(media_id)
+
+        storage.load_metadata = tracking_load_metadata
+        assert manager.is_aged_out_id("ts-100") is True
+        assert manager.is_aged_out_id("ts-10") is False
+        deleted = await manager.cleanup_aged_media()
+        assert set(deleted) == {"ts-100", "legacy"}
+        assert metadata_reads == ["legacy"]
+        assert await storage.exists("ts-10")
+
+    async def test_is_aged_out_id_requires_decoder(self, tmp_path: Path) -> None:
+        manager = LifecycleManager(storage=MediaStorage(base_path=tmp_path))
+        with pytest.raises(ValueError, match="id_to_time_saved"):
+            manager.is_aged_out_id("any")
+
+    async def test_cleanup_aged_media_bounds_concurrency(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage, max_concurrency=2)
+        for i in range(6):
+            await storage.save(create_test_media(f"aged-{i}", age_minutes=100.0))
+        in_flight = 0
+        peak = 0
+        original_delete = storage.delete
+
+        async def tracking_delete(media_id: str) -> bool:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            try:
+                return await original_delete(media_id)
+            finally:
+                in_flight -= 1
+
+        storage.delete = tracking_delete
+        deleted = await manager.cleanup_aged_media()
+        assert len(deleted) == 6
+        assert peak == 2
+
+    async def test_cleanup_aged_media_deletes_while_scanning(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage)
+        events: list[str] = []
+
+        async def streaming_scan(cutoff: datetime) -> AsyncIterator[str]:
+            for media_id in ("aged-1", "aged-2"):
+                events.append(f"scan {media_id}")
+                yield media_id
+                await asyncio.sleep(0.01)
+            events.append("scan done")
+
+        async def recording_delete(media_id: str) -> bool:
+            events.append(f"delete {media_id}")
+            return True
+
+        storage.iter_aged_out = streaming_scan
+        storage.delete = recording_delete
+        assert await manager.cleanup_aged_media() == ["aged-1", "aged-2"]
+        assert events.index("delete aged-1") < events.index("scan done")
+
     async def test_get_media_status(self, tmp_path: Path) -> None:
         storage = MediaStorage(base_path=tmp_path)
         manager = LifecycleManager(storage=storage)
@@ -184,6 +312,19 @@ class TestLifecycleManagerAsync:
         assert status["time_loaded"] is None
         assert status["time_parsed"] is None
 
+    async def test_get_media_status_skips_payload(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage)
+        await storage.save(create_test_media("aged", age_minutes=100.0))
+
+        async def fail_load(media_id: str) -> MediaObject:
+            raise AssertionError(f"status should not load {media_id}")
+
+        storage.load = fail_load
+        status = await manager.get_media_status("aged")
+        assert status["probability"] == 0.0
+        assert status["aged_out"] is True
+
     async def test_get_media_status_not_found(self, tmp_path: Path) -> None:
         storage = MediaStorage(base_path=tmp_path)
         manager = LifecycleManager(storage=storage)
@@ -249,3 +390,49 @@ class TestCleanupSchedulerAsync:
         await scheduler.stop()
         await scheduler.stop()
         assert scheduler.is_running is False
+
+    async def test_stop_wakes_sleep_and_lets_cleanup_finish(self, tmp_path: Path) -> None:
+        manager = create_lifecycle_manager(base_path=tmp_path)
+        finished: list[bool] = []
+
+        async def slow_cleanup() -> list[str]:
+            await asyncio.sleep(0.05)
+            finished.append(True)
+            return []
+
+        manager.cleanup_aged_media = slow_cleanup
+        scheduler = CleanupScheduler(lifecycle_manager=manager, interval_seconds=3600.0)
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(scheduler.stop(), timeout=1.0)
+        assert finished == [True]
+        assert scheduler.is_running is False
+
+    async def test_interval_not_stretched_by_cleanup_duration(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        manager = create_lifecycle_manager(base_path=tmp_path)
+        scheduler = CleanupScheduler(lifecycle_manager=manager, interval_seconds=0.1)
+        clock = [1000.0]
+        durations = iter([0.05, 0.05, 0.25, 0.05])
+        starts: list[float] = []
+        deadlines: list[float] = []
+
+        async def timed_cleanup() -> list[str]:
+            starts.append(clock[0])
+            clock[0] += next(durations)
+            return []
+
+        async def fake_wait_for(awaitable, timeout: float) -> None:
+            awaitable.close()
+            deadlines.append(clock[0] + timeout)
+            clock[0] += timeout
+            if len(deadlines) == 4:
+                scheduler._running = False
+            raise TimeoutError
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: clock[0])
+        monkeypatch.setattr(asyncio, "wait_for", fake_wait_for)
+        manager.cleanup_aged_media = timed_cleanup
+        scheduler._running = True
+        await scheduler._run_cleanup_loop()
+        assert starts == pytest.approx([1000.0, 1000.1, 1000.2, 1000.55])
+        assert deadlines == pytest.approx([1000.1, 1000.2, 1000.55, 1000.65])
@@ -34,11 +34,16 @@ class MediaRequestHandler(MediaRequestProtocol):
         """Process a media request following the validation flow.
 
         Flow:
-        1. Load media from storage
-        2. Type validation: If requested_type != media.media_type, return DENIED
-        3. Decay check: If is_aged_out(), return EXPIRED
-        4. Probability check: If should_parse() returns False, return DENIED with probability
-        5. Success: Decrypt content, update parsed timestamp, return COMPLETED with content
+        1. Look up the media type and load only its metadata sidecar
+        2. Type validation: If requested_type != media type, return DENIED
+        3. Decay check: If aged out, return EXPIRED
+        4. Probability check: If LifecycleManager.should_parse_metadata declines, return DENIED with probability
+        5. Success: Load and decrypt content, update parsed timestamp, return COMPLETED with content
+
+        Rejected requests never load or decrypt the media payload. The
+        decision uses LifecycleManager.score_metadata and
+        should_parse_metadata, so subclasses customise those rather than the
+        MediaObject methods.
 
         Args:
             request: The MediaRequest to process.
@@ -47,24 +52,31 @@ class MediaRequestHandler(MediaRequestProtocol):
             MediaResponse with appropriate status and content.
         """
         request_id = str(uuid.uuid4())
+        storage = self.lifecycle_manager.storage
         try:
-            media = await self.lifecycle_manager.storage.load(request.media_id)
+            media_type, metadata = await storage.load_metadata_with_type(request.media_id)
         except FileNotFoundError:
             response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.DENIED, denial_reason="Media not found")
             return response
 
-        probability = self.lifecycle_manager.get_parsing_probability(media)
+        probability, aged_out = self.lifecycle_manager.score_metadata(metadata)
+
+        if request.requested_type != media_type:
+            response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.DENIED, denial_reason=f"Type mismatch: requested {request.requested_type.value}, found {media_type.value}", media_type=media_type, parsing_probability=probability)
+            return response
 
-        if request.requested_type != media.media_type:
-            response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.DENIED, denial_reason=f"Type mismatch: requested {request.requested_type.value}, found {media.media_type.value}", media_type=media.media_type, parsing_probability=probability)
+        if aged_out:
+            response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.EXPIRED, denial_reason="Media has aged out", media_type=media_type, parsing_probability=probability)
             return response
 
-        if self.lifecycle_manager.is_aged_out(media):
-            response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.EXPIRED, denial_reason="Media has aged out", media_type=media.media_type, parsing_probability=probability)
+        if not self.lifecycle_manager.should_parse_metadata(metadata):
+            response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.DENIED, denial_reason=f"Parsing probability check failed (probability: {probability:.1%})", media_type=media_type, parsing_probability=probability)
             return response
 
-        if not self.lifecycle_manager.should_parse(media):
-            response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.DENIED, denial_reason=f"Parsing probability check failed (probability: {probability:.1%})", media_type=media.media_type, parsing_probability=probability)
+        try:
+            media = await storage.load(request.media_id)
+        except FileNotFoundError:
+            response = MediaResponse(request_id=request_id, media_id=request.media_id, status=RequestStatus.DENIED, denial_reason="Media not found", media_type=media_type, parsing_probability=probability)
             return response
 
         decrypted_content = MediaCrypto.decrypt(media.encrypted_content, media.encryption_key, media.content_integrity_hash)
@@ -119,9 +131,8 @@ class MediaRequestHandler(MediaRequestProtocol):
         2. Get all audio IDs for transcription batch
         3. Filter media by type for their parsing systems
 
-        NOTE: This method loads and decrypts each media file to check its type.
-        For large collections, this may be slow. Consider caching results if
-        used frequently.
+        Storage keeps each media type in its own folder, so this only lists
+        that folder; no media file is read or decrypted.
 
         Args:
             media_type: The type of media to list
@@ -93,6 +93,35 @@ class TestMediaRequestHandlerAsync:
         assert "aged out" in response.denial_reason
         assert response.parsing_probability == 0.0
 
+    async def test_rejected_request_does_not_load_payload(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage)
+        handler = MediaRequestHandler(lifecycle_manager=manager)
+        await storage.save(create_test_media("expired-test", MediaType.PHOTO, age_minutes=120.0))
+
+        async def fail_load(media_id: str) -> MediaObject:
+            raise AssertionError(f"rejected request should not load {media_id}")
+
+        storage.load = fail_load
+        expired = await handler.request_media(MediaRequest(media_id="expired-test", requested_type=MediaType.PHOTO, requester_id="agent-001"))
+        mismatch = await handler.request_media(MediaRequest(media_id="expired-test", requested_type=MediaType.VIDEO, requester_id="agent-001"))
+        assert expired.status == RequestStatus.EXPIRED
+        assert mismatch.status == RequestStatus.DENIED
+
+    async def test_request_media_uses_manager_parse_decision(self, tmp_path: Path) -> None:
+        class DecliningManager(LifecycleManager):
+            def should_parse_metadata(self, metadata: MediaMetadata) -> bool:
+                return False
+
+        storage = MediaStorage(base_path=tmp_path)
+        handler = MediaRequestHandler(lifecycle_manager=DecliningManager(storage=storage))
+        await storage.save(create_test_media("declined"))
+        request = MediaRequest(media_id="declined", requested_type=MediaType.PHOTO, requester_id="agent-001")
+        response = await handler.request_media(request)
+        assert response.status == RequestStatus.DENIED
+        assert response.parsing_probability == 1.0
+        assert response.decrypted_content is None
+
     async def test_request_media_updates_parsed_time(self, tmp_path: Path) -> None:
         storage = MediaStorage(base_path=tmp_path)
         manager = LifecycleManager(storage=storage)
@@ -179,6 +208,19 @@ class TestMediaRequestHandlerAsync:
         ids = await handler.list_ids_by_type(MediaType.VIDEO, "agent-001")
         assert ids == []
 
+    async def test_list_ids_by_type_does_not_load_media(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        manager = LifecycleManager(storage=storage)
+        handler = MediaRequestHandler(lifecycle_manager=manager)
+        await storage.save(create_test_media("photo-1", MediaType.PHOTO))
+
+        async def fail_load(media_id: str) -> MediaObject:
+            raise AssertionError(f"listing should not load {media_id}")
+
+        storage.load = fail_load
+        storage.load_metadata = fail_load
+        assert await handler.list_ids_by_type(MediaType.PHOTO, "agent-001") == ["photo-1"]
+
     async def test_list_ids_by_type_batch_workflow(self, tmp_path: Path) -> None:
         """Test the typical batch workflow: list IDs, then process each."""
         storage = MediaStorage(base_path=tmp_path)
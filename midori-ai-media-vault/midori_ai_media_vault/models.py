@@ -32,6 +32,17 @@ class MediaMetadata(BaseModel):
     time_parsed: Optional[datetime] = None
     content_hash: str = Field(..., description="SHA-256 hash of raw content for integrity")
 
+    @property
+    def time_saved_epoch(self) -> float:
+        """Return time_saved as Unix epoch seconds.
+
+        Naive time_saved values are treated as UTC.
+        """
+        time_saved = self.time_saved
+        if time_saved.tzinfo is None:
+            time_saved = time_saved.replace(tzinfo=timezone.utc)
+        return time_saved.timestamp()
+
 
 class MediaObject(BaseModel):
     """Core media object with encrypted content and per-file random key."""
@@ -1,16 +1,38 @@
 """Async disk storage with Pydantic JSON serialization and system-stats encryption."""
 
+import os
 import asyncio
 
+from datetime import datetime
+from datetime import timezone
+
 from pathlib import Path
 
+from typing import Iterator
+from typing import AsyncIterator
+
 from cryptography.fernet import InvalidToken
 
+from .models import MediaMetadata
 from .models import MediaObject
 from .models import MediaType
 from .system_crypto import SystemCrypto
 
 
+_SCAN_BATCH_SIZE = 512
+
+
+def _next_media_ids(entries: Iterator[os.DirEntry[str]], limit: int) -> list[str]:
+    """Pull up to limit media IDs from a directory scan, skipping non-media files."""
+    media_ids: list[str] = []
+    for entry in entries:
+        if entry.name.endswith(".media"):
+            media_ids.append(entry.name[:-6])
+            if len(media_ids) >= limit:
+                break
+    return media_ids
+
+
 class StorageDecryptionError(Exception):
     """Raised when storage decryption fails due to system mismatch or corruption."""
 
@@ -29,6 +51,8 @@ class MediaStorage:
 
     Files are organized into type-specific subfolders (photo/, video/, audio/, text/)
     which enables fast list_by_type() operations without loading/decrypting each file.
+    Each media file has a small encrypted metadata sidecar next to it, so timestamp
+    scans such as list_aged_out() never decrypt the media payload.
     """
 
     def __init__(self, base_path: Path, system_key_iterations: int = 12) -> None:
@@ -57,6 +81,49 @@ class MediaStorage:
         """Get the file path for a media ID within its type folder."""
         return self._get_type_folder(media_type) / f"{media_id}.media"
 
+    def _get_meta_path(self, media_id: str, media_type: MediaType) -> Path:
+        """Get the metadata sidecar path for a media ID within its type folder."""
+        return self._get_type_folder(media_type) / f"{media_id}.meta"
+
+    def _decrypt_json(self, media_id: str, encrypted_data: bytes) -> str:
+        """Decrypt a stored file with the system key and decode it as JSON text."""
+        try:
+            return self.system_crypto.decrypt(encrypted_data).decode()
+        except InvalidToken as e:
+            raise StorageDecryptionError(f"Failed to decrypt media '{media_id}': file may be from a different system or corrupted") from e
+        except UnicodeDecodeError as e:
+            raise StorageDecryptionError(f"Failed to decode media '{media_id}': decrypted data is not valid UTF-8") from e
+
+    def _read_metadata(self, media_id: str, media_type: MediaType) -> MediaMetadata:
+        """Read metadata from the sidecar, falling back to the full media file if it has none."""
+        try:
+            encrypted_meta = self._get_meta_path(media_id, media_type).read_bytes()
+        except FileNotFoundError:
+            encrypted_data = self._get_media_path(media_id, media_type).read_bytes()
+            return MediaObject.model_validate_json(self._decrypt_json(media_id, encrypted_data)).metadata
+        return MediaMetadata.model_validate_json(self._decrypt_json(media_id, encrypted_meta))
+
+    def _filter_aged_out(self, media_ids: list[str], media_type: MediaType, cutoff: datetime) -> list[str]:
+        """Return the IDs whose metadata time_saved is at or before an aware cutoff."""
+        aged_ids: list[str] = []
+        for media_id in media_ids:
+            try:
+                time_saved = self._read_metadata(media_id, media_type).time_saved
+            except FileNotFoundError:
+                continue
+            if time_saved.tzinfo is None:
+                time_saved = time_saved.replace(tzinfo=timezone.utc)
+            if time_saved <= cutoff:
+                aged_ids.append(media_id)
+        return aged_ids
+
+    async def _scan_type_folder(self, media_type: MediaType) -> AsyncIterator[list[str]]:
+        """Yield media IDs in a type folder in batches, scanning in a worker thread."""
+        entries = await asyncio.to_thread(os.scandir, self._get_type_folder(media_type))
+        with entries:
+            while media_ids := await asyncio.to_thread(_next_media_ids, entries, _SCAN_BATCH_SIZE):
+                yield media_ids
+
     def _find_media_path(self, media_id: str) -> tuple[Path, MediaType] | None:
         """Find media file across all type folders, returns path and type if found."""
         for media_type in MediaType:
@@ -71,6 +138,7 @@ class MediaStorage:
         The MediaObject (which already contains encrypted content) is serialized
         to JSON and then encrypted again using system-stats-derived key.
         Files are stored in type-specific subfolders for fast list_by_type().
+        The metadata is also written, encrypted, to a small .meta sidecar.
 
         Args:
             media: The MediaObject to persist
@@ -79,9 +147,16 @@ class MediaStorage:
             Path to the saved file
         """
         file_path = self._get_media_path(media.id, media.media_type)
+        meta_path = self._get_meta_path(media.id, media.media_type)
         json_data = media.model_dump_json()
         encrypted_json = self.system_crypto.encrypt(json_data.encode())
-        await asyncio.to_thread(file_path.write_bytes, encrypted_json)
+        encrypted_meta = self.system_crypto.encrypt(media.metadata.model_dump_json().encode())
+
+        def _write_files() -> None:
+            file_path.write_bytes(encrypted_json)
+            meta_path.write_bytes(encrypted_meta)
+
+        await asyncio.to_thread(_write_files)
         return file_path
 
     async def load(self, media_id: str) -> MediaObject:
@@ -105,13 +180,68 @@ class MediaStorage:
             raise FileNotFoundError(f"Media '{media_id}' not found in any type folder")
         file_path, _ = result
         encrypted_data = await asyncio.to_thread(file_path.read_bytes)
-        try:
-            json_data = self.system_crypto.decrypt(encrypted_data).decode()
-        except InvalidToken as e:
-            raise StorageDecryptionError(f"Failed to decrypt media '{media_id}': file may be from a different system or corrupted") from e
-        except UnicodeDecodeError as e:
-            raise StorageDecryptionError(f"Failed to decode media '{media_id}': decrypted data is not valid UTF-8") from e
-        return MediaObject.model_validate_json(json_data)
+        return MediaObject.model_validate_json(self._decrypt_json(media_id, encrypted_data))
+
+    async def load_metadata(self, media_id: str) -> MediaMetadata:
+        """Load only the metadata of a media object.
+
+        Reads the small metadata sidecar instead of the full media file.
+        Files saved before sidecars existed fall back to a full decrypt.
+
+        Args:
+            media_id: The unique identifier of the media
+
+        Returns:
+            The media object's MediaMetadata
+
+        Raises:
+            FileNotFoundError: If the media file doesn't exist
+            StorageDecryptionError: If decryption fails (wrong system or corrupted)
+        """
+        _, metadata = await self.load_metadata_with_type(media_id)
+        return metadata
+
+    async def load_metadata_with_type(self, media_id: str) -> tuple[MediaType, MediaMetadata]:
+        """Load the type and metadata of a media object with one folder search.
+
+        Equivalent to get_media_type() followed by load_metadata(), but the
+        type folders are only searched once.
+
+        Args:
+            media_id: The unique identifier of the media
+
+        Returns:
+            Tuple of (MediaType, MediaMetadata)
+
+        Raises:
+            FileNotFoundError: If the media file doesn't exist
+            StorageDecryptionError: If decryption fails (wrong system or corrupted)
+        """
+        result = await asyncio.to_thread(self._find_media_path, media_id)
+        if result is None:
+            raise FileNotFoundError(f"Media '{media_id}' not found in any type folder")
+        _, media_type = result
+        return media_type, await asyncio.to_thread(self._read_metadata, media_id, media_type)
+
+    async def get_media_type(self, media_id: str) -> MediaType:
+        """Get the type of a stored media object from its type folder.
+
+        No file is read, so this is a cheap check before load().
+
+        Args:
+            media_id: The unique identifier of the media
+
+        Returns:
+            The MediaType of the stored media
+
+        Raises:
+            FileNotFoundError: If the media file doesn't exist
+        """
+        result = await asyncio.to_thread(self._find_media_path, media_id)
+        if result is None:
+            raise FileNotFoundError(f"Media '{media_id}' not found in any type folder")
+        _, media_type = result
+        return media_type
 
     async def delete(self, media_id: str) -> bool:
         """Delete a media object from disk.
@@ -127,8 +257,14 @@ class MediaStorage:
         result = await asyncio.to_thread(self._find_media_path, media_id)
         if result is None:
             return False
-        file_path, _ = result
-        await asyncio.to_thread(file_path.unlink)
+        file_path, media_type = result
+        meta_path = self._get_meta_path(media_id, media_type)
+
+        def _unlink_files() -> None:
+            file_path.unlink()
+            meta_path.unlink(missing_ok=True)
+
+        await asyncio.to_thread(_unlink_files)
         return True
 
     async def exists(self, media_id: str) -> bool:
@@ -162,6 +298,62 @@ class MediaStorage:
 
         return await asyncio.to_thread(_list_files)
 
+    async def list_aged_out(self, cutoff: datetime) -> list[str]:
+        """List IDs of all media saved at or before a cutoff time.
+
+        Reads each file's metadata sidecar rather than loading the full
+        media object, so the scan never decrypts media payloads. Naive
+        datetimes (cutoff or stored time_saved) are treated as UTC.
+
+        Args:
+            cutoff: Media with time_saved at or before this time is listed
+
+        Returns:
+            List of media IDs saved at or before the cutoff
+
+        Raises:
+            StorageDecryptionError: If a metadata file cannot be decrypted
+        """
+        return [media_id async for media_id in self.iter_aged_out(cutoff)]
+
+    async def iter_all(self) -> AsyncIterator[str]:
+        """Stream all media IDs in storage.
+
+        Like list_all, but scans the type folders incrementally in a worker
+        thread and yields IDs as they are found, so memory stays constant
+        and consumers can start work before the scan finishes.
+
+        Yields:
+            Media IDs
+        """
+        for media_type in MediaType:
+            async for media_ids in self._scan_type_folder(media_type):
+                for media_id in media_ids:
+                    yield media_id
+
+    async def iter_aged_out(self, cutoff: datetime) -> AsyncIterator[str]:
+        """Stream IDs of media saved at or before a cutoff time.
+
+        Streaming form of list_aged_out: sidecars are read batch by batch
+        in a worker thread and matching IDs are yielded as each batch
+        completes. Naive datetimes are treated as UTC.
+
+        Args:
+            cutoff: Media with time_saved at or before this time is yielded
+
+        Yields:
+            Media IDs saved at or before the cutoff
+
+        Raises:
+            StorageDecryptionError: If a metadata file cannot be decrypted
+        """
+        if cutoff.tzinfo is None:
+            cutoff = cutoff.replace(tzinfo=timezone.utc)
+        for media_type in MediaType:
+            async for media_ids in self._scan_type_folder(media_type):
+                for media_id in await asyncio.to_thread(self._filter_aged_out, media_ids, media_type, cutoff):
+                    yield media_id
+
     async def list_by_type(self, media_type: MediaType) -> list[str]:
         """List all media IDs of a specific type.
 
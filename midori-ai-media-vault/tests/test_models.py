@@ -39,6 +39,24 @@ class TestMediaMetadata:
         metadata = MediaMetadata(content_hash="abc123")
         assert metadata.time_saved.tzinfo is not None
 
+    def test_time_saved_epoch(self) -> None:
+        saved = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        metadata = MediaMetadata(content_hash="abc123", time_saved=saved)
+        assert metadata.time_saved_epoch == saved.timestamp()
+        naive = MediaMetadata(content_hash="abc123", time_saved=saved.replace(tzinfo=None))
+        assert naive.time_saved_epoch == saved.timestamp()
+        assert "time_saved_epoch" not in metadata.model_dump()
+
+    def test_time_saved_epoch_follows_time_saved(self) -> None:
+        saved = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        later = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        metadata = MediaMetadata(content_hash="abc123", time_saved=saved)
+        assert metadata.time_saved_epoch == saved.timestamp()
+        copy = metadata.model_copy(update={"time_saved": later})
+        assert copy.time_saved_epoch == later.timestamp()
+        metadata.time_saved = later
+        assert metadata.time_saved_epoch == later.timestamp()
+
     def test_optional_times(self) -> None:
         now = datetime.now(timezone.utc)
         metadata = MediaMetadata(content_hash="abc123", time_loaded=now, time_parsed=now)
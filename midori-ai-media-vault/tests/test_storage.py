@@ -2,6 +2,10 @@
 
 import pytest
 
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
 from pathlib import Path
 
 from midori_ai_media_vault import MediaCrypto
@@ -11,11 +15,11 @@ from midori_ai_media_vault import MediaStorage
 from midori_ai_media_vault import MediaType
 
 
-def create_test_media(media_id: str = "test-media", media_type: MediaType = MediaType.PHOTO) -> MediaObject:
-    """Create a test MediaObject."""
+def create_test_media(media_id: str = "test-media", media_type: MediaType = MediaType.PHOTO, age_minutes: float = 0.0) -> MediaObject:
+    """Create a test MediaObject with optional age."""
     content = b"test content"
     encrypted, key, hash_str = MediaCrypto.encrypt(content)
-    metadata = MediaMetadata(content_hash=hash_str)
+    metadata = MediaMetadata(content_hash=hash_str, time_saved=datetime.now(timezone.utc) - timedelta(minutes=age_minutes))
     return MediaObject(
         id=media_id,
         media_type=media_type,
@@ -186,3 +190,62 @@ class TestMediaStorageAsync:
         for media_type in MediaType:
             ids = await storage.list_by_type(media_type)
             assert ids == [f"{media_type.value}-test"]
+
+    async def test_save_writes_metadata_sidecar(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        await storage.save(create_test_media("sidecar-test"))
+        assert (tmp_path / "photo" / "sidecar-test.meta").exists()
+        assert await storage.list_all() == ["sidecar-test"]
+        await storage.delete("sidecar-test")
+        assert not (tmp_path / "photo" / "sidecar-test.meta").exists()
+
+    async def test_load_metadata(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        media = create_test_media("metadata-test", MediaType.AUDIO)
+        await storage.save(media)
+        metadata = await storage.load_metadata("metadata-test")
+        assert metadata == media.metadata
+        with pytest.raises(FileNotFoundError):
+            await storage.load_metadata("nonexistent")
+
+    async def test_load_metadata_with_type(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        media = create_test_media("typed-metadata", MediaType.VIDEO)
+        await storage.save(media)
+        assert await storage.load_metadata_with_type("typed-metadata") == (MediaType.VIDEO, media.metadata)
+        with pytest.raises(FileNotFoundError):
+            await storage.load_metadata_with_type("nonexistent")
+
+    async def test_get_media_type(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        await storage.save(create_test_media("type-test", MediaType.VIDEO))
+        assert await storage.get_media_type("type-test") == MediaType.VIDEO
+        with pytest.raises(FileNotFoundError):
+            await storage.get_media_type("nonexistent")
+
+    async def test_list_aged_out(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        await storage.save(create_test_media("fresh", MediaType.PHOTO))
+        await storage.save(create_test_media("aged-photo", MediaType.PHOTO, age_minutes=120.0))
+        await storage.save(create_test_media("aged-video", MediaType.VIDEO, age_minutes=95.0))
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=90)
+        assert set(await storage.list_aged_out(cutoff)) == {"aged-photo", "aged-video"}
+        assert set(await storage.list_aged_out(cutoff.replace(tzinfo=None))) == {"aged-photo", "aged-video"}
+
+    async def test_list_aged_out_without_sidecar(self, tmp_path: Path) -> None:
+        storage = MediaStorage(base_path=tmp_path)
+        await storage.save(create_test_media("legacy", age_minutes=120.0))
+        (tmp_path / "photo" / "legacy.meta").unlink()
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=90)
+        assert await storage.list_aged_out(cutoff) == ["legacy"]
+        assert (await storage.load_metadata("legacy")).content_hash
+
+    async def test_iter_all_and_iter_aged_out(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("midori_ai_media_vault.storage._SCAN_BATCH_SIZE", 2)
+        storage = MediaStorage(base_path=tmp_path)
+        for i in range(5):
+            await storage.save(create_test_media(f"photo-{i}", MediaType.PHOTO, age_minutes=120.0 if i % 2 else 0.0))
+        await storage.save(create_test_media("text-0", MediaType.TEXT, age_minutes=120.0))
+        assert {media_id async for media_id in storage.iter_all()} == set(await storage.list_all())
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=90)
+        assert {media_id async for media_id in storage.iter_aged_out(cutoff)} == {"photo-1", "photo-3", "text-0"}